@@ -0,0 +1,114 @@
+"""
+AnimationClock Module
+One shared timer driving every animated widget.
+
+Widgets subscribe while they animate and are advanced together on each
+tick, instead of each owning a timer. Subscribers that can't be seen,
+because they are hidden, scrolled out of view or their window is
+minimised, are skipped, and once none of them can be seen the timer
+stops until one of them is shown or repainted again.
+"""
+
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QWidget
+
+
+class AnimationClock(QObject):
+    """
+    Shared animation timer.
+
+    Use :meth:`instance` to get the shared clock. Subscribers implement
+    ``advance_animation()``, which is called once per tick, or pass
+    their own callback, e.g. a delegate animating items of a view.
+
+    Attributes:
+        INTERVAL_MS (int): Time between ticks
+    """
+
+    INTERVAL_MS = 100
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "AnimationClock":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self) -> None:
+        super().__init__()
+        # widget -> (destroyed connection, tick callback)
+        self._subscribers: Dict[QWidget, Tuple[object, Callable[[], None]]] = {}
+        self._windows: Set[QWidget] = set()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def running(self) -> bool:
+        """Whether the timer is currently ticking."""
+        return self._timer.isActive()
+
+    def subscribe(self, widget: QWidget,
+                  advance: Optional[Callable[[], None]] = None) -> None:
+        """
+        Advance ``widget`` on every tick until it unsubscribes.
+
+        Args:
+            widget (QWidget): Widget whose visibility decides whether to tick
+            advance (Optional[Callable]): Called on every tick instead of
+                ``widget.advance_animation``
+        """
+        if widget in self._subscribers:
+            return
+        connection = widget.destroyed.connect(lambda _=None, w=widget: self._forget(w))
+        self._subscribers[widget] = (connection, advance or widget.advance_animation)
+        window = widget.window()
+        if window not in self._windows:
+            # Restoring or re-showing the window wakes the clock up
+            self._windows.add(window)
+            window.installEventFilter(self)
+            window.destroyed.connect(lambda _=None, w=window: self._windows.discard(w))
+        self.wake()
+
+    def unsubscribe(self, widget: QWidget) -> None:
+        """Stop advancing ``widget``."""
+        subscriber = self._subscribers.get(widget)
+        if subscriber is not None:
+            widget.destroyed.disconnect(subscriber[0])
+            self._forget(widget)
+
+    def _forget(self, widget: QWidget) -> None:
+        """Drop a subscriber, stopping the timer when it was the last one."""
+        self._subscribers.pop(widget, None)
+        if not self._subscribers:
+            self._timer.stop()
+
+    def wake(self) -> None:
+        """Restart the timer if a subscriber may be visible again."""
+        if self._subscribers and not self._timer.isActive():
+            self._timer.start()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in (QEvent.Type.Show, QEvent.Type.WindowStateChange,
+                            QEvent.Type.WindowActivate):
+            self.wake()
+        return False
+
+    @staticmethod
+    def _is_drawable(widget: QWidget) -> bool:
+        """Check whether any part of a widget is on screen."""
+        return (widget.isVisible() and not widget.window().isMinimized()
+                and not widget.visibleRegion().isEmpty())
+
+    def _tick(self) -> None:
+        drawable = [advance for widget, (_, advance) in self._subscribers.items()
+                    if self._is_drawable(widget)]
+        if not drawable:
+            # Nothing to see; a show or paint of a subscriber wakes us up
+            self._timer.stop()
+            return
+        for advance in drawable:
+            advance()
@@ -11,12 +11,22 @@ Features:
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QPushButton)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtWidgets import QStyle, QStyleOption
+from components.cards.animation_clock import AnimationClock
 from utils.themes.colors import ThemeColors
 from utils.themes.fonts import Fonts
 import random
 
+
+def random_pastel_color() -> QColor:
+    """Generate a random pastel color"""
+    color = QColor()
+    color.setHsvF(random.random(), random.uniform(0.5, 0.7), random.uniform(0.8, 1.0))
+    return color
+
+
 class PackageCard(QWidget):
     """
     A card component for displaying package information.
@@ -32,10 +42,8 @@ class PackageCard(QWidget):
         self.package = package
         self.show_install_button = show_install_button
         self.show_version = show_version
-        self.color_timer = QTimer(self)
-        self.color_timer.timeout.connect(self.update_random_colors)
-        self.color_timer.setInterval(100)  # Update every 100ms
         self.is_animating = False
+        self.animation_colors = None  # (background, border) while animating
         self.setup_ui()
     
     def setup_ui(self):
@@ -166,53 +174,49 @@ class PackageCard(QWidget):
                 self.stop_color_animation()
     
     def start_color_animation(self):
-        """Start the color animation"""
+        """Start the color animation on the shared animation clock"""
         self.is_animating = True
-        self.color_timer.start()
+        self.update_random_colors()
+        AnimationClock.instance().subscribe(self)
     
     def stop_color_animation(self):
         """Stop the color animation and reset colors"""
         self.is_animating = False
-        self.color_timer.stop()
+        AnimationClock.instance().unsubscribe(self)
         self.reset_colors()
     
     def reset_colors(self):
         """Reset to default colors"""
-        self.setStyleSheet(f"""
-            PackageCard {{
-                background: {ThemeColors.MEDIUM};
-                border: 3px solid {ThemeColors.LIGHT};
-                border-radius: 10px;
-                margin: 5px;
-            }}
-            PackageCard:hover {{
-                border-color: {ThemeColors.HIGHLIGHT};
-                background: {ThemeColors.DARK};
-            }}
-        """)
+        self.animation_colors = None
+        self.update()
     
     def generate_random_color(self):
         """Generate a random pastel color"""
-        hue = random.random()
-        saturation = random.uniform(0.5, 0.7)
-        value = random.uniform(0.8, 1.0)
-        
-        # Convert HSV to RGB
-        c = QColor()
-        c.setHsvF(hue, saturation, value)
-        return c.name()
+        return random_pastel_color()
+    
+    def advance_animation(self):
+        """Called by the animation clock on every tick"""
+        self.update_random_colors()
     
     def update_random_colors(self):
         """Update card with new random colors"""
-        bg_color = self.generate_random_color()
-        border_color = self.generate_random_color()
+        # Only repaints; the stylesheet is left alone
+        self.animation_colors = (self.generate_random_color(), self.generate_random_color())
+        self.update()
+    
+    def paintEvent(self, event):
+        """Paint the animated colors, or the stylesheet look when idle"""
+        painter = QPainter(self)
+        if self.animation_colors is None:
+            option = QStyleOption()
+            option.initFrom(self)
+            self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+            return
         
-        self.setStyleSheet(f"""
-            PackageCard {{
-                background: {bg_color};
-                border: 4px solid {border_color};
-                border-radius: 10px;
-                margin: 5px;
-                transition: all 0.3s;
-            }}
-        """)
+        # Painting means a card scrolled back into view; keep the clock running
+        AnimationClock.instance().wake()
+        background, border = self.animation_colors
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(border, 4))
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(7, 7, -7, -7), 10, 10)
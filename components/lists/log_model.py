@@ -0,0 +1,101 @@
+"""
+LogModel Module
+Bounded list model for streaming command output.
+
+Builds can print tens of megabytes. The model keeps only the newest
+``max_lines`` lines in a ring buffer, so memory stays bounded however
+long the output gets, and a list view over it only lays out the rows
+that are visible.
+
+Lines are collected as they arrive and added to the model in one batch
+per timer tick, so a chatty build costs one insert signal per tick
+instead of one per line.
+"""
+
+from collections import deque
+from typing import Any, Deque, List
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+
+
+class LogModel(QAbstractListModel):
+    """
+    List model over the tail of a log.
+
+    Attributes:
+        MAX_LINES (int): Default number of lines kept
+        FLUSH_INTERVAL_MS (int): Delay between batched appends
+        dropped (int): Lines that fell out of the buffer so far
+    """
+
+    MAX_LINES = 5000
+    FLUSH_INTERVAL_MS = 100
+
+    def __init__(self, max_lines: int = MAX_LINES, parent=None) -> None:
+        super().__init__(parent)
+        self.max_lines = max_lines
+        self.dropped = 0
+        self._lines: Deque[str] = deque()
+        self._pending: List[str] = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append_line(self, line: str) -> None:
+        """Queue a line for the next batch."""
+        self._pending.append(line)
+        if len(self._pending) > self.max_lines:
+            # Only the newest lines of a batch can end up in the buffer
+            overflow = len(self._pending) - self.max_lines
+            del self._pending[:overflow]
+            self.dropped += overflow
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Add the queued lines, dropping the oldest ones past ``max_lines``."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        overflow = len(self._lines) + len(pending) - self.max_lines
+        if overflow >= len(self._lines) and self._lines:
+            # The whole buffer is replaced
+            self.beginResetModel()
+            self.dropped += len(self._lines)
+            self._lines = deque(pending)
+            self.endResetModel()
+            return
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._lines.popleft()
+            self.dropped += overflow
+            self.endRemoveRows()
+
+        first = len(self._lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(pending) - 1)
+        self._lines.extend(pending)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Forget every line."""
+        self._flush_timer.stop()
+        self.beginResetModel()
+        self._lines.clear()
+        self._pending = []
+        self.dropped = 0
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._lines)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._lines[index.row()]
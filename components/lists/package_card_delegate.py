@@ -0,0 +1,170 @@
+"""
+PackageCardDelegate Module
+Paints compact package cards for icon-mode list views.
+
+Each item is drawn as a fixed-size card holding the package name on a
+darker plate and its version underneath, matching the cards the AUR
+page used to build as widgets. Clicking a card toggles the same colour
+animation those widgets had. The shared animation clock drives it only
+while an animated card is in view; scrolling one back into view resumes
+it, and cards whose rows are removed stop animating.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import (QAbstractItemModel, QEvent, QModelIndex, QPersistentModelIndex,
+                          QRect, QRectF, QSize, Qt)
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import (QAbstractItemView, QStyle, QStyledItemDelegate,
+                             QStyleOptionViewItem)
+
+from components.cards.animation_clock import AnimationClock
+from components.cards.package_card import random_pastel_color
+from components.lists.package_list_model import PackageListModel
+from utils.themes.colors import ThemeColors
+from utils.themes.fonts import Fonts
+
+
+class PackageCardDelegate(QStyledItemDelegate):
+    """
+    Draws a package card per item.
+
+    Attributes:
+        CARD_SIZE (QSize): Size of a painted card
+        SPACING (int): Gap between neighbouring cards
+    """
+
+    CARD_SIZE = QSize(280, 100)
+    SPACING = 20
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._name_font = QFont(Fonts.DECORATIVE)
+        self._name_font.setPixelSize(Fonts.MEDIUM)
+        self._version_font = QFont(Fonts.DECORATIVE)
+        self._version_font.setPixelSize(Fonts.SMALL)
+        # Package name -> (row, background, border) of the cards being animated
+        self._animated: Dict[str, Tuple[QPersistentModelIndex, QColor, QColor]] = {}
+        self._watched_model: Optional[QAbstractItemModel] = None
+
+    @classmethod
+    def grid_size(cls) -> QSize:
+        """Get the grid cell size for views using this delegate."""
+        return cls.CARD_SIZE + QSize(cls.SPACING, cls.SPACING)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return self.CARD_SIZE
+
+    def editorEvent(self, event: QEvent, model: QAbstractItemModel,
+                    option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (event.type() == QEvent.Type.MouseButtonPress
+                and event.button() == Qt.MouseButton.LeftButton):
+            pkg = index.data(PackageListModel.PackageRole)
+            if pkg is not None:
+                self.toggle_animation(index)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def toggle_animation(self, index: QModelIndex) -> None:
+        """Start or stop the colour animation of a package's card."""
+        view = self.parent()
+        if not isinstance(view, QAbstractItemView):
+            return
+        name = index.data(PackageListModel.PackageRole).name
+        if name in self._animated:
+            del self._animated[name]
+            if not self._animated:
+                AnimationClock.instance().unsubscribe(view.viewport())
+        else:
+            self._watch_model(index.model())
+            self._animated[name] = (QPersistentModelIndex(index),
+                                    random_pastel_color(), random_pastel_color())
+        view.update(index)
+
+    def advance_animation(self) -> None:
+        """Called by the animation clock on every tick"""
+        view = self.parent()
+        viewport = view.viewport()
+        visible = viewport.rect()
+        in_view = False
+        for name, (row, _, _) in self._animated.items():
+            index = QModelIndex(row)
+            if view.visualRect(index).intersects(visible):
+                self._animated[name] = (row, random_pastel_color(), random_pastel_color())
+                view.update(index)
+                in_view = True
+        if not in_view:
+            # Painting an animated card subscribes again
+            AnimationClock.instance().unsubscribe(viewport)
+
+    def _watch_model(self, model: QAbstractItemModel) -> None:
+        """Forget animated cards when their rows leave ``model``."""
+        if model is self._watched_model:
+            return
+        if self._watched_model is not None:
+            self._watched_model.rowsRemoved.disconnect(self._prune_animations)
+            self._watched_model.modelReset.disconnect(self._prune_animations)
+        model.rowsRemoved.connect(self._prune_animations)
+        model.modelReset.connect(self._prune_animations)
+        self._watched_model = model
+
+    def _prune_animations(self) -> None:
+        """Drop animated cards whose rows no longer exist."""
+        self._animated = {name: animated for name, animated in self._animated.items()
+                          if animated[0].isValid()}
+        if not self._animated:
+            AnimationClock.instance().unsubscribe(self.parent().viewport())
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        pkg = index.data(PackageListModel.PackageRole)
+        if pkg is None:
+            return
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = QRect(option.rect.topLeft(), self.CARD_SIZE)
+        card.moveCenter(option.rect.center())
+        animated = self._animated.get(pkg.name)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card
+        if animated is not None:
+            _, background, border = animated
+            painter.setPen(QPen(border, 4))
+            painter.setBrush(background)
+            # Being painted means being seen; resume ticking
+            clock = AnimationClock.instance()
+            clock.subscribe(self.parent().viewport(), self.advance_animation)
+            clock.wake()
+        else:
+            painter.setPen(QPen(QColor(ThemeColors.HIGHLIGHT if hovered else ThemeColors.LIGHT), 2))
+            painter.setBrush(QColor(ThemeColors.DARK if hovered else ThemeColors.MEDIUM))
+        inset = painter.pen().widthF() / 2  # keep the border inside the card
+        painter.drawRoundedRect(QRectF(card).adjusted(inset, inset, -inset, -inset), 8, 8)
+
+        # Name plate
+        inner = card.adjusted(12, 10, -12, -10)
+        plate = QRect(inner.left(), inner.top(), inner.width(), inner.height() * 3 // 5)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(ThemeColors.DARK))
+        painter.drawRoundedRect(QRectF(plate), 4, 4)
+
+        painter.setFont(self._name_font)
+        painter.setPen(QColor(ThemeColors.TEXT))
+        text_rect = plate.adjusted(6, 0, -6, 0)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         painter.fontMetrics().elidedText(f"📦 {pkg.name}",
+                                                          Qt.TextElideMode.ElideRight,
+                                                          text_rect.width()))
+
+        # Version
+        painter.setFont(self._version_font)
+        version_rect = QRect(inner.left() + 6, plate.bottom() + 1,
+                             inner.width() - 12, inner.bottom() - plate.bottom())
+        painter.drawText(version_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         painter.fontMetrics().elidedText(f"Version: {pkg.version}",
+                                                          Qt.TextElideMode.ElideRight,
+                                                          version_rect.width()))
+
+        painter.restore()
@@ -0,0 +1,164 @@
+"""
+PackageItemDelegate Module
+Paints package rows for list views instead of building a widget per row.
+
+Each row is drawn as a card with the package name, its version and an
+action button on the right, plus a check box on the left when the model
+makes rows checkable. Only visible rows are ever painted, so the cost of
+a list no longer grows with the number of packages in it.
+"""
+
+from PyQt6.QtCore import QEvent, QModelIndex, QPersistentModelIndex, QRect, QRectF, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QCursor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from components.lists.package_list_model import PackageListModel
+from utils.themes.colors import ThemeColors
+from utils.themes.fonts import Fonts
+
+
+class PackageItemDelegate(QStyledItemDelegate):
+    """
+    Draws a package card per row with a clickable action button.
+
+    Colours are read from :class:`ThemeColors` at paint time, so a theme
+    switch only needs the view to repaint.
+
+    Attributes:
+        actionClicked (pyqtSignal): Emitted with the row's package when its
+            action button is clicked
+        accent (str): Name of the ThemeColors colour used for hover and the button
+        ROW_HEIGHT (int): Height of one row including its margin
+    """
+
+    actionClicked = pyqtSignal(object)
+
+    ROW_HEIGHT = 90
+    MARGIN = 5
+    BUTTON_SIZE = QSize(140, 50)
+    CHECK_SIZE = 22
+
+    def __init__(self, action_text: str = "⬇️ Install", accent: str = "HIGHLIGHT",
+                 parent=None) -> None:
+        super().__init__(parent)
+        self.action_text = action_text
+        self.accent = accent
+        self._name_font = QFont(Fonts.DECORATIVE)
+        self._name_font.setPixelSize(Fonts.SMALL)
+        self._text_font = QFont(Fonts.DECORATIVE)
+        self._text_font.setPixelSize(Fonts.SMALL)
+        self._pressed = QPersistentModelIndex()
+        self._pressed_check = False
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def card_rect(self, rect: QRect) -> QRect:
+        """Get the card area of a row."""
+        return rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+
+    def button_rect(self, rect: QRect) -> QRect:
+        """Get the action button area of a row."""
+        card = self.card_rect(rect)
+        size = self.BUTTON_SIZE
+        return QRect(card.right() - size.width() - 10,
+                     card.center().y() - size.height() // 2 + 1,
+                     size.width(), size.height())
+
+    def check_rect(self, rect: QRect) -> QRect:
+        """Get the check box area of a row."""
+        card = self.card_rect(rect)
+        size = self.CHECK_SIZE
+        return QRect(card.left() + 15, card.center().y() - size // 2 + 1, size, size)
+
+    @staticmethod
+    def is_checkable(index: QModelIndex) -> bool:
+        """Check whether the model lets a row be checked."""
+        return bool(index.flags() & Qt.ItemFlag.ItemIsUserCheckable)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        pkg = index.data(PackageListModel.PackageRole)
+        if pkg is None:
+            return
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        accent = QColor(getattr(ThemeColors, self.accent))
+        card = self.card_rect(option.rect)
+        button = self.button_rect(option.rect)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card
+        painter.setPen(QPen(accent if hovered else QColor(ThemeColors.LIGHT), 2))
+        painter.setBrush(QColor(ThemeColors.DARK if hovered else ThemeColors.MEDIUM))
+        painter.drawRoundedRect(QRectF(card).adjusted(1, 1, -1, -1), 8, 8)
+
+        # Check box
+        text_left = card.left() + 15
+        if self.is_checkable(index):
+            check = self.check_rect(option.rect)
+            checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+            painter.setPen(QPen(accent, 2))
+            painter.setBrush(accent if checked else QColor(ThemeColors.DARK))
+            painter.drawRoundedRect(QRectF(check).adjusted(1, 1, -1, -1), 4, 4)
+            if checked:
+                painter.setPen(QColor(ThemeColors.DARK))
+                painter.drawText(check, Qt.AlignmentFlag.AlignCenter, "✓")
+            text_left = check.right() + 15
+
+        # Name and version
+        text_width = button.left() - text_left - 10
+        painter.setFont(self._name_font)
+        painter.setPen(QColor(ThemeColors.HIGHLIGHT))
+        name_rect = QRect(text_left, card.top() + 12, text_width, card.height() // 2 - 12)
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         painter.fontMetrics().elidedText(pkg.name, Qt.TextElideMode.ElideRight,
+                                                          text_width))
+
+        painter.setFont(self._text_font)
+        painter.setPen(QColor(ThemeColors.TEXT))
+        version_rect = QRect(text_left, card.center().y(), text_width, card.height() // 2 - 12)
+        painter.drawText(version_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         painter.fontMetrics().elidedText(f"Version: {pkg.version}",
+                                                          Qt.TextElideMode.ElideRight, text_width))
+
+        # Action button
+        button_hovered = hovered and option.widget is not None and button.contains(
+            option.widget.viewport().mapFromGlobal(QCursor.pos())
+        )
+        painter.setPen(QPen(accent, 2))
+        painter.setBrush(accent if button_hovered else QColor(ThemeColors.DARK))
+        painter.drawRoundedRect(QRectF(button).adjusted(1, 1, -1, -1), 6, 6)
+        painter.setPen(QColor(ThemeColors.DARK) if button_hovered else accent)
+        painter.drawText(button, Qt.AlignmentFlag.AlignCenter, self.action_text)
+
+        painter.restore()
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem,
+                    index: QModelIndex) -> bool:
+        """Turn a press and release on the action button or check box into a click."""
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+
+        position = event.position().toPoint()
+        on_button = self.button_rect(option.rect).contains(position)
+        on_check = self.is_checkable(index) and self.check_rect(option.rect).contains(position)
+        if event.type() == QEvent.Type.MouseButtonPress:
+            target = on_button or on_check
+            self._pressed = QPersistentModelIndex(index if target else QModelIndex())
+            self._pressed_check = on_check
+            return target
+
+        clicked = (on_button or on_check) and self._pressed.isValid() and \
+            self._pressed == QPersistentModelIndex(index) and self._pressed_check == on_check
+        self._pressed = QPersistentModelIndex()
+        if clicked and on_check:
+            checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+            model.setData(index, Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked,
+                          Qt.ItemDataRole.CheckStateRole)
+        elif clicked:
+            self.actionClicked.emit(index.data(PackageListModel.PackageRole))
+        return clicked
@@ -0,0 +1,55 @@
+"""
+PackageFilterProxyModel Module
+Filters a package list model through a search index.
+
+Changing the query only refilters the proxy's rows, so the source
+model, the view and the rows that stay visible are left alone.
+"""
+
+from typing import Optional, Set
+
+from PyQt6.QtCore import QModelIndex, QSortFilterProxyModel, Qt
+
+from services.search_index import SearchIndex
+
+
+class PackageFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy showing only the source rows whose package matches a query.
+
+    Matching is done by a :class:`SearchIndex` over the source packages;
+    rows are accepted by package name, so the index may be rebuilt
+    independently of the source model's row order.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.search_index: Optional[SearchIndex] = None
+        self._query = ""
+        self._names: Optional[Set[str]] = None
+
+    def set_search_index(self, index: SearchIndex) -> None:
+        """Match against a new index, keeping the current query."""
+        self.search_index = index
+        self.set_query(self._query)
+
+    def set_query(self, query: str) -> None:
+        """
+        Show only the packages matching a query.
+
+        Args:
+            query (str): Search text; empty shows every package
+        """
+        self._query = query
+        names = None
+        if query.strip() and self.search_index is not None:
+            names = {pkg.name for pkg in self.search_index.filter(query)}
+        self.beginFilterChange()
+        self._names = names
+        self.endFilterChange()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._names is None:
+            return True
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return index.data(Qt.ItemDataRole.DisplayRole) in self._names
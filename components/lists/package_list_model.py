@@ -0,0 +1,284 @@
+"""
+PackageListModel Module
+Qt list model exposing a package sequence to item views.
+
+The model does not copy large package lists. It holds a reference to the
+backing sequence (e.g. the repo catalog) and the row indices to show, so
+a view over tens of thousands of results costs two references plus an
+index list, and rows are only materialised when the view paints them.
+
+Changing the source or the rows reconciles the old and the new rows, so
+only rows that were actually inserted, removed or changed are signalled
+and views keep their scroll position.
+
+Rows can optionally be checked. Checks are kept by package name, so a
+checked package stays checked while searches hide and show its row.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt, pyqtSignal
+
+from utils.list_diff import ListDiff, diff_keyed
+
+
+class PackageListModel(QAbstractListModel):
+    """
+    List model over a subset of a package sequence.
+
+    Attributes:
+        PackageRole (int): Role returning the package object
+        VersionRole (int): Role returning the package version
+        DescriptionRole (int): Role returning the package description
+        MAX_DIFF_RUNS (int): Above this many change runs a reset is cheaper
+        checkable (bool): Whether rows can be checked
+    """
+
+    checkedChanged = pyqtSignal(int)  # number of checked packages
+
+    PackageRole = Qt.ItemDataRole.UserRole + 1
+    VersionRole = Qt.ItemDataRole.UserRole + 2
+    DescriptionRole = Qt.ItemDataRole.UserRole + 3
+
+    MAX_DIFF_RUNS = 64
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._source: Sequence = ()
+        self._rows: Sequence[int] = ()
+        self.checkable = False
+        self._checked: Dict[str, Any] = {}  # name -> package
+
+    def set_source(self, source: Sequence, rows: Optional[Sequence[int]] = None) -> None:
+        """
+        Show rows of a backing sequence.
+
+        Rows of the same sequence are matched by index. Rows of a new
+        sequence are matched by package name, and a changed version
+        updates the row in place.
+
+        Args:
+            source (Sequence): Packages to draw rows from
+            rows (Optional[Sequence[int]]): Indices into ``source`` to show,
+                all of them if omitted
+        """
+        rows = range(len(source)) if rows is None else rows
+        if source is self._source:
+            diff = diff_keyed(self._rows, rows, key=int)
+            if diff.runs <= self.MAX_DIFF_RUNS:
+                # Step through the change on an index list of the same source
+                current = self._rows = list(self._rows)
+                self._apply(diff, current, rows)
+                self._rows = rows
+                return
+        else:
+            current = list(self.packages())
+            wanted = [source[index] for index in rows]
+            diff = diff_keyed(current, wanted, key=lambda pkg: pkg.name,
+                              value=lambda pkg: pkg.version)
+            if diff.runs <= self.MAX_DIFF_RUNS:
+                # Step through the change on the materialised rows
+                self._source = current
+                self._rows = _LiveRange(current)
+                self._apply(diff, current, wanted)
+                self._source = source
+                self._rows = rows
+                return
+
+        self.beginResetModel()
+        self._source = source
+        self._rows = rows
+        self.endResetModel()
+
+    def set_rows(self, rows: Sequence[int]) -> None:
+        """
+        Show a different subset of the current backing sequence.
+
+        Args:
+            rows (Sequence[int]): Indices into the backing sequence
+        """
+        self.set_source(self._source, rows)
+
+    def _apply(self, diff: ListDiff, current: List, wanted: Sequence) -> None:
+        """Turn ``current`` into ``wanted`` one signalled run at a time."""
+        parent = QModelIndex()
+        for first, last in diff.removed:
+            self.beginRemoveRows(parent, first, last)
+            del current[first:last + 1]
+            self.endRemoveRows()
+        for first, last in diff.inserted:
+            self.beginInsertRows(parent, first, last)
+            current[first:first] = wanted[first:last + 1]
+            self.endInsertRows()
+        for first, last in diff.updated:
+            current[first:last + 1] = wanted[first:last + 1]
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def package(self, row: int) -> Any:
+        """Get the package shown at ``row``."""
+        return self._source[self._rows[row]]
+
+    def packages(self) -> Iterator[Any]:
+        """Iterate over the shown packages in row order."""
+        source = self._source
+        for index in self._rows:
+            yield source[index]
+
+    def find_row(self, name: str) -> int:
+        """
+        Find the row showing a package.
+
+        Args:
+            name (str): Package name
+
+        Returns:
+            int: Row of the package, or -1 if it isn't shown
+        """
+        source = self._source
+        for row, index in enumerate(self._rows):
+            if source[index].name == name:
+                return row
+        return -1
+
+    def remove_package(self, name: str) -> bool:
+        """
+        Stop showing a package, emitting a single row removal.
+
+        The backing sequence is left untouched, so it may be shared.
+
+        Args:
+            name (str): Package name
+
+        Returns:
+            bool: True if a row was removed
+        """
+        return self.remove_packages([name]) > 0
+
+    def remove_packages(self, names) -> int:
+        """
+        Stop showing several packages, emitting one removal per run of rows.
+
+        Args:
+            names (Iterable[str]): Package names
+
+        Returns:
+            int: Number of rows removed
+        """
+        names = set(names)
+        source = self._source
+        doomed = [row for row, index in enumerate(self._rows) if source[index].name in names]
+        if not doomed:
+            return 0
+        # Copied, since the caller may still hold the row list it passed in
+        self._rows = list(self._rows)
+        parent = QModelIndex()
+        last = doomed[-1]
+        for position in range(len(doomed) - 1, -1, -1):
+            first = doomed[position]
+            if position > 0 and doomed[position - 1] == first - 1:
+                continue
+            # Runs are removed back to front so earlier rows keep their numbers
+            self.beginRemoveRows(parent, first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+            if position > 0:
+                last = doomed[position - 1]
+        return len(doomed)
+
+    def set_checkable(self, checkable: bool) -> None:
+        """Allow or disallow checking rows."""
+        self.checkable = checkable
+        if not checkable:
+            self.clear_checked()
+
+    def checked_packages(self) -> List[Any]:
+        """Get the checked packages, including ones whose rows are hidden."""
+        return list(self._checked.values())
+
+    def set_checked(self, packages: Sequence, checked: bool = True) -> None:
+        """
+        Check or uncheck packages, signalling only rows that changed.
+
+        Args:
+            packages (Sequence): Packages to change
+            checked (bool): New check state
+        """
+        changed = [pkg for pkg in packages if (pkg.name in self._checked) != checked]
+        if not changed:
+            return
+        for pkg in changed:
+            if checked:
+                self._checked[pkg.name] = pkg
+            else:
+                del self._checked[pkg.name]
+        self._check_state_changed(changed[0].name if len(changed) == 1 else None)
+
+    def clear_checked(self) -> None:
+        """Uncheck every package."""
+        if self._checked:
+            self._checked.clear()
+            self._check_state_changed()
+
+    def _check_state_changed(self, name: Optional[str] = None) -> None:
+        """Repaint the row of ``name``, or every row, and report the new count."""
+        row = self.find_row(name) if name is not None else -1
+        if row >= 0:
+            self.dataChanged.emit(self.index(row), self.index(row),
+                                  [Qt.ItemDataRole.CheckStateRole])
+        elif name is None and self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1),
+                                  [Qt.ItemDataRole.CheckStateRole])
+        self.checkedChanged.emit(len(self._checked))
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if self.checkable and index.isValid():
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.CheckStateRole or not self.checkable or not index.isValid():
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.set_checked([self.package(index.row())], checked)
+        return True
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        pkg = self.package(index.row())
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.AccessibleTextRole):
+            return pkg.name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return pkg.description
+        if role == self.PackageRole:
+            return pkg
+        if role == self.VersionRole:
+            return pkg.version
+        if role == self.DescriptionRole:
+            return pkg.description
+        if role == Qt.ItemDataRole.CheckStateRole and self.checkable:
+            return Qt.CheckState.Checked if pkg.name in self._checked else Qt.CheckState.Unchecked
+        return None
+
+
+class _LiveRange(Sequence):
+    """Identity row indices that follow the length of a changing list."""
+
+    def __init__(self, items: List) -> None:
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return range(len(self._items))[index]
+        if not -len(self._items) <= index < len(self._items):
+            raise IndexError("row out of range")
+        return index % len(self._items)
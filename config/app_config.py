@@ -35,6 +35,12 @@ class Config:
     SIDEBAR_EXPANDED_WIDTH = 220
     SIDEBAR_COLLAPSED_WIDTH = 60
     
+    # Pages built in the background after the main interface appears;
+    # the others are built when first opened. The search page is left
+    # out because building it asks for the sudo password.
+    PREBUILD_PAGES = ["delete", "about"]
+    PREBUILD_DELAY_MS = 500
+    
     # Grid Layout
     GRID_COLUMNS = 3
     GRID_SPACING = 15
@@ -51,9 +57,22 @@ class Config:
     ICONS_DIR = RESOURCES_DIR / "icons"
     
     # Cache Settings
-    CACHE_DIR = BASE_DIR / "cache"
+    CACHE_DIR = Path.home() / ".cache" / "shroomie"
     CACHE_EXPIRE_DAYS = 1
     
+    # Data Settings
+    DATA_DIR = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share") / "shroomie"
+    
+    # Compressed, indexed output of every package transaction; the
+    # oldest logs are deleted once they take up more than this
+    LOG_DIR = DATA_DIR / "logs"
+    LOG_ARCHIVE_MAX_BYTES = 100 * 1024 * 1024
+    # Lines of output kept in memory by the install dialog
+    LOG_VIEW_MAX_LINES = 5000
+
+    # Pacman database root (contains local/ and sync/)
+    PACMAN_DB_DIR = Path("/var/lib/pacman")
+
     @classmethod
     def ensure_directories(cls):
         """Create necessary directories if they don't exist"""
@@ -17,7 +17,7 @@ sys.path.insert(0, project_root)
 from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
 import logging
-from utils.themes.colors import ThemeColors
+from utils.themes.theme_engine import ThemeEngine
 
 # Configure logging to suppress info messages
 logging.basicConfig(level=logging.WARNING)
@@ -26,12 +26,7 @@ def main():
     app = QApplication(sys.argv)
     
     # Set application-wide dark theme immediately
-    app.setStyleSheet(f"""
-        QWidget {{
-            background-color: {ThemeColors.BACKGROUND};
-            color: {ThemeColors.TEXT};
-        }}
-    """)
+    ThemeEngine.instance().apply("dark")
     
     window = MainWindow()
     window.show()
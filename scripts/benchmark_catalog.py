@@ -0,0 +1,85 @@
+"""
+Catalog Loading Benchmark
+Compares the native sync database loader with the old ``yay -Ss`` path.
+
+Usage:
+    python scripts/benchmark_catalog.py [DB_ROOT] [--runs N]
+
+DB_ROOT is a pacman database root containing ``sync/*.db`` (for example
+a recorded copy of core, extra and multilib). It defaults to
+``/var/lib/pacman``. The ``yay -Ss`` half is skipped if yay is missing.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.sync_db import SyncDatabase
+
+
+def parse_yay_output(output):
+    """Parse ``yay -Ss`` output the way SearchPage used to."""
+    packages = []
+    current = None
+    for line in output.split('\n'):
+        if not line:
+            continue
+        if line.startswith('    '):
+            if current:
+                current[3] = line.strip()
+        else:
+            parts = line.split('/')
+            if len(parts) >= 2:
+                repo_pkg = parts[1].split()
+                if len(repo_pkg) >= 2:
+                    current = [repo_pkg[0], repo_pkg[1], parts[0], ""]
+                    packages.append(current)
+    return packages
+
+
+def load_with_yay(db_root):
+    """Run and parse ``yay -Ss`` against the given database root."""
+    result = subprocess.run(['yay', '-Ss', '--dbpath', db_root],
+                            capture_output=True, text=True, check=True)
+    return parse_yay_output(result.stdout)
+
+
+def load_native(db_root):
+    """Load the catalog with the sync database reader."""
+    return SyncDatabase(db_root).load_catalog()
+
+
+def bench(label, loader, db_root, runs):
+    """Time a loader and print a one-line summary."""
+    timings = []
+    count = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        count = len(loader(db_root))
+        timings.append(time.perf_counter() - start)
+    print(f"{label:<8} {count:>7} packages  "
+          f"median {statistics.median(timings) * 1000:8.1f} ms  "
+          f"min {min(timings) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('db_root', nargs='?', default='/var/lib/pacman')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    bench("native", load_native, args.db_root, args.runs)
+    if shutil.which('yay'):
+        bench("yay -Ss", load_with_yay, args.db_root, args.runs)
+    else:
+        print("yay not found, skipping yay -Ss comparison")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,70 +3,35 @@ AUR Service Module
 Provides functionality to interact with installed AUR packages.
 """
 
-import subprocess
 from typing import List, Dict, Any
 from models.package import Package
 from .aur_storage import AurPackageStorage
+from .local_db import LocalDatabase
+from utils.tar_reader import TarReadError
 
 class AurService:
     """Service for interacting with AUR packages."""
-    
+
     def __init__(self) -> None:
-        self.storage = AurPackageStorage()
-    
+        self.storage = AurPackageStorage.instance()
+        self.local_db = LocalDatabase()
+
     def get_installed_aur_packages(self) -> List[Package]:
         """
-        Get list of installed AUR packages using pacman.
+        Get list of installed AUR packages from the local pacman database.
         Returns a list of Package objects.
         """
         try:
-            # Run pacman command to get AUR packages
-            result = subprocess.run(
-                ["pacman", "-Qqm"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Get package information for each AUR package
-            packages: List[Package] = []
-            for pkg_name in result.stdout.strip().split('\n'):
-                if pkg_name:  # Skip empty lines
-                    # Get detailed package info
-                    pkg_info = subprocess.run(
-                        ["pacman", "-Qi", pkg_name],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    
-                    # Parse package info
-                    version = ""
-                    description = ""
-                    
-                    for line in pkg_info.stdout.split('\n'):
-                        if line.startswith("Version"):
-                            version = line.split(":")[1].strip()
-                        elif line.startswith("Description"):
-                            description = line.split(":")[1].strip()
-                    
-                    # Update storage
-                    self.storage.update_package(pkg_name, version, description)
-                    
-                    # Create Package object
-                    packages.append(
-                        Package(
-                            pkg_name,
-                            version,
-                            "installed",
-                            description=description
-                        )
-                    )
-            
+            # Read every foreign package straight from the local database
+            packages = self.local_db.get_foreign_packages(repo="installed")
+
+            # Update storage in a single write
+            self.storage.update_packages(packages)
+
             return packages
-            
-        except subprocess.CalledProcessError:
-            # If pacman command fails, try to load from storage
+
+        except (OSError, TarReadError):
+            # If the database can't be read, try to load from storage
             stored_packages: Dict[str, Dict[str, Any]] = self.storage.get_all_packages()
             return [
                 Package(
@@ -4,22 +4,70 @@ Handles saving and loading AUR package data to/from JSON.
 """
 
 import json
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
 import os
-import subprocess
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from models.package import Package
+from utils.logger import Logger
+from utils.tar_reader import TarReadError
+from .job_runner import JobPriority, JobResult, JobRunner
+from .local_db import Fingerprint, LocalDatabase, SyncFingerprint, split_entry_name
+
+logger = Logger.get_logger(__name__)
+
+@dataclass
+class SyncReport:
+    """
+    Outcome of a storage sync.
+
+    Attributes:
+        scanned (int): Number of foreign packages known after the sync
+        reparsed (int): Number of database entries parsed by this sync
+        changed (bool): Whether the stored package list was rewritten
+        elapsed (float): Wall time of the sync in seconds
+    """
+
+    scanned: int = 0
+    reparsed: int = 0
+    changed: bool = False
+    elapsed: float = 0.0
 
 class AurPackageStorage(QObject):
     """Manages storage of AUR package information in JSON format."""
     
-    packagesChanged = pyqtSignal()  # Signal to notify when packages change
+    packagesChanged = pyqtSignal(list)  # Names of the packages that changed
+
+    # Fields that decide whether a synced package differs from storage
+    SYNC_FIELDS = ("version", "description", "repo", "install_date")
+
+    # Shared instance
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "AurPackageStorage":
+        """Get the shared storage, creating (and syncing) it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
-    def __init__(self) -> None:
+    def __init__(self, local_db: Optional[LocalDatabase] = None) -> None:
         super().__init__()
         self.storage_dir = Path.home() / ".config" / "shroomie"
         self.storage_file = self.storage_dir / "aur_packages.json"
+        self.local_db = local_db or LocalDatabase()
+        self.last_sync_report = SyncReport()
+        # Incremental sync state
+        self._fingerprints: Dict[str, Fingerprint] = {}
+        self._entries: Dict[str, Tuple[Fingerprint, Package]] = {}
+        self._repo_fingerprint: Optional[SyncFingerprint] = None
+        self._repo_names: Set[str] = set()
+        # Syncs may run on job runner threads; writes wait for them
+        self._sync_lock = threading.Lock()
         self._ensure_storage_exists()
         # Initial sync with system when app starts
         self.sync_with_system()
@@ -32,8 +80,12 @@ class AurPackageStorage(QObject):
     
     def _save_packages(self, packages: Dict[str, Dict[str, Any]]) -> None:
         """Save packages data to JSON file."""
-        with open(self.storage_file, 'w') as f:
+        # Replace the file in one step so readers on other threads never
+        # see a partly written file
+        temp_file = self.storage_file.with_suffix(".tmp")
+        with open(temp_file, 'w') as f:
             json.dump(packages, f, indent=2)
+        os.replace(temp_file, self.storage_file)
     
     def _load_packages(self) -> Dict[str, Dict[str, Any]]:
         """Load packages data from JSON file."""
@@ -45,22 +97,62 @@ class AurPackageStorage(QObject):
     
     def update_package(self, name: str, version: str, description: str, repo: str = "AUR") -> None:
         """Update or add a package in storage."""
-        packages = self._load_packages()
-        packages[name] = {
-            "version": version,
-            "description": description,
-            "repo": repo,
-            "install_date": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat()
-        }
-        self._save_packages(packages)
-    
+        with self._sync_lock:
+            packages = self._load_packages()
+            packages[name] = {
+                "version": version,
+                "description": description,
+                "repo": repo,
+                "install_date": datetime.now().isoformat(),
+                "last_updated": datetime.now().isoformat()
+            }
+            self._save_packages(packages)
+
+    def update_packages(self, new_packages: List[Package], repo: str = "AUR") -> None:
+        """Update or add several packages in storage with a single write."""
+        with self._sync_lock:
+            packages = self._load_packages()
+            now = datetime.now().isoformat()
+            for pkg in new_packages:
+                install_date = pkg.install_date.isoformat() if pkg.install_date else now
+                packages[pkg.name] = {
+                    "version": pkg.version,
+                    "description": pkg.description,
+                    "repo": repo,
+                    "install_date": install_date,
+                    "last_updated": now
+                }
+            self._save_packages(packages)
+
     def remove_package(self, name: str) -> None:
         """Remove a package from storage."""
-        packages = self._load_packages()
-        if name in packages:
-            del packages[name]
-            self._save_packages(packages)
+        with self._sync_lock:
+            packages = self._load_packages()
+            if name in packages:
+                del packages[name]
+                self._save_packages(packages)
+    
+    def remove_packages(self, names: List[str]) -> None:
+        """
+        Remove several packages from storage with a single write.
+
+        Meant for packages that were just uninstalled: their database
+        entries are forgotten too, so the sync prompted by the removal
+        finds nothing new. ``packagesChanged`` is emitted once with the
+        packages that were stored.
+        """
+        with self._sync_lock:
+            packages = self._load_packages()
+            removed = [name for name in names if packages.pop(name, None) is not None]
+            if removed:
+                self._save_packages(packages)
+            gone = set(names)
+            self._fingerprints = {entry: fingerprint for entry, fingerprint in self._fingerprints.items()
+                                  if split_entry_name(entry) not in gone}
+            self._entries = {entry: cached for entry, cached in self._entries.items()
+                             if split_entry_name(entry) not in gone}
+        if removed:
+            self.packagesChanged.emit(removed)
     
     def get_all_packages(self) -> Dict[str, Dict[str, Any]]:
         """Get all stored packages."""
@@ -71,68 +163,136 @@ class AurPackageStorage(QObject):
         packages = self._load_packages()
         return packages.get(name, {})
     
-    def sync_with_system(self) -> None:
-        """Sync JSON storage with actual system AUR packages"""
+    def sync_with_system(self) -> SyncReport:
+        """
+        Sync JSON storage with actual system AUR packages.
+
+        Each local database entry is fingerprinted by its directory name and
+        the mtime/inode of its desc file. Only entries that were added or
+        changed since the last sync are parsed again, and nothing is read
+        when no fingerprint changed.
+        """
+        with self._sync_lock:
+            return self._sync()
+
+    def sync_async(self, on_finished: Optional[Callable[[SyncReport], None]] = None) -> int:
+        """
+        Sync with the system on the job runner instead of the calling thread.
+
+        Args:
+            on_finished (Optional[Callable]): Called with the SyncReport on
+                the GUI thread once the sync is done
+
+        Returns:
+            int: Job id
+        """
+        def finished(result: JobResult) -> None:
+            if on_finished is not None and result.ok:
+                on_finished(result.value)
+
+        return JobRunner.instance().run_call(
+            self.sync_with_system, name="storage sync",
+            priority=JobPriority.LOW, on_finished=finished
+        )
+
+    def _sync(self) -> SyncReport:
+        """Run a sync; the caller holds the sync lock."""
+        started = time.perf_counter()
+        report = SyncReport()
         try:
-            # Get list of foreign packages (AUR) from pacman
-            result = subprocess.run(['pacman', '-Qm'], capture_output=True, text=True)
-            if result.returncode == 0:
-                current_packages: Dict[str, Dict[str, Any]] = {}
-                for line in result.stdout.splitlines():
-                    if line.strip():
-                        name, version = line.split()
-                        # Get package details
-                        desc = self._get_package_description(name)
-                        current_packages[name] = {
-                            "version": version,
-                            "description": desc,
-                            "repo": "AUR",
-                            "install_date": self._get_install_date(name),
-                            "last_updated": datetime.now().isoformat()
-                        }
-                
-                # Compare with stored packages
-                stored_packages = self._load_packages()
-                if current_packages != stored_packages:
-                    self._save_packages(current_packages)
-                    self.packagesChanged.emit()
-        except Exception as e:
+            fingerprints = self.local_db.scan_fingerprints()
+
+            # The foreign set only changes when a sync database changes
+            repo_fingerprint = self.local_db.sync_fingerprint()
+            repo_changed = repo_fingerprint != self._repo_fingerprint
+            if repo_changed:
+                self._repo_names = self.local_db.sync_package_names()
+                self._repo_fingerprint = repo_fingerprint
+
+            if repo_changed or fingerprints != self._fingerprints:
+                report.reparsed = self._update_entries(fingerprints)
+                self._fingerprints = fingerprints
+                report.changed = self._save_synced_packages()
+            report.scanned = len(self._entries)
+        except (OSError, TarReadError) as e:
             print(f"Error syncing with system: {e}")
 
-    def _get_package_description(self, package_name: str) -> str:
-        """Get package description from pacman"""
-        try:
-            result = subprocess.run(
-                ['yay', '-Qi', package_name], 
-                capture_output=True, 
-                text=True
-            )
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if line.startswith("Description"):
-                        return line.split(":", 1)[1].strip()
-        except Exception:
-            pass
-        return ""
-
-    def _get_install_date(self, package_name: str) -> str:
-        """Get package installation date from pacman"""
-        try:
-            result = subprocess.run(
-                ['yay', '-Qi', package_name], 
-                capture_output=True, 
-                text=True
-            )
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if line.startswith("Install Date"):
-                        date_str = line.split(":", 1)[1].strip()
-                        # Convert the date string to ISO format
-                        try:
-                            dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                            return dt.isoformat()
-                        except ValueError:
-                            return datetime.now().isoformat()
-        except Exception:
-            pass
-        return datetime.now().isoformat()
+        report.elapsed = time.perf_counter() - started
+        self.last_sync_report = report
+        logger.info(
+            f"Synced {report.scanned} AUR packages ({report.reparsed} reparsed) "
+            f"in {report.elapsed * 1000:.1f} ms"
+        )
+        return report
+
+    def _update_entries(self, fingerprints: Dict[str, Fingerprint]) -> int:
+        """
+        Reparse the foreign entries whose fingerprint is new or changed.
+
+        Entries that can't be read are dropped from ``fingerprints`` so the
+        next sync retries them.
+
+        Returns:
+            int: Number of entries parsed
+        """
+        entries: Dict[str, Tuple[Fingerprint, Package]] = {}
+        unreadable: List[str] = []
+        reparsed = 0
+        for entry_name, fingerprint in fingerprints.items():
+            if split_entry_name(entry_name) in self._repo_names:
+                continue
+            cached = self._entries.get(entry_name)
+            if cached is None or cached[0] != fingerprint:
+                reparsed += 1
+                pkg = self.local_db.read_package(entry_name, repo="AUR")
+                if pkg is None:
+                    unreadable.append(entry_name)
+                    continue
+                cached = (fingerprint, pkg)
+            entries[entry_name] = cached
+
+        for entry_name in unreadable:
+            del fingerprints[entry_name]
+        self._entries = entries
+        return reparsed
+
+    def _save_synced_packages(self) -> bool:
+        """
+        Write the parsed entries to storage if they differ from it.
+
+        Returns:
+            bool: True if storage was rewritten
+        """
+        stored_packages = self._load_packages()
+        now = datetime.now().isoformat()
+
+        current_packages: Dict[str, Dict[str, Any]] = {}
+        for _, pkg in self._entries.values():
+            previous = stored_packages.get(pkg.name)
+            if pkg.install_date is not None:
+                install_date = pkg.install_date.isoformat()
+            else:
+                # No %INSTALLDATE%: keep the date first recorded for it
+                install_date = (previous or {}).get("install_date", now)
+            info = {
+                "version": pkg.version,
+                "description": pkg.description,
+                "repo": "AUR",
+                "install_date": install_date,
+                "last_updated": now
+            }
+            # Keep the old timestamp so unchanged packages compare equal
+            if previous and all(previous.get(key) == info[key] for key in self.SYNC_FIELDS):
+                info["last_updated"] = previous.get("last_updated", now)
+            current_packages[pkg.name] = info
+
+        # Compare with stored packages
+        changed_names = sorted(
+            name for name in current_packages.keys() | stored_packages.keys()
+            if current_packages.get(name) != stored_packages.get(name)
+        )
+        if not changed_names:
+            return False
+        self._save_packages(current_packages)
+        self.packagesChanged.emit(changed_names)
+        return True
@@ -0,0 +1,157 @@
+"""
+Catalog Cache Module
+Binary snapshot of the parsed repository catalog.
+
+Parsing every sync database on each start costs a few hundred
+milliseconds. The parsed catalog is saved under ``Config.CACHE_DIR``
+together with the size and mtime of every database it came from, so
+later starts map the snapshot and only reparse after ``pacman -Sy``
+actually changed a database.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from config.app_config import Config
+from models.package import Package
+from services.columnar_catalog import CatalogFormatError, ColumnarCatalog
+from services.local_db import SyncFingerprint
+from services.sync_db import SyncDatabase
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class CatalogCache:
+    """
+    Loads the repo catalog from a snapshot, rebuilding it when stale.
+
+    The snapshot is a memory-mapped :class:`ColumnarCatalog`, so loading
+    it involves no parsing and its pages are shared through the page cache.
+
+    Attributes:
+        FORMAT_VERSION (int): Bumped whenever the snapshot layout changes
+        snapshot_path (Path): Location of the snapshot file
+        sync_db (SyncDatabase): Source of the catalog
+    """
+
+    FORMAT_VERSION = 2
+    SNAPSHOT_NAME = "repo_catalog.cols"
+
+    # Shared instance
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "CatalogCache":
+        """Get the shared catalog cache."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, sync_db: Optional[SyncDatabase] = None,
+                 cache_dir: Optional[Path] = None) -> None:
+        self.sync_db = sync_db or SyncDatabase()
+        self.snapshot_path = Path(cache_dir or Config.CACHE_DIR) / self.SNAPSHOT_NAME
+        self._catalog: Optional[ColumnarCatalog] = None
+        # Parsed catalog kept in memory when no snapshot could be written
+        self._parsed: Optional[Tuple[SyncFingerprint, List[Package]]] = None
+        # Catalogs are loaded from job runner and warm-up threads
+        self._lock = threading.Lock()
+
+    def get_catalog(self) -> Sequence:
+        """
+        Get the repo catalog, from the snapshot when it is still current.
+
+        Returns:
+            Sequence: Read-only package views of every sync database, or
+                parsed Package objects if no snapshot could be written
+        """
+        with self._lock:
+            return self._get_catalog()
+
+    def _get_catalog(self) -> Sequence:
+        """Load the catalog; the caller holds the lock."""
+        fingerprint = self.sync_db.fingerprint()
+        if self._catalog is not None and self._matches(self._catalog, fingerprint):
+            return self._catalog
+        if self._parsed is not None and self._parsed[0] == fingerprint:
+            return self._parsed[1]
+
+        catalog = self.load(fingerprint)
+        if catalog is None:
+            started = time.perf_counter()
+            packages = self.sync_db.load_catalog()
+            logger.info(f"Parsed {len(packages)} repo packages in "
+                        f"{(time.perf_counter() - started) * 1000:.1f} ms")
+            if self.save(packages, fingerprint):
+                catalog = self.load(fingerprint)
+            if catalog is None:
+                # Don't reparse on every call while the cache dir is unusable
+                self._parsed = (fingerprint, packages)
+                return packages
+
+        # The previous mapping is released once no view refers to it
+        self._catalog = catalog
+        self._parsed = None
+        return catalog
+
+    def load(self, fingerprint: SyncFingerprint) -> Optional[ColumnarCatalog]:
+        """
+        Map the snapshot if it matches the given database fingerprint.
+
+        Args:
+            fingerprint (SyncFingerprint): Current sync database fingerprint
+
+        Returns:
+            Optional[ColumnarCatalog]: Cached catalog, or None if the snapshot
+                is missing, expired, from another format or stale
+        """
+        started = time.perf_counter()
+        try:
+            if time.time() - self.snapshot_path.stat().st_mtime > Config.CACHE_EXPIRE_DAYS * 86400:
+                return None
+            catalog = ColumnarCatalog.open(self.snapshot_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, CatalogFormatError) as e:
+            logger.warning(f"Ignoring unreadable catalog snapshot: {e}")
+            return None
+
+        if not self._matches(catalog, fingerprint):
+            catalog.close()
+            return None
+
+        logger.info(f"Mapped {len(catalog)} repo packages from snapshot in "
+                    f"{(time.perf_counter() - started) * 1000:.1f} ms")
+        return catalog
+
+    def save(self, packages: List[Package], fingerprint: SyncFingerprint) -> bool:
+        """
+        Write a snapshot of the catalog.
+
+        Args:
+            packages (List[Package]): Catalog to store
+            fingerprint (SyncFingerprint): Fingerprint the catalog was parsed from
+
+        Returns:
+            bool: True if the snapshot was written
+        """
+        metadata = {
+            "format": self.FORMAT_VERSION,
+            "fingerprint": [list(entry) for entry in fingerprint],
+        }
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            ColumnarCatalog.write(self.snapshot_path, packages, metadata)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not write catalog snapshot: {e}")
+            return False
+
+    def _matches(self, catalog: ColumnarCatalog, fingerprint: SyncFingerprint) -> bool:
+        """Check that a catalog was built by this format from these databases."""
+        metadata = catalog.metadata
+        return (metadata.get("format") == self.FORMAT_VERSION and
+                metadata.get("fingerprint") == [list(entry) for entry in fingerprint])
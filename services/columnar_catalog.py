@@ -0,0 +1,258 @@
+"""
+Columnar Catalog Module
+Read-only, memory-mapped package catalog stored column by column.
+
+A catalog file holds every string in one UTF-8 blob plus offset arrays
+for the name, version and description columns, and a small repo table
+indexed by a per-package repo id. Opening a catalog only maps the file;
+strings are decoded when a package is actually looked at, and the pages
+are shared with every other process mapping the same file.
+
+File layout (native byte order, all integers unsigned 32-bit)::
+
+    magic (8 bytes) | count | header length | JSON header (padded to 8)
+    name offsets    [count + 1]
+    version offsets [count + 1]
+    desc offsets    [count + 1]
+    repo ids        [count]
+    string blob     (all names, then all versions, then all descriptions)
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+MAGIC = b"SHRCAT\x00\x01"
+_PREAMBLE = struct.Struct("=8sII")
+
+
+class CatalogFormatError(Exception):
+    """Raised when a catalog file is truncated or has the wrong format."""
+
+
+class PackageView:
+    """
+    Lightweight, read-only view of one catalog entry.
+
+    Exposes the same read attributes as :class:`models.package.Package`
+    but stores only a catalog reference and a row index.
+    """
+
+    __slots__ = ("_catalog", "index")
+
+    status = "Not Installed"
+    install_date = None
+    maintainer = None
+    license = None
+    dependencies = ()
+
+    def __init__(self, catalog: "ColumnarCatalog", index: int) -> None:
+        self._catalog = catalog
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self._catalog.name(self.index)
+
+    @property
+    def version(self) -> str:
+        return self._catalog.version(self.index)
+
+    @property
+    def repo(self) -> str:
+        return self._catalog.repo(self.index)
+
+    @property
+    def description(self) -> str:
+        return self._catalog.description(self.index)
+
+    def is_installed(self) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.version})"
+
+    def __repr__(self) -> str:
+        return f"PackageView({self.name!r}, {self.version!r}, {self.repo!r})"
+
+
+class ColumnarCatalog(Sequence):
+    """
+    Memory-mapped columnar package catalog.
+
+    Use :meth:`write` to create a catalog file and :meth:`open` to map it.
+
+    Attributes:
+        metadata (Dict[str, Any]): Free-form header stored with the catalog
+        repos (List[str]): Repository names referenced by the repo ids
+    """
+
+    def __init__(self, buffer: Union[mmap.mmap, bytes], metadata: Dict[str, Any],
+                 repos: List[str], count: int, columns_start: int) -> None:
+        self._buffer = buffer
+        self.metadata = metadata
+        self.repos = repos
+        self._count = count
+
+        self._view = view = memoryview(buffer)
+        offsets_size = (count + 1) * 4
+        pos = columns_start
+        self._names = view[pos:pos + offsets_size].cast("I")
+        pos += offsets_size
+        self._versions = view[pos:pos + offsets_size].cast("I")
+        pos += offsets_size
+        self._descriptions = view[pos:pos + offsets_size].cast("I")
+        pos += offsets_size
+        self._repo_ids = view[pos:pos + count * 4].cast("I")
+        self._blob_start = pos + count * 4
+
+    @classmethod
+    def write(cls, path: Union[str, Path], packages: Iterable[Any],
+              metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write packages to a catalog file.
+
+        The file is written next to ``path`` and renamed into place, so
+        readers never map a half-written catalog.
+
+        Args:
+            path (Union[str, Path]): Destination file
+            packages (Iterable[Any]): Objects with name, version, repo and
+                description attributes
+            metadata (Optional[Dict[str, Any]]): JSON-serialisable header data
+        """
+        # Each column is stored contiguously in the blob, so the end of
+        # one string is the start of the next one in the same column
+        column_blobs = (bytearray(), bytearray(), bytearray())
+        column_offsets = (array("I", [0]), array("I", [0]), array("I", [0]))
+        repo_ids = array("I")
+        repos: List[str] = []
+        repo_index: Dict[str, int] = {}
+
+        for pkg in packages:
+            for blob, offsets, text in zip(column_blobs, column_offsets,
+                                           (pkg.name, pkg.version, pkg.description)):
+                blob.extend(text.encode("utf-8"))
+                offsets.append(len(blob))
+            if pkg.repo not in repo_index:
+                repo_index[pkg.repo] = len(repos)
+                repos.append(pkg.repo)
+            repo_ids.append(repo_index[pkg.repo])
+
+        base = 0
+        for blob, offsets in zip(column_blobs, column_offsets):
+            if base:
+                offsets[:] = array("I", (offset + base for offset in offsets))
+            base += len(blob)
+
+        count = len(repo_ids)
+        header = json.dumps({
+            "byteorder": sys.byteorder,
+            "repos": repos,
+            "metadata": metadata or {},
+        }).encode("utf-8")
+        header += b" " * (-len(header) % 8)
+
+        tmp_path = Path(str(path) + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, count, len(header)))
+            f.write(header)
+            for offsets in column_offsets:
+                f.write(offsets.tobytes())
+            f.write(repo_ids.tobytes())
+            for blob in column_blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "ColumnarCatalog":
+        """
+        Map a catalog file into memory.
+
+        Args:
+            path (Union[str, Path]): Catalog file
+
+        Returns:
+            ColumnarCatalog: The mapped catalog
+
+        Raises:
+            OSError: If the file can't be opened or mapped
+            CatalogFormatError: If the file is not a valid catalog
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _PREAMBLE.size:
+                raise CatalogFormatError("catalog file is truncated")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count, header_len = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            buffer.close()
+            raise CatalogFormatError("not a Shroomie catalog file")
+        try:
+            header = json.loads(buffer[_PREAMBLE.size:_PREAMBLE.size + header_len])
+        except ValueError as e:
+            buffer.close()
+            raise CatalogFormatError(f"corrupt catalog header: {e}") from e
+
+        columns_start = _PREAMBLE.size + header_len
+        if header.get("byteorder") != sys.byteorder or \
+                size < columns_start + (4 * count + 3) * 4:
+            buffer.close()
+            raise CatalogFormatError("catalog written on another platform or truncated")
+        return cls(buffer, header.get("metadata", {}), header.get("repos", []),
+                   count, columns_start)
+
+    def _string(self, column: memoryview, index: int) -> str:
+        """Decode the string stored at ``index`` of an offset column."""
+        if not 0 <= index < self._count:
+            raise IndexError("catalog index out of range")
+        start = self._blob_start + column[index]
+        end = self._blob_start + column[index + 1]
+        return str(self._buffer[start:end], "utf-8")
+
+    def name(self, index: int) -> str:
+        """Get the name of the package at ``index``."""
+        return self._string(self._names, index)
+
+    def version(self, index: int) -> str:
+        """Get the version of the package at ``index``."""
+        return self._string(self._versions, index)
+
+    def description(self, index: int) -> str:
+        """Get the description of the package at ``index``."""
+        return self._string(self._descriptions, index)
+
+    def repo(self, index: int) -> str:
+        """Get the repository of the package at ``index``."""
+        return self.repos[self._repo_ids[index]]
+
+    def names(self) -> Iterator[str]:
+        """Iterate over all package names in catalog order."""
+        for index in range(self._count):
+            yield self.name(index)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> PackageView:
+        if isinstance(index, slice):
+            return [PackageView(self, i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("catalog index out of range")
+        return PackageView(self, index)
+
+    def close(self) -> None:
+        """Release the mapping. Views taken from the catalog become invalid."""
+        for column in (self._names, self._versions, self._descriptions, self._repo_ids):
+            column.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
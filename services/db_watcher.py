@@ -0,0 +1,174 @@
+"""
+Database Watcher Module
+Detects packages installed or removed outside Shroomie.
+
+Watches pacman's local database directory and its ``db.lck`` lock file,
+with inotify when available and by polling otherwise. Events are held
+back while a transaction holds the lock and are grouped into one change
+set once the database has been quiet for a moment. A lock left behind by
+a crashed or killed pacman is treated as stale once nothing has changed
+for a long time, so changes are still delivered.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Set
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from services.aur_storage import AurPackageStorage
+from services.local_db import Fingerprint, LocalDatabase, split_entry_name
+from utils.inotify import (Inotify, IN_ATTRIB, IN_CLOSE_WRITE, IN_CREATE, IN_DELETE,
+                           IN_DELETE_SELF, IN_MOVED_FROM, IN_MOVED_TO, IN_Q_OVERFLOW)
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+LOCK_FILE = "db.lck"
+
+LOCAL_DIR_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ATTRIB
+DB_ROOT_MASK = IN_CREATE | IN_DELETE | IN_CLOSE_WRITE | IN_DELETE_SELF
+
+
+class PackageDbWatcher(QThread):
+    """
+    Background watcher for the pacman local database.
+
+    When a burst of changes has settled and no transaction is running,
+    ``changesDetected`` is emitted with the affected package names and the
+    shared storage is resynced, which emits
+    ``AurPackageStorage.packagesChanged`` for the foreign packages that
+    actually changed.
+
+    Attributes:
+        QUIET_PERIOD (float): Seconds without events before a change set
+            is delivered
+        POLL_INTERVAL (float): Seconds between scans in polling mode
+        STALE_LOCK_TIMEOUT (float): Seconds without events after which
+            ``db.lck`` is assumed to be left over from a dead transaction
+    """
+
+    changesDetected = pyqtSignal(list)  # Names of the affected packages
+
+    QUIET_PERIOD = 0.5
+    POLL_INTERVAL = 2.0
+    STALE_LOCK_TIMEOUT = 600.0
+
+    def __init__(self, storage: Optional[AurPackageStorage] = None,
+                 local_db: Optional[LocalDatabase] = None, parent=None) -> None:
+        super().__init__(parent)
+        self.storage = storage or AurPackageStorage.instance()
+        self.local_db = local_db or self.storage.local_db
+        self.lock_path = self.local_db.db_root / LOCK_FILE
+        self._stop_event = threading.Event()
+        self._stale_lock: Optional[Fingerprint] = None  # lock file declared stale
+
+        # Slot runs on the GUI thread, where the storage lives
+        self.changesDetected.connect(self._sync_storage)
+
+    def stop(self) -> None:
+        """Ask the watcher loop to exit and wait for it."""
+        self._stop_event.set()
+        self.wait()
+
+    def run(self) -> None:
+        """Watch the database until stopped."""
+        try:
+            inotify = self._open_inotify()
+        except OSError as e:
+            logger.warning(f"inotify unavailable ({e}), polling the package database")
+            self._poll_loop()
+            return
+
+        try:
+            self._inotify_loop(inotify)
+        finally:
+            inotify.close()
+
+    def _open_inotify(self) -> Inotify:
+        """Watch the database directories, closing the instance if a watch fails."""
+        inotify = Inotify()
+        try:
+            inotify.add_watch(str(self.local_db.local_dir), LOCAL_DIR_MASK)
+            inotify.add_watch(str(self.local_db.db_root), DB_ROOT_MASK)
+        except OSError:
+            inotify.close()
+            raise
+        return inotify
+
+    def _inotify_loop(self, inotify: Inotify) -> None:
+        """Collect inotify events into change sets."""
+        local_dir = str(self.local_db.local_dir)
+        pending: Set[str] = set()
+        dirty = False
+        last_event = 0.0
+
+        while not self._stop_event.is_set():
+            for event in inotify.read_events(timeout=self.QUIET_PERIOD / 2):
+                dirty = True
+                last_event = time.monotonic()
+                if event.mask & IN_Q_OVERFLOW:
+                    logger.warning("inotify queue overflowed, change set may be incomplete")
+                elif event.path == local_dir and event.name:
+                    pending.add(split_entry_name(event.name))
+
+            if dirty and self._is_settled(last_event):
+                self.changesDetected.emit(sorted(pending))
+                pending = set()
+                dirty = False
+
+    def _poll_loop(self) -> None:
+        """Detect changes by comparing entry fingerprints."""
+        previous = self._scan()
+        pending: Set[str] = set()
+        dirty = False
+        last_event = 0.0
+
+        while not self._stop_event.wait(self.POLL_INTERVAL if not dirty else self.QUIET_PERIOD / 2):
+            current = self._scan()
+            if current != previous:
+                changed = {
+                    entry for entry in current.keys() | previous.keys()
+                    if current.get(entry) != previous.get(entry)
+                }
+                pending.update(split_entry_name(entry) for entry in changed)
+                previous = current
+                dirty = True
+                last_event = time.monotonic()
+
+            if dirty and self._is_settled(last_event):
+                self.changesDetected.emit(sorted(pending))
+                pending = set()
+                dirty = False
+
+    def _scan(self) -> Dict[str, Fingerprint]:
+        """Fingerprint the local database, tolerating transient errors."""
+        try:
+            return self.local_db.scan_fingerprints()
+        except OSError:
+            return {}
+
+    def _is_settled(self, last_event: float) -> bool:
+        """Check that no transaction runs and events have stopped."""
+        quiet = time.monotonic() - last_event
+        try:
+            st = os.stat(self.lock_path)
+        except OSError:
+            self._stale_lock = None
+            return quiet >= self.QUIET_PERIOD
+
+        lock = (st.st_mtime_ns, st.st_ino)
+        if lock == self._stale_lock:
+            return quiet >= self.QUIET_PERIOD
+        if quiet < self.STALE_LOCK_TIMEOUT:
+            return False
+        logger.warning(f"No database changes for {quiet:.0f} s while {self.lock_path} exists, "
+                       "treating the lock as stale")
+        self._stale_lock = lock
+        return True
+
+    def _sync_storage(self, names: list) -> None:
+        """Resync storage after an external change."""
+        logger.info(f"Package database changed: {', '.join(names) or 'lock released'}")
+        self.storage.sync_async()
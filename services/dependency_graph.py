@@ -0,0 +1,367 @@
+"""
+Dependency Graph Module
+In-memory dependency graph of installed and repository packages.
+
+Every package name in the local and sync databases becomes an integer
+node id. Installed packages take their fields from the local database,
+the others from the sync databases. ``%DEPENDS%`` and ``%OPTDEPENDS%``
+entries are reduced to the name they ask for, without version
+constraints. They are satisfied by the package of that name or by any
+package that lists the name under ``%PROVIDES%``.
+
+Edges are stored as compressed adjacency arrays: an offsets array per
+relation and one flat array of targets. Looking up a package's direct
+dependencies or the installed packages that require it is a slice.
+Transitive closures are computed on first use and memoized.
+"""
+
+import re
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from services.local_db import DescFields, Fingerprint, LocalDatabase, SyncFingerprint
+from services.sync_db import SyncDatabase
+from utils.logger import Logger
+from utils.tar_reader import TarReadError
+
+logger = Logger.get_logger(__name__)
+
+# "foo>=1.2", "foo=1.2-3", "foo: optional feature"
+_VERSION_CONSTRAINT = re.compile(r"[<>=:]")
+
+
+def dependency_name(entry: str) -> str:
+    """
+    Strip the version constraint and description from a dependency entry.
+
+    Args:
+        entry (str): Entry of ``%DEPENDS%``, ``%OPTDEPENDS%`` or ``%PROVIDES%``
+
+    Returns:
+        str: Name the entry refers to
+    """
+    return _VERSION_CONSTRAINT.split(entry, 1)[0].strip()
+
+
+class _Adjacency:
+    """Compressed adjacency arrays: the targets of node ``n`` are ``targets[offsets[n]:offsets[n + 1]]``."""
+
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, lists: Sequence[Iterable[int]]) -> None:
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+        for items in lists:
+            self.targets.extend(items)
+            self.offsets.append(len(self.targets))
+
+    def __getitem__(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    @classmethod
+    def reverse(cls, forward: "_Adjacency", size: int) -> "_Adjacency":
+        """Adjacency with every edge of ``forward`` turned around."""
+        lists: List[List[int]] = [[] for _ in range(size)]
+        for source in range(len(forward.offsets) - 1):
+            for target in forward[source]:
+                lists[target].append(source)
+        return cls(lists)
+
+
+@dataclass
+class RemovalPreview:
+    """
+    What removing a set of packages would do.
+
+    Attributes:
+        targets (List[str]): Packages to remove
+        broken (Dict[str, List[str]]): Installed packages that would lose
+            a dependency, with the targets they need
+        unneeded (List[str]): Packages installed as dependencies that
+            nothing would need any more, as ``pacman -Rs`` would remove them
+    """
+    targets: List[str]
+    broken: Dict[str, List[str]] = field(default_factory=dict)
+    unneeded: List[str] = field(default_factory=list)
+
+    @property
+    def safe(self) -> bool:
+        """Whether the removal leaves every remaining package's dependencies satisfied."""
+        return not self.broken
+
+
+class DependencyGraph:
+    """
+    Dependency relations between packages, addressed by integer node ids.
+
+    Attributes:
+        names (List[str]): Package name of every node
+        installed (bytearray): 1 for installed nodes
+        explicit (bytearray): 1 for nodes installed explicitly rather
+            than as a dependency
+    """
+
+    def __init__(self, packages: Iterable[Tuple[DescFields, bool]]) -> None:
+        """
+        Build the graph.
+
+        Args:
+            packages (Iterable[Tuple[DescFields, bool]]): Parsed ``desc``
+                fields of each package and whether they come from the
+                local database. Installed entries must come first; later
+                entries with the same name are ignored.
+        """
+        self.names: List[str] = []
+        self.installed = bytearray()
+        self.explicit = bytearray()
+        self._ids: Dict[str, int] = {}
+        depends: List[List[str]] = []
+        optdepends: List[List[str]] = []
+        provides: List[List[str]] = []
+
+        for fields, local in packages:
+            name = (fields.get("NAME") or [""])[0]
+            if not name or name in self._ids:
+                continue
+            self._ids[name] = len(self.names)
+            self.names.append(name)
+            self.installed.append(local)
+            self.explicit.append(local and fields.get("REASON", ["0"])[0] != "1")
+            depends.append([dependency_name(entry) for entry in fields.get("DEPENDS", [])])
+            optdepends.append([dependency_name(entry) for entry in fields.get("OPTDEPENDS", [])])
+            provides.append([dependency_name(entry) for entry in fields.get("PROVIDES", [])])
+
+        # Every name a package can be depended on by, installed providers first
+        satisfiers: Dict[str, List[int]] = {}
+        for node, name in enumerate(self.names):
+            satisfiers.setdefault(name, []).append(node)
+        for node, provided in enumerate(provides):
+            for name in provided:
+                nodes = satisfiers.setdefault(name, [])
+                if node not in nodes:
+                    nodes.append(node)
+        for nodes in satisfiers.values():
+            nodes.sort(key=lambda node: not self.installed[node])
+        self._satisfiers = satisfiers
+
+        size = len(self.names)
+        self._depends = _Adjacency([self._resolve(names) for names in depends])
+        self._optdepends = _Adjacency([self._resolve(names) for names in optdepends])
+        # An installed package is required by every installed package that
+        # depends on a name it satisfies, whichever provider was picked
+        required_by: List[List[int]] = [[] for _ in range(size)]
+        for node, names in enumerate(depends):
+            if not self.installed[node]:
+                continue
+            providers = {provider for name in names for provider in satisfiers.get(name, ())}
+            for provider in sorted(providers):
+                if self.installed[provider] and provider != node:
+                    required_by[provider].append(node)
+        self._required_by = _Adjacency(required_by)
+        self._optional_for = _Adjacency.reverse(self._optdepends, size)
+        self._depends_on: List[List[str]] = depends
+        self._dependency_closures: Dict[int, FrozenSet[int]] = {}
+        self._dependent_closures: Dict[int, FrozenSet[int]] = {}
+
+    @classmethod
+    def load(cls, local_db: Optional[LocalDatabase] = None,
+             sync_db: Optional[SyncDatabase] = None) -> "DependencyGraph":
+        """
+        Build the graph from the pacman databases on disk.
+
+        Sync databases that can't be read are logged and skipped.
+
+        Args:
+            local_db (Optional[LocalDatabase]): Installed packages
+            sync_db (Optional[SyncDatabase]): Repository packages
+
+        Returns:
+            DependencyGraph: Graph over both databases
+        """
+        local_db = local_db or LocalDatabase()
+        sync_db = sync_db or SyncDatabase()
+
+        def records():
+            for entry in local_db.iter_entries():
+                fields = local_db.read_entry(entry.name)
+                if fields:
+                    yield fields, True
+            for db_path in sync_db.db_paths():
+                try:
+                    for fields in sync_db.iter_records(db_path):
+                        yield fields, False
+                except (OSError, TarReadError) as e:
+                    logger.warning(f"Skipping sync database {db_path.name}: {e}")
+
+        return cls(records())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def node(self, name: str) -> Optional[int]:
+        """Node id of a package, None if it's in neither database."""
+        return self._ids.get(name)
+
+    def dependencies(self, node: int) -> List[int]:
+        """Packages a package directly depends on, one provider per dependency."""
+        return list(self._depends[node])
+
+    def optional_dependencies(self, node: int) -> List[int]:
+        """Packages a package can optionally use."""
+        return list(self._optdepends[node])
+
+    def required_by(self, node: int) -> List[int]:
+        """Installed packages that directly depend on an installed package."""
+        return list(self._required_by[node])
+
+    def optional_for(self, node: int) -> List[int]:
+        """Packages that list a package as an optional dependency."""
+        return list(self._optional_for[node])
+
+    def dependency_closure(self, node: int) -> FrozenSet[int]:
+        """Every package a package needs, directly or not. Memoized."""
+        closure = self._dependency_closures.get(node)
+        if closure is None:
+            closure = self._dependency_closures[node] = self._closure(node, self._depends)
+        return closure
+
+    def dependent_closure(self, node: int) -> FrozenSet[int]:
+        """Every installed package that needs a package, directly or not. Memoized."""
+        closure = self._dependent_closures.get(node)
+        if closure is None:
+            closure = self._dependent_closures[node] = self._closure(node, self._required_by)
+        return closure
+
+    def removal_preview(self, names: Iterable[str]) -> RemovalPreview:
+        """
+        Check what removing packages would break or leave unneeded.
+
+        Args:
+            names (Iterable[str]): Packages to remove
+
+        Returns:
+            RemovalPreview: Broken dependents and unneeded dependencies
+        """
+        targets = list(dict.fromkeys(names))
+        removed = {self._ids[name] for name in targets if name in self._ids}
+        preview = RemovalPreview(targets)
+
+        for node in sorted(removed):
+            for dependent in self._required_by[node]:
+                if dependent in removed:
+                    continue
+                # Broken only if no installed provider outside the removal is left
+                for name in self._depends_on[dependent]:
+                    providers = [p for p in self._satisfiers.get(name, ()) if self.installed[p]]
+                    if node in providers and all(p in removed for p in providers):
+                        needed = preview.broken.setdefault(self.names[dependent], [])
+                        if self.names[node] not in needed:
+                            needed.append(self.names[node])
+
+        # Dependencies that only the removed packages needed, repeated
+        # until no more are found
+        candidates = set()
+        for node in removed:
+            candidates |= self.dependency_closure(node)
+        candidates = {node for node in candidates
+                      if self.installed[node] and not self.explicit[node]}
+        unneeded = set(removed)
+        changed = True
+        while changed:
+            changed = False
+            for node in candidates - unneeded:
+                if all(dependent in unneeded for dependent in self._required_by[node]):
+                    unneeded.add(node)
+                    changed = True
+        preview.unneeded = sorted(self.names[node] for node in unneeded - removed)
+        return preview
+
+    def cascade_removal(self, names: Iterable[str]) -> RemovalPreview:
+        """
+        Preview a cascading removal, as ``pacman -Rcs`` would do it.
+
+        Installed packages left with a missing dependency are added to the
+        targets until nothing breaks any more.
+
+        Args:
+            names (Iterable[str]): Packages to remove
+
+        Returns:
+            RemovalPreview: Preview whose targets include every dependent
+            that has to go too
+        """
+        preview = self.removal_preview(names)
+        while not preview.safe:
+            preview = self.removal_preview(preview.targets + sorted(preview.broken))
+        return preview
+
+    def _resolve(self, names: Iterable[str]) -> List[int]:
+        """Pick one provider per dependency name, preferring installed ones."""
+        nodes: List[int] = []
+        for name in names:
+            providers = self._satisfiers.get(name)
+            if providers and providers[0] not in nodes:
+                nodes.append(providers[0])
+        return nodes
+
+    @staticmethod
+    def _closure(start: int, adjacency: _Adjacency) -> FrozenSet[int]:
+        """Nodes reachable from ``start``, not counting ``start`` itself."""
+        seen = {start}
+        stack = [start]
+        while stack:
+            for target in adjacency[stack.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        seen.discard(start)
+        return frozenset(seen)
+
+
+class DependencyGraphCache:
+    """
+    Shared dependency graph, rebuilt when a pacman database changes.
+
+    Use :meth:`instance` to get the shared cache. Safe to call from
+    worker threads.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "DependencyGraphCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, local_db: Optional[LocalDatabase] = None,
+                 sync_db: Optional[SyncDatabase] = None) -> None:
+        self.local_db = local_db or LocalDatabase()
+        self.sync_db = sync_db or SyncDatabase()
+        self._lock = threading.Lock()
+        self._graph: Optional[DependencyGraph] = None
+        self._fingerprint: Optional[Tuple[Dict[str, Fingerprint], SyncFingerprint]] = None
+
+    def get_graph(self) -> DependencyGraph:
+        """
+        Get the graph, rebuilding it if an installed package or sync
+        database changed since it was built.
+
+        Returns:
+            DependencyGraph: Current dependency graph
+        """
+        with self._lock:
+            fingerprint = (self.local_db.scan_fingerprints(), self.sync_db.fingerprint())
+            if self._graph is None or fingerprint != self._fingerprint:
+                started = time.perf_counter()
+                self._graph = DependencyGraph.load(self.local_db, self.sync_db)
+                self._fingerprint = fingerprint
+                logger.info(f"Built dependency graph of {len(self._graph)} packages in "
+                            f"{(time.perf_counter() - started) * 1000:.0f} ms")
+            return self._graph
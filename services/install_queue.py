@@ -0,0 +1,192 @@
+"""
+Install Queue Module
+Installs queued packages in as few transactions as possible.
+
+Packages queued while nothing is installing start a batch right away;
+packages queued during a batch wait for the next one. A batch installs
+all of its official repo packages with one ``pacman -S`` and all of its
+AUR packages with one ``yay -S``, so dependencies are resolved, the
+password is asked for and the database is locked once per tool rather
+than once per package. The status of every package and the progress of
+the batch are followed from the command output as it streams in, and
+the output of every transaction is archived by the LogArchive.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from PyQt6.QtCore import QObject, QProcess, pyqtSignal
+
+from services.log_archive import LogArchive, LogWriter
+from utils.logger import Logger
+from utils.progress_parser import (ErrorEvent, OutputLine, ProgressParser, StepEvent,
+                                   INSTALLING as INSTALLING_PHASE)
+
+logger = Logger.get_logger(__name__)
+
+# Package states reported through InstallQueue.statusChanged
+QUEUED = "queued"
+INSTALLING = "installing"
+INSTALLED = "installed"
+FAILED = "failed"
+
+
+class InstallQueue(QObject):
+    """
+    Queue of packages waiting to be installed.
+
+    Attributes:
+        OFFICIAL_REPOS (tuple): Repos installed with pacman instead of yay
+        status (Dict[str, str]): Current state of every queued package of
+            the current or last batch
+    """
+
+    statusChanged = pyqtSignal(str, str)  # package name, state
+    outputReceived = pyqtSignal(str)  # one line of command output
+    progressChanged = pyqtSignal(int, str)  # percent of the batch done, current phase
+    logArchived = pyqtSignal(str)  # path of a finished transaction's log
+    batchStarted = pyqtSignal(list)  # names of the packages in the batch
+    batchFinished = pyqtSignal(list, list)  # installed packages, names of failed ones
+
+    OFFICIAL_REPOS = ("core", "extra")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.status: Dict[str, str] = {}
+        self._pending: List = []
+        self._batch: List = []
+        self._steps: List[tuple] = []  # (program, arguments, packages) still to run
+        self._step_packages: List = []
+        self._committed: Set[str] = set()  # reached pacman's commit phase
+        self._missing: Set[str] = set()  # rejected as unknown targets
+        self._process: Optional[QProcess] = None
+        self._parser: Optional[ProgressParser] = None
+        self._log: Optional[LogWriter] = None
+        self._step_count = 0
+        self._progress = (0, "")
+
+    @property
+    def busy(self) -> bool:
+        """Whether a batch is running."""
+        return bool(self._batch)
+
+    def enqueue(self, packages: List) -> None:
+        """
+        Queue packages, starting a batch if none is running.
+
+        Packages already waiting or installing are skipped.
+
+        Args:
+            packages (List): Packages to install
+        """
+        waiting = {pkg.name for pkg in self._pending} | {pkg.name for pkg in self._batch}
+        for pkg in packages:
+            if pkg.name in waiting:
+                continue
+            waiting.add(pkg.name)
+            self._pending.append(pkg)
+            self._set_status(pkg.name, QUEUED)
+        if not self.busy:
+            self._start_batch()
+
+    def is_official(self, pkg) -> bool:
+        """Check whether a package is installed with pacman."""
+        return pkg.repo in self.OFFICIAL_REPOS
+
+    def _start_batch(self) -> None:
+        """Turn the pending packages into a batch of at most two transactions."""
+        if not self._pending:
+            return
+        self._batch, self._pending = self._pending, []
+        self.status = {pkg.name: self.status[pkg.name] for pkg in self._batch}
+        official = [pkg for pkg in self._batch if self.is_official(pkg)]
+        aur = [pkg for pkg in self._batch if not self.is_official(pkg)]
+        self._steps = []
+        if official:
+            self._steps.append(("sudo", ["pacman", "-S", "--noconfirm"], official))
+        if aur:
+            self._steps.append(("yay", ["-S", "--noconfirm"], aur))
+        self._step_count = len(self._steps)
+        self._progress = (0, "")
+
+        names = [pkg.name for pkg in self._batch]
+        logger.info(f"Installing {len(official)} repo and {len(aur)} AUR packages: {' '.join(names)}")
+        self.batchStarted.emit(names)
+        self._run_next_step()
+
+    def _run_next_step(self) -> None:
+        """Start the next transaction of the batch, or finish it."""
+        if not self._steps:
+            self._finish_batch()
+            return
+        program, arguments, packages = self._steps.pop(0)
+        self._step_packages = packages
+        for pkg in packages:
+            self._set_status(pkg.name, INSTALLING)
+
+        self._parser = ProgressParser(len(packages))
+        command = [program] + arguments + [pkg.name for pkg in packages]
+        self._log = LogArchive.instance().create(" ".join(command))
+        self._committed.clear()
+        self._missing.clear()
+        self._process = QProcess(self)
+        self._process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self._process.readyReadStandardOutput.connect(self._read_output)
+        self._process.finished.connect(self._step_finished)
+        self._process.errorOccurred.connect(self._step_error)
+        self._process.start(command[0], command[1:])
+
+    def _read_output(self) -> None:
+        """Parse the output read so far."""
+        self._handle_events(self._parser.feed(self._process.readAllStandardOutput().data()))
+
+    def _handle_events(self, events: List) -> None:
+        """Follow per-package state and batch progress through parsed output."""
+        self._log.add_events(events)
+        for event in events:
+            if isinstance(event, OutputLine):
+                self.outputReceived.emit(event.text)
+            elif isinstance(event, StepEvent) and event.phase == INSTALLING_PHASE and event.target:
+                self._committed.add(event.target)
+            elif isinstance(event, ErrorEvent) and event.target:
+                self._missing.add(event.target)
+        done = self._step_count - len(self._steps) - 1
+        percent = int((done + self._parser.progress) * 100 / self._step_count)
+        progress = (percent, self._parser.describe())
+        if progress != self._progress:
+            self._progress = progress
+            self.progressChanged.emit(*progress)
+
+    def _step_finished(self, exit_code: int, exit_status=None) -> None:
+        """Settle the status of every package of the finished transaction."""
+        self._handle_events(self._parser.finish())
+        succeeded = exit_code == 0 and self._process.exitStatus() == QProcess.ExitStatus.NormalExit
+        for pkg in self._step_packages:
+            # A failed run may still have committed some packages, e.g. when
+            # yay installs what it built before a later build fails
+            installed = pkg.name in self._committed or (succeeded and pkg.name not in self._missing)
+            self._set_status(pkg.name, INSTALLED if installed else FAILED)
+        log, self._log = self._log, None
+        self.logArchived.emit(str(log.close(exit_code).path))
+        self._process.deleteLater()
+        self._process = None
+        self._run_next_step()
+
+    def _step_error(self, error: QProcess.ProcessError) -> None:
+        """Fail the transaction if its command could not be started."""
+        if error == QProcess.ProcessError.FailedToStart:
+            message = f"error: could not start {self._process.program()}\n"
+            self._handle_events(self._parser.feed(message.encode()))
+            self._step_finished(-1)
+
+    def _finish_batch(self) -> None:
+        """Report the batch and start the next one if packages were queued meanwhile."""
+        installed = [pkg for pkg in self._batch if self.status.get(pkg.name) == INSTALLED]
+        failed = [pkg.name for pkg in self._batch if self.status.get(pkg.name) != INSTALLED]
+        self._batch = []
+        logger.info(f"Installed {len(installed)} packages, {len(failed)} failed")
+        self.batchFinished.emit(installed, failed)
+        self._start_batch()
+
+    def _set_status(self, name: str, state: str) -> None:
+        self.status[name] = state
+        self.statusChanged.emit(name, state)
@@ -0,0 +1,314 @@
+"""
+Job Runner Module
+Runs blocking work off the GUI thread on a small pool of worker threads.
+
+Jobs are either external commands or Python callables. They wait in one
+priority queue and are picked up by a bounded set of workers, so a burst
+of requests never starts more than ``MAX_WORKERS`` processes at once.
+Results come back on the GUI thread through Qt signals and the job's own
+callback. Commands can be given a timeout and can be cancelled while
+they wait or while they run; a callable can only be cancelled before it
+starts.
+"""
+
+import heapq
+import itertools
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QObject, QThread, pyqtSignal
+
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class JobPriority(IntEnum):
+    """Order in which queued jobs are started; lower runs first."""
+    HIGH = 0     # The user is waiting on it
+    NORMAL = 1
+    LOW = 2      # Background refreshes
+
+
+@dataclass
+class JobResult:
+    """
+    Outcome of a job.
+
+    Attributes:
+        job_id (int): Id returned when the job was submitted
+        name (str): Job name, for logging
+        returncode (Optional[int]): Exit status of a command job
+        stdout (str): Standard output of a command job
+        stderr (str): Standard error of a command job
+        value (Any): Return value of a callable job
+        error (Optional[str]): Why the job failed to run, if it did
+        timed_out (bool): Whether the command was killed for running too long
+        cancelled (bool): Whether the job was cancelled
+        elapsed (float): Run time in seconds, excluding time in the queue
+    """
+
+    job_id: int
+    name: str
+    returncode: Optional[int] = None
+    stdout: str = ""
+    stderr: str = ""
+    value: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    cancelled: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the job ran to completion and, for commands, exited with 0."""
+        if self.error is not None or self.timed_out or self.cancelled:
+            return False
+        return self.returncode in (None, 0)
+
+
+@dataclass
+class _Job:
+    """A queued or running job."""
+
+    job_id: int
+    name: str
+    priority: int
+    args: Optional[List[str]] = None
+    func: Optional[Callable[[], Any]] = None
+    input: Optional[str] = None
+    timeout: Optional[float] = None
+    on_finished: Optional[Callable[[JobResult], None]] = None
+    cancelled: bool = False
+    process: Optional[subprocess.Popen] = field(default=None, repr=False)
+
+
+class _JobWorker(QThread):
+    """Takes jobs off the runner's queue until the runner shuts down."""
+
+    def __init__(self, runner: "JobRunner") -> None:
+        super().__init__()
+        self.runner = runner
+
+    def run(self) -> None:
+        while True:
+            job = self.runner._next_job()
+            if job is None:
+                return
+            started = time.perf_counter()
+            result = JobResult(job.job_id, job.name)
+            try:
+                if job.args is not None:
+                    self._run_command(job, result)
+                elif not job.cancelled:
+                    result.value = job.func()
+            except Exception as e:
+                result.error = str(e)
+            result.cancelled = job.cancelled
+            result.elapsed = time.perf_counter() - started
+            self.runner._job_done.emit(result)
+
+    def _run_command(self, job: _Job, result: JobResult) -> None:
+        """Run a command job, killing it on timeout."""
+        with self.runner._lock:
+            if job.cancelled:
+                return
+            job.process = subprocess.Popen(
+                job.args, text=True,
+                stdin=subprocess.PIPE if job.input is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        try:
+            result.stdout, result.stderr = job.process.communicate(job.input, timeout=job.timeout)
+        except subprocess.TimeoutExpired:
+            job.process.kill()
+            result.stdout, result.stderr = job.process.communicate()
+            result.timed_out = True
+        result.returncode = job.process.returncode
+
+
+class JobRunner(QObject):
+    """
+    Bounded worker pool for blocking commands and calls.
+
+    Use :meth:`instance` to get the shared runner.
+
+    Attributes:
+        MAX_WORKERS (int): Upper bound on concurrently running jobs
+    """
+
+    jobFinished = pyqtSignal(object)  # JobResult
+    _job_done = pyqtSignal(object)  # JobResult, from a worker thread
+
+    MAX_WORKERS = 4
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "JobRunner":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._queue: List[tuple] = []  # (priority, sequence, job)
+        self._jobs: Dict[int, _Job] = {}
+        self._ids = itertools.count(1)
+        self._workers: List[_JobWorker] = []
+        self._idle = 0
+        self._stopped = False
+
+        # Queued to the GUI thread, where callbacks and jobFinished run
+        self._job_done.connect(self._deliver)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def run_command(self, args: List[str], name: Optional[str] = None,
+                    priority: JobPriority = JobPriority.NORMAL,
+                    timeout: Optional[float] = None, input: Optional[str] = None,
+                    on_finished: Optional[Callable[[JobResult], None]] = None) -> int:
+        """
+        Queue an external command.
+
+        Args:
+            args (List[str]): Command and arguments
+            name (Optional[str]): Job name for logging, the command by default
+            priority (JobPriority): Queue priority
+            timeout (Optional[float]): Seconds before the command is killed
+            input (Optional[str]): Text written to the command's stdin
+            on_finished (Optional[Callable]): Called with the JobResult on
+                the GUI thread
+
+        Returns:
+            int: Job id, for :meth:`cancel`
+        """
+        return self._submit(_Job(0, name or " ".join(args), priority, args=args,
+                                 input=input, timeout=timeout, on_finished=on_finished))
+
+    def run_call(self, func: Callable[[], Any], name: Optional[str] = None,
+                 priority: JobPriority = JobPriority.NORMAL,
+                 on_finished: Optional[Callable[[JobResult], None]] = None) -> int:
+        """
+        Queue a Python callable; its return value ends up in ``JobResult.value``.
+
+        Args:
+            func (Callable): Function to call without arguments
+            name (Optional[str]): Job name for logging
+            priority (JobPriority): Queue priority
+            on_finished (Optional[Callable]): Called with the JobResult on
+                the GUI thread
+
+        Returns:
+            int: Job id, for :meth:`cancel`
+        """
+        return self._submit(_Job(0, name or getattr(func, "__name__", "call"), priority,
+                                 func=func, on_finished=on_finished))
+
+    def run_and_wait(self, args: List[str], timeout: Optional[float] = None,
+                     input: Optional[str] = None) -> JobResult:
+        """
+        Run a command at high priority and wait for it without freezing the GUI.
+
+        The window keeps repainting while waiting, but user input is held
+        back, so callers that need the result before they can continue
+        aren't re-entered.
+
+        Args:
+            args (List[str]): Command and arguments
+            timeout (Optional[float]): Seconds before the command is killed
+            input (Optional[str]): Text written to the command's stdin
+
+        Returns:
+            JobResult: Outcome of the command
+        """
+        loop = QEventLoop()
+        results: List[JobResult] = []
+
+        def finished(result: JobResult) -> None:
+            results.append(result)
+            loop.quit()
+
+        self.run_command(args, name=args[0], priority=JobPriority.HIGH,
+                         timeout=timeout, input=input, on_finished=finished)
+        if not results:
+            loop.exec(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+        return results[0]
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancel a job. A queued job never starts; a running command is
+        terminated. Its callback still runs, with ``cancelled`` set.
+
+        Args:
+            job_id (int): Id returned on submission
+
+        Returns:
+            bool: False if the job already finished
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            job.cancelled = True
+            if job.process is not None and job.process.poll() is None:
+                job.process.terminate()
+        return True
+
+    def shutdown(self) -> None:
+        """Cancel every job and stop the workers."""
+        with self._lock:
+            self._stopped = True
+            for job in self._jobs.values():
+                job.cancelled = True
+                if job.process is not None and job.process.poll() is None:
+                    job.process.terminate()
+            self._wakeup.notify_all()
+        for worker in self._workers:
+            worker.wait()
+
+    def _submit(self, job: _Job) -> int:
+        """Queue a job, starting another worker if none is idle."""
+        with self._lock:
+            job.job_id = next(self._ids)
+            self._jobs[job.job_id] = job
+            heapq.heappush(self._queue, (job.priority, job.job_id, job))
+            if len(self._queue) > self._idle and len(self._workers) < self.MAX_WORKERS:
+                worker = _JobWorker(self)
+                self._workers.append(worker)
+                worker.start()
+            self._wakeup.notify()
+        return job.job_id
+
+    def _next_job(self) -> Optional[_Job]:
+        """Block until a job is queued; None once the runner shuts down."""
+        with self._lock:
+            self._idle += 1
+            while not self._queue and not self._stopped:
+                self._wakeup.wait()
+            self._idle -= 1
+            if self._stopped:
+                return None
+            return heapq.heappop(self._queue)[2]
+
+    def _deliver(self, result: JobResult) -> None:
+        """Hand a result to its callback and listeners on the GUI thread."""
+        with self._lock:
+            job = self._jobs.pop(result.job_id, None)
+        if result.timed_out:
+            logger.warning(f"Job '{result.name}' timed out after {result.elapsed:.1f} s")
+        elif result.error is not None:
+            logger.error(f"Job '{result.name}' failed: {result.error}")
+        else:
+            logger.debug(f"Job '{result.name}' finished in {result.elapsed * 1000:.0f} ms")
+        if job is not None and job.on_finished is not None:
+            job.on_finished(result)
+        self.jobFinished.emit(result)
@@ -0,0 +1,272 @@
+"""
+Local Database Module
+Reads pacman's local package database directly from disk.
+
+Every installed package owns a ``<name>-<version>`` directory under
+``<db root>/local`` whose ``desc`` file stores its metadata as
+``%FIELD%`` blocks. Parsing those files replaces one ``pacman -Qi``
+subprocess per package with a single directory scan.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from config.app_config import Config
+from models.package import Package
+from utils.logger import Logger
+from utils.tar_reader import iter_members, read_archive
+
+logger = Logger.get_logger(__name__)
+
+DescFields = Dict[str, List[str]]
+
+# (mtime_ns, inode) of an entry's desc file
+Fingerprint = Tuple[int, int]
+
+# (file name, size, mtime_ns) of every sync database
+SyncFingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+def parse_desc(text: str) -> DescFields:
+    """
+    Parse the contents of a pacman ``desc`` file.
+
+    Args:
+        text (str): Raw file contents
+
+    Returns:
+        DescFields: Mapping of field name (without the ``%`` markers)
+            to the list of values listed under it
+    """
+    fields: DescFields = {}
+    current: Optional[List[str]] = None
+    for line in text.splitlines():
+        if len(line) > 2 and line[0] == '%' and line[-1] == '%':
+            current = fields.setdefault(line[1:-1], [])
+        elif not line:
+            current = None
+        elif current is not None:
+            current.append(line)
+    return fields
+
+
+def split_entry_name(entry_name: str) -> str:
+    """
+    Get the package name from a ``<name>-<pkgver>-<pkgrel>`` entry name.
+
+    Args:
+        entry_name (str): Database entry directory name
+
+    Returns:
+        str: Package name
+    """
+    return entry_name.rsplit('-', 2)[0]
+
+
+def sync_fingerprint(sync_dir: Path) -> SyncFingerprint:
+    """
+    Get the name, size and mtime of every database in a sync directory.
+
+    Args:
+        sync_dir (Path): Directory holding the ``*.db`` files
+
+    Returns:
+        SyncFingerprint: One ``(name, size, mtime_ns)`` tuple per database,
+            sorted by name
+    """
+    fingerprint = []
+    for db_path in sorted(sync_dir.glob("*.db")):
+        try:
+            st = db_path.stat()
+        except OSError:
+            continue
+        fingerprint.append((db_path.name, st.st_size, st.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+def package_from_desc(fields: DescFields, repo: str,
+                      status: str = "Not Installed") -> Package:
+    """
+    Build a Package from parsed ``desc`` fields.
+
+    Args:
+        fields (DescFields): Output of :func:`parse_desc`
+        repo (str): Repository name to assign
+        status (str): Package status to assign
+
+    Returns:
+        Package: Package populated from the database entry
+    """
+    def first(key: str, default: str = "") -> str:
+        values = fields.get(key)
+        return values[0] if values else default
+
+    install_date = None
+    if fields.get("INSTALLDATE"):
+        try:
+            install_date = datetime.fromtimestamp(int(first("INSTALLDATE")))
+        except ValueError:
+            install_date = None
+
+    return Package(
+        name=first("NAME"),
+        version=first("VERSION"),
+        repo=repo,
+        description=first("DESC", "No description available"),
+        status=status,
+        install_date=install_date,
+        dependencies=list(fields.get("DEPENDS", [])),
+        maintainer=first("PACKAGER") or None,
+        license=", ".join(fields.get("LICENSE", [])) or None
+    )
+
+
+class LocalDatabase:
+    """
+    Reader for pacman's on-disk local package database.
+
+    Attributes:
+        db_root (Path): Pacman database root (``/var/lib/pacman`` by default)
+        local_dir (Path): Directory holding installed package entries
+        sync_dir (Path): Directory holding the repository databases
+    """
+
+    def __init__(self, db_root: Optional[Union[str, Path]] = None) -> None:
+        self.db_root = Path(db_root) if db_root else Config.PACMAN_DB_DIR
+        self.local_dir = self.db_root / "local"
+        self.sync_dir = self.db_root / "sync"
+
+    def iter_entries(self) -> Iterator[os.DirEntry]:
+        """Yield the directory entries of all installed packages."""
+        with os.scandir(self.local_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry
+
+    def read_entry(self, entry_name: str) -> Optional[DescFields]:
+        """
+        Read and parse the ``desc`` file of a single database entry.
+
+        Args:
+            entry_name (str): Entry directory name (``<name>-<version>``)
+
+        Returns:
+            Optional[DescFields]: Parsed fields, or None if unreadable
+        """
+        try:
+            with open(self.local_dir / entry_name / "desc", encoding="utf-8",
+                      errors="replace") as f:
+                return parse_desc(f.read())
+        except OSError as e:
+            logger.warning(f"Could not read local db entry {entry_name}: {e}")
+            return None
+
+    def read_package(self, entry_name: str,
+                     repo: str = "installed") -> Optional[Package]:
+        """
+        Read a single database entry as an installed Package.
+
+        Args:
+            entry_name (str): Entry directory name (``<name>-<version>``)
+            repo (str): Repository name to assign to the package
+
+        Returns:
+            Optional[Package]: The package, or None if the entry is unreadable
+        """
+        fields = self.read_entry(entry_name)
+        if fields and fields.get("NAME"):
+            return package_from_desc(fields, repo, "Installed")
+        return None
+
+    def scan_fingerprints(self) -> Dict[str, Fingerprint]:
+        """
+        Stat the ``desc`` file of every database entry without reading it.
+
+        Entries without a ``desc`` file (e.g. half-written during a
+        transaction) are left out.
+
+        Returns:
+            Dict[str, Fingerprint]: Entry name to ``(mtime_ns, inode)``
+        """
+        fingerprints: Dict[str, Fingerprint] = {}
+        for entry in self.iter_entries():
+            try:
+                st = os.stat(os.path.join(entry.path, "desc"))
+            except OSError:
+                continue
+            fingerprints[entry.name] = (st.st_mtime_ns, st.st_ino)
+        return fingerprints
+
+    def sync_fingerprint(self) -> SyncFingerprint:
+        """
+        Get the name, size and mtime of every sync database.
+
+        Returns:
+            SyncFingerprint: One ``(name, size, mtime_ns)`` tuple per database
+        """
+        return sync_fingerprint(self.sync_dir)
+
+    def get_packages(self, repo: str = "installed") -> List[Package]:
+        """
+        Get every installed package.
+
+        Args:
+            repo (str): Repository name to assign to the packages
+
+        Returns:
+            List[Package]: Installed packages
+        """
+        return self._read_packages(self.iter_entries(), repo)
+
+    def get_foreign_packages(self, repo: str = "installed") -> List[Package]:
+        """
+        Get installed packages that are not in any sync database.
+
+        This matches ``pacman -Qm``, which is how AUR packages are found.
+
+        Args:
+            repo (str): Repository name to assign to the packages
+
+        Returns:
+            List[Package]: Foreign (AUR) packages
+        """
+        repo_names = self.sync_package_names()
+        entries = (
+            entry for entry in self.iter_entries()
+            if split_entry_name(entry.name) not in repo_names
+        )
+        return self._read_packages(entries, repo)
+
+    def sync_package_names(self) -> Set[str]:
+        """
+        Get the names of all packages listed in the sync databases.
+
+        Only the archive member names are inspected, the ``desc``
+        members themselves are not parsed.
+
+        Returns:
+            Set[str]: Package names available from the configured repos
+
+        Raises:
+            OSError: If a database file can't be read
+            TarReadError: If a database file is corrupt
+        """
+        names: Set[str] = set()
+        for db_path in sorted(self.sync_dir.glob("*.db")):
+            for member_name, _ in iter_members(read_archive(db_path)):
+                entry_name = member_name.split('/', 1)[0]
+                if entry_name:
+                    names.add(split_entry_name(entry_name))
+        return names
+
+    def _read_packages(self, entries: Iterator[os.DirEntry],
+                       repo: str) -> List[Package]:
+        """Parse the given entries into Package objects."""
+        packages: List[Package] = []
+        for entry in entries:
+            pkg = self.read_package(entry.name, repo)
+            if pkg:
+                packages.append(pkg)
+        return packages
@@ -0,0 +1,296 @@
+"""
+Log Archive Module
+Keeps the output of every package transaction on disk.
+
+Each transaction gets a log file made of independent gzip frames, one
+per ``FRAME_BYTES`` of output, so the file is an ordinary gzip stream for
+tools like ``zcat`` while any frame can be decompressed on its own. A
+small JSON sidecar index records where every frame starts and which
+lines it holds, along with the lines where a phase began and the lines
+that reported an error. Jumping to the first error of a huge build log
+then decompresses one frame instead of the whole file.
+
+Logs live under ``Config.LOG_DIR``. Whenever a log is closed the oldest
+logs are deleted until the archive fits in ``Config.LOG_ARCHIVE_MAX_BYTES``.
+"""
+
+import json
+import os
+import re
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config.app_config import Config
+from utils.logger import Logger
+from utils.progress_parser import ErrorEvent, OutputLine, PhaseEvent
+
+logger = Logger.get_logger(__name__)
+
+LOG_SUFFIX = ".log.gz"
+INDEX_SUFFIX = ".idx.json"
+
+
+class ArchivedLog:
+    """
+    Read access to one archived log.
+
+    Attributes:
+        path (Path): Compressed log file
+        index (Dict): Sidecar index; holds ``title``, ``started``,
+            ``finished``, ``exit_code``, ``lines`` and the ``frames``,
+            ``phases`` and ``errors`` lists
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.index: Dict = {"frames": [], "phases": [], "errors": [], "lines": 0}
+        try:
+            with open(index_path(path), encoding="utf-8") as f:
+                self.index.update(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read log index of {path.name}: {e}")
+
+    @property
+    def title(self) -> str:
+        return self.index.get("title", self.path.name)
+
+    @property
+    def line_count(self) -> int:
+        return self.index["lines"]
+
+    @property
+    def errors(self) -> List[Tuple[int, str]]:
+        """Line number and message of each indexed error."""
+        return [tuple(error) for error in self.index["errors"]]
+
+    @property
+    def phases(self) -> List[Tuple[int, str]]:
+        """Line number where each phase began, and the phase."""
+        return [tuple(phase) for phase in self.index["phases"]]
+
+    def first_error(self) -> Optional[Tuple[int, str]]:
+        """Line number and message of the first error, if any."""
+        return self.errors[0] if self.index["errors"] else None
+
+    def size(self) -> int:
+        """Bytes on disk, log and index together."""
+        return sum(p.stat().st_size for p in (self.path, index_path(self.path)) if p.exists())
+
+    def read_lines(self, start: int, count: int) -> List[str]:
+        """
+        Read a range of lines, decompressing only the frames that hold it.
+
+        Args:
+            start (int): First line number, starting at 0
+            count (int): Number of lines to read
+
+        Returns:
+            List[str]: The lines, fewer if the log ends first
+        """
+        start = max(start, 0)
+        end = start + count
+        lines: List[str] = []
+        with open(self.path, "rb") as f:
+            for offset, length, first_line, line_count in self.index["frames"]:
+                if first_line + line_count <= start or first_line >= end:
+                    continue
+                f.seek(offset)
+                text = zlib.decompress(f.read(length), 31).decode("utf-8", errors="replace")
+                frame_lines = text.split("\n")[:line_count]
+                lines.extend(frame_lines[max(start - first_line, 0):end - first_line])
+        return lines
+
+    def delete(self) -> None:
+        """Remove the log and its index."""
+        for p in (self.path, index_path(self.path)):
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class LogWriter:
+    """
+    Appends the output of one transaction to a new archived log.
+
+    Feed it the events of a
+    :class:`~utils.progress_parser.ProgressParser`: output lines are
+    stored, phases and errors are indexed.
+
+    Attributes:
+        FRAME_BYTES (int): Uncompressed output per gzip frame
+        MAX_INDEXED_ERRORS (int): Errors indexed per log; later ones are
+            still stored, just not indexed
+        path (Path): Compressed log file
+    """
+
+    FRAME_BYTES = 256 * 1024
+    MAX_INDEXED_ERRORS = 200
+
+    def __init__(self, archive: "LogArchive", path: Path, title: str) -> None:
+        self.archive = archive
+        self.path = path
+        self.index: Dict = {
+            "title": title, "started": time.time(), "finished": None, "exit_code": None,
+            "lines": 0, "frames": [], "phases": [], "errors": [],
+        }
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._offset = 0
+        self._file = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "wb")
+        except OSError as e:
+            logger.error(f"Could not create log file {path}: {e}")
+
+    def add_events(self, events: Iterable) -> None:
+        """Store the output lines and index the phases and errors among parser events."""
+        for event in events:
+            if isinstance(event, OutputLine):
+                self.write_line(event.text)
+            elif isinstance(event, PhaseEvent):
+                self.index["phases"].append((self.index["lines"], event.phase))
+            elif isinstance(event, ErrorEvent) and len(self.index["errors"]) < self.MAX_INDEXED_ERRORS:
+                # The error's own line follows its event
+                self.index["errors"].append((self.index["lines"], event.message))
+
+    def write_line(self, line: str) -> None:
+        """Append a line, writing a frame once enough output is buffered."""
+        self._buffer.append(line)
+        self._buffered += len(line) + 1
+        self.index["lines"] += 1
+        if self._buffered >= self.FRAME_BYTES:
+            self._write_frame()
+
+    def close(self, exit_code: Optional[int] = None) -> ArchivedLog:
+        """
+        Write the last frame and the final index, then trim the archive.
+
+        Args:
+            exit_code (Optional[int]): Exit status of the transaction
+
+        Returns:
+            ArchivedLog: The finished log
+        """
+        if self._file is not None:
+            self.index["finished"] = time.time()
+            self.index["exit_code"] = exit_code
+            self._write_frame()
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.error(f"Could not close log file {self.path}: {e}")
+            self._file = None
+            self.archive.evict()
+        return ArchivedLog(self.path)
+
+    def _write_frame(self) -> None:
+        """Compress the buffered lines into one gzip frame and update the index."""
+        if self._file is None or not self._buffer:
+            self._write_index()
+            return
+        data = "".join(line + "\n" for line in self._buffer).encode("utf-8", errors="replace")
+        frame = zlib.compressobj(6, zlib.DEFLATED, 31)
+        compressed = frame.compress(data) + frame.flush()
+        first_line = self.index["lines"] - len(self._buffer)
+        try:
+            self._file.write(compressed)
+            self._file.flush()
+        except OSError as e:
+            logger.error(f"Could not write log file {self.path}: {e}")
+            self._file.close()
+            self._file = None
+            return
+        self.index["frames"].append((self._offset, len(compressed), first_line, len(self._buffer)))
+        self._offset += len(compressed)
+        self._buffer = []
+        self._buffered = 0
+        # Keep the index usable even if the app dies mid-transaction
+        self._write_index()
+
+    def _write_index(self) -> None:
+        path = index_path(self.path)
+        temporary = path.with_name(path.name + ".tmp")
+        try:
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+            os.replace(temporary, path)
+        except OSError as e:
+            logger.error(f"Could not write log index {path}: {e}")
+
+
+class LogArchive:
+    """
+    Directory of archived transaction logs.
+
+    Use :meth:`instance` to get the shared archive.
+
+    Attributes:
+        directory (Path): Where logs are stored
+        max_bytes (int): Size the archive is trimmed to
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "LogArchive":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: Optional[int] = None) -> None:
+        self.directory = directory or Config.LOG_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.LOG_ARCHIVE_MAX_BYTES
+        self._open: Dict[Path, LogWriter] = {}
+
+    def create(self, title: str) -> LogWriter:
+        """
+        Start the log of a new transaction.
+
+        Args:
+            title (str): What the transaction does, e.g. the command line
+
+        Returns:
+            LogWriter: Writer for the log; close it when the transaction ends
+        """
+        safe_title = re.sub(r"[^\w.+-]+", "_", title)[:64]
+        stem = f"{time.strftime('%Y%m%d-%H%M%S')}-{safe_title}"
+        path = self.directory / f"{stem}{LOG_SUFFIX}"
+        number = 1
+        while path.exists():
+            number += 1
+            path = self.directory / f"{stem}-{number}{LOG_SUFFIX}"
+        writer = LogWriter(self, path, title)
+        self._open[path] = writer
+        return writer
+
+    def logs(self) -> List[ArchivedLog]:
+        """Every archived log, newest first."""
+        if not self.directory.exists():
+            return []
+        paths = sorted(self.directory.glob(f"*{LOG_SUFFIX}"),
+                       key=lambda p: p.stat().st_mtime, reverse=True)
+        return [ArchivedLog(p) for p in paths]
+
+    def evict(self) -> None:
+        """Delete the oldest finished logs until the archive fits in ``max_bytes``."""
+        for path in [p for p, writer in self._open.items() if writer._file is None]:
+            del self._open[path]
+        logs = self.logs()
+        total = sum(log.size() for log in logs)
+        for log in reversed(logs):
+            if total <= self.max_bytes:
+                break
+            if log.path in self._open:
+                continue
+            total -= log.size()
+            log.delete()
+            logger.info(f"Evicted log {log.path.name}")
+
+
+def index_path(log_path: Path) -> Path:
+    """Sidecar index of a log file."""
+    return log_path.with_name(log_path.name[:-len(LOG_SUFFIX)] + INDEX_SUFFIX)
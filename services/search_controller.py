@@ -0,0 +1,159 @@
+"""
+Search Controller Module
+Debounced, cancellable package search off the GUI thread.
+
+Keystrokes restart a short debounce timer; when it fires, the query is
+handed to a worker thread. The worker only ever runs the newest pending
+query, and results of a query that was superseded while it ran are
+dropped before they reach the GUI thread.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, QTimer, pyqtSignal
+
+from services.search_index import SearchIndex
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+
+class _SearchWorker(QThread):
+    """Runs the latest submitted query against the current index."""
+
+    finished_query = pyqtSignal(int, str, list, float)  # generation, query, indices, started
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._pending = None
+        self._stopped = False
+
+    def submit(self, generation: int, query: str, index: SearchIndex) -> None:
+        """Replace any pending query with this one."""
+        with self._condition:
+            self._pending = (generation, query, index, time.perf_counter())
+            self._condition.notify()
+
+    def stop(self) -> None:
+        """Stop the worker loop and wait for it."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self.wait()
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                generation, query, index, started = self._pending
+                self._pending = None
+            self.finished_query.emit(generation, query, index.search(query), started)
+
+
+class SearchController(QObject):
+    """
+    Debounces search input and delivers only the latest results.
+
+    Attributes:
+        DEBOUNCE_MS (int): Quiet time after the last keystroke before searching
+        LATENCY_SAMPLES (int): Number of recent query latencies kept
+    """
+
+    resultsReady = pyqtSignal(str, list)  # query, matching package indices
+
+    DEBOUNCE_MS = 150
+    LATENCY_SAMPLES = 500
+    LOG_EVERY = 50
+
+    def __init__(self, index: Optional[SearchIndex] = None, parent=None) -> None:
+        super().__init__(parent)
+        self.index = index
+        self._generation = 0
+        self._query = ""
+        self._latencies = deque(maxlen=self.LATENCY_SAMPLES)
+        self._delivered = 0
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._dispatch)
+
+        self._worker = _SearchWorker()
+        self._worker.finished_query.connect(self._on_finished)
+        self._worker.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def set_index(self, index: SearchIndex) -> None:
+        """Search a new index from now on, re-running the current query on it."""
+        self.index = index
+        self._generation += 1
+        # In-flight results are dropped, so search again unless the
+        # debounce timer is about to
+        if self._query.strip() and not self._debounce.isActive():
+            self._dispatch()
+
+    def set_query(self, query: str) -> None:
+        """Schedule a search once typing pauses."""
+        self._query = query
+        self._generation += 1
+        self._debounce.start()
+
+    def search_now(self, query: str) -> None:
+        """Search immediately, skipping the debounce delay."""
+        self._query = query
+        self._generation += 1
+        self._debounce.stop()
+        self._dispatch()
+
+    def stop(self) -> None:
+        """Shut the worker thread down."""
+        self._debounce.stop()
+        if self._worker.isRunning():
+            self._worker.stop()
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        """
+        Get percentiles of recent query latencies.
+
+        Latency runs from handing a query to the worker until its results
+        arrive on the GUI thread.
+
+        Returns:
+            Dict[str, float]: p50, p90 and p99 in milliseconds (empty if
+                no query has completed yet)
+        """
+        samples = sorted(self._latencies)
+        if not samples:
+            return {}
+        last = len(samples) - 1
+        return {
+            f"p{pct}": samples[min(last, round(last * pct / 100))] * 1000
+            for pct in (50, 90, 99)
+        }
+
+    def _dispatch(self) -> None:
+        """Hand the current query to the worker."""
+        if self.index is not None:
+            self._worker.submit(self._generation, self._query, self.index)
+
+    def _on_finished(self, generation: int, query: str,
+                     indices: List[int], started: float) -> None:
+        """Deliver results unless a newer query was issued meanwhile."""
+        if generation != self._generation:
+            return
+        self._latencies.append(time.perf_counter() - started)
+        self._delivered += 1
+        if self._delivered % self.LOG_EVERY == 0:
+            stats = ", ".join(f"{k}={v:.1f}ms" for k, v in self.latency_percentiles().items())
+            logger.info(f"Search latency over last {len(self._latencies)} queries: {stats}")
+        self.resultsReady.emit(query, indices)
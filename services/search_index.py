@@ -0,0 +1,168 @@
+"""
+Search Index Module
+Substring search over package lists without scanning every package.
+
+A trigram inverted index maps each three-character sequence to the
+packages containing it. A query of three or more characters intersects
+the posting lists of its trigrams and only verifies the few surviving
+candidates. Shorter queries have too little to intersect and use a
+sorted name index to match package names by prefix instead.
+
+Recent results are kept on a small stack. Typing narrows a query, and
+every package matching the longer query also matched the shorter one, so
+a refined query only verifies the previous result set. Backspacing to a
+query still on the stack returns its results without searching.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+TRIGRAM_LENGTH = 3
+
+
+class SearchIndex:
+    """
+    Case-insensitive search index over a sequence of packages.
+
+    Build one per package list load and share it between the filter paths
+    that search that list.
+
+    Attributes:
+        packages (Sequence): The indexed packages
+        include_description (bool): Whether descriptions are searched too
+        RECENT_QUERIES (int): Number of result sets kept for refinement
+    """
+
+    RECENT_QUERIES = 8
+
+    def __init__(self, packages: Sequence, include_description: bool = True) -> None:
+        self.packages = packages
+        self.include_description = include_description
+
+        self._texts: List[str] = []
+        self._trigrams: Dict[str, array] = {}
+        for index, pkg in enumerate(packages):
+            text = pkg.name.lower()
+            if include_description:
+                # The separator keeps trigrams from spanning both fields
+                text = f"{text}\n{pkg.description.lower()}"
+            self._texts.append(text)
+            for trigram in {text[i:i + TRIGRAM_LENGTH] for i in range(len(text) - 2)}:
+                postings = self._trigrams.get(trigram)
+                if postings is None:
+                    postings = self._trigrams[trigram] = array("I")
+                postings.append(index)
+
+        self._prefix_keys = sorted(
+            (pkg.name.lower(), index) for index, pkg in enumerate(packages)
+        )
+
+        # Searches may run on a worker thread while the GUI thread filters
+        self._recent = deque(maxlen=self.RECENT_QUERIES)
+        self._recent_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find the packages matching a query.
+
+        Args:
+            query (str): Search text (case-insensitive)
+
+        Returns:
+            List[int]: Matching package indices in list order
+        """
+        query = query.lower().strip()
+        if not query:
+            return list(range(len(self._texts)))
+
+        with self._recent_lock:
+            for entry in self._recent:
+                if entry[0] == query:
+                    # Move the hit to the top so backspacing keeps it
+                    self._recent.remove(entry)
+                    self._recent.appendleft(entry)
+                    return list(entry[1])
+            base = self._find_refinement_base(query)
+
+        if base is not None:
+            matches = self._refine(query, base)
+        elif len(query) < TRIGRAM_LENGTH:
+            matches = self._search_prefix(query)
+        else:
+            matches = self._search_trigrams(query)
+
+        with self._recent_lock:
+            self._recent.appendleft((query, matches))
+        return list(matches)
+
+    def filter(self, query: str) -> List:
+        """
+        Find the packages matching a query.
+
+        Args:
+            query (str): Search text (case-insensitive)
+
+        Returns:
+            List: Matching packages in list order
+        """
+        return [self.packages[index] for index in self.search(query)]
+
+    def _find_refinement_base(self, query: str) -> Optional[List[int]]:
+        """
+        Find the smallest recent result set that contains every match.
+
+        A substring query's matches are a subset of any shorter substring
+        query it contains, and a prefix query's matches are a subset of any
+        shorter prefix it starts with. Prefix and substring results can't be
+        mixed, since the short form only looks at names.
+        """
+        best = None
+        for cached_query, cached_matches in self._recent:
+            if len(query) < TRIGRAM_LENGTH:
+                usable = query.startswith(cached_query)
+            else:
+                usable = len(cached_query) >= TRIGRAM_LENGTH and cached_query in query
+            if usable and (best is None or len(cached_matches) < len(best)):
+                best = cached_matches
+        return best
+
+    def _refine(self, query: str, candidates: List[int]) -> List[int]:
+        """Keep the candidates that still match a narrower query."""
+        texts = self._texts
+        if len(query) < TRIGRAM_LENGTH:
+            # Every indexed text starts with the lowercased name
+            return [index for index in candidates if texts[index].startswith(query)]
+        return [index for index in candidates if query in texts[index]]
+
+    def _search_trigrams(self, query: str) -> List[int]:
+        """Intersect trigram posting lists, then verify the candidates."""
+        postings = []
+        for trigram in {query[i:i + TRIGRAM_LENGTH] for i in range(len(query) - 2)}:
+            posting = self._trigrams.get(trigram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+
+        # Trigrams may match out of order, so confirm the real substring
+        texts = self._texts
+        return sorted(index for index in candidates if query in texts[index])
+
+    def _search_prefix(self, query: str) -> List[int]:
+        """Match package names starting with a short query."""
+        keys = self._prefix_keys
+        matches = []
+        position = bisect_left(keys, (query, -1))
+        while position < len(keys) and keys[position][0].startswith(query):
+            matches.append(keys[position][1])
+            position += 1
+        matches.sort()
+        return matches
@@ -1,4 +1,3 @@
-import subprocess
 import sys
 import os
 
@@ -8,8 +7,12 @@ sys.path.insert(0, project_root)
 
 from PyQt6.QtWidgets import QMessageBox, QWidget
 from ui.dialogs.password_dialog import PasswordDialog
+from services.job_runner import JobRunner
 
 class SudoAuth:
+    # Seconds to wait for sudo to check the password
+    VERIFY_TIMEOUT = 30
+    
     def __init__(self) -> None:
         self._auth_status: bool = False
     
@@ -22,21 +25,17 @@ class SudoAuth:
             if password is None:  # User clicked Cancel
                 sys.exit(0)
                 
-            try:
-                # Verify sudo access
-                proc = subprocess.Popen(
-                    ['sudo', '-S', 'true'],
-                    stdin=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                proc.communicate(input=f"{password}\n".encode())
-                
-                if proc.returncode == 0:
-                    self._auth_status = True
-                    return True
-                    
-            except Exception as e:
-                QMessageBox.critical(parent, "Error", str(e))
+            # Verify sudo access off the GUI thread
+            result = JobRunner.instance().run_and_wait(
+                ['sudo', '-S', 'true'],
+                timeout=self.VERIFY_TIMEOUT,
+                input=f"{password}\n"
+            )
+            if result.ok:
+                self._auth_status = True
+                return True
+            if result.error is not None:
+                QMessageBox.critical(parent, "Error", result.error)
             
             remaining_attempts = attempts - attempt - 1
             if remaining_attempts > 0:
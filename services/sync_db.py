@@ -0,0 +1,103 @@
+"""
+Sync Database Module
+Loads the repository package catalog straight from pacman's sync databases.
+
+Each ``<db root>/sync/<repo>.db`` file is a compressed tar archive with
+one ``<name>-<version>/desc`` member per package. Reading those members
+replaces running ``yay -Ss`` and parsing its human-readable output.
+"""
+
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple, Union
+
+from config.app_config import Config
+from models.package import Package
+from services.local_db import (DescFields, SyncFingerprint, package_from_desc,
+                               parse_desc, sync_fingerprint)
+from utils.logger import Logger
+from utils.tar_reader import TarReadError, iter_members, read_archive
+
+logger = Logger.get_logger(__name__)
+
+# Repositories listed first, in pacman.conf's default order
+REPO_ORDER = ("core", "extra", "multilib")
+
+
+class SyncDatabase:
+    """
+    Reader for pacman's repository (sync) databases.
+
+    Attributes:
+        db_root (Path): Pacman database root (``/var/lib/pacman`` by default)
+        sync_dir (Path): Directory holding the ``*.db`` files
+    """
+
+    def __init__(self, db_root: Optional[Union[str, Path]] = None) -> None:
+        self.db_root = Path(db_root) if db_root else Config.PACMAN_DB_DIR
+        self.sync_dir = self.db_root / "sync"
+
+    def db_paths(self) -> List[Path]:
+        """
+        Get the sync database files, known repositories first.
+
+        Returns:
+            List[Path]: Database file paths
+        """
+        def order(path: Path) -> Tuple[int, str]:
+            repo = path.stem
+            rank = REPO_ORDER.index(repo) if repo in REPO_ORDER else len(REPO_ORDER)
+            return rank, repo
+
+        return sorted(self.sync_dir.glob("*.db"), key=order)
+
+    def fingerprint(self) -> SyncFingerprint:
+        """
+        Get the name, size and mtime of every sync database.
+
+        Returns:
+            SyncFingerprint: Changes whenever ``pacman -Sy`` rewrites a database
+        """
+        return sync_fingerprint(self.sync_dir)
+
+    def iter_records(self, db_path: Path) -> Iterator[DescFields]:
+        """
+        Yield the parsed ``desc`` member of every package in a database.
+
+        Args:
+            db_path (Path): Sync database file
+
+        Yields:
+            DescFields: Parsed fields of one package
+
+        Raises:
+            OSError: If the file can't be read
+            TarReadError: If the archive is corrupt
+        """
+        for member_name, body in iter_members(read_archive(db_path)):
+            if member_name.endswith("/desc"):
+                yield parse_desc(str(body, "utf-8", "replace"))
+
+    def load_catalog(self, exclude: Optional[Set[str]] = None) -> List[Package]:
+        """
+        Load every package of every sync database.
+
+        Databases that can't be read are logged and skipped.
+
+        Args:
+            exclude (Optional[Set[str]]): Package names to leave out
+
+        Returns:
+            List[Package]: Packages in repository order
+        """
+        exclude = exclude or set()
+        packages: List[Package] = []
+        for db_path in self.db_paths():
+            repo = db_path.stem
+            try:
+                for fields in self.iter_records(db_path):
+                    name = fields.get("NAME")
+                    if name and name[0] not in exclude:
+                        packages.append(package_from_desc(fields, repo))
+            except (OSError, TarReadError) as e:
+                logger.warning(f"Skipping sync database {db_path.name}: {e}")
+        return packages
@@ -0,0 +1,136 @@
+"""
+Warm-up Module
+Loads what the pages need while the splash screen is showing.
+
+The splash screen waits for the user anyway, so the expensive start-up
+work runs on a worker thread in the meantime: registering the bundled
+fonts, syncing the installed package storage, mapping the repo catalog
+and indexing it for search. The pages then start from the warm shared
+instances and the prebuilt index instead of doing that work on the GUI
+thread when they are first opened.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Set
+
+from PyQt6.QtCore import QCoreApplication, QThread, pyqtSignal
+from PyQt6.QtGui import QFontDatabase
+
+from config.app_config import Config
+from services.aur_storage import AurPackageStorage
+from services.catalog_cache import CatalogCache
+from services.search_index import SearchIndex
+from utils.logger import Logger
+
+logger = Logger.get_logger(__name__)
+
+FONT_FILES = ["PixelifySans.ttf", "DotGothic16.ttf", "PressStart2P.ttf"]
+
+
+@dataclass
+class WarmData:
+    """
+    Data loaded during warm-up.
+
+    Attributes:
+        catalog (Sequence): Repo catalog as returned by the shared CatalogCache
+        installed (Set[str]): Names of the installed AUR packages
+        available (List): Catalog packages that aren't installed
+        search_index (Optional[SearchIndex]): Index over ``available``
+        elapsed (float): Wall time of the warm-up in seconds
+    """
+
+    catalog: Sequence = field(default=(), repr=False)
+    installed: Set[str] = field(default_factory=set, repr=False)
+    available: List = field(default_factory=list, repr=False)
+    search_index: Optional[SearchIndex] = field(default=None, repr=False)
+    elapsed: float = 0.0
+
+    def is_current(self, catalog_cache: CatalogCache, storage: AurPackageStorage) -> bool:
+        """
+        Check that the warm catalog data still matches the system.
+
+        Args:
+            catalog_cache (CatalogCache): Cache the catalog was loaded from
+            storage (AurPackageStorage): Storage the installed set came from
+
+        Returns:
+            bool: True if neither the catalog nor the installed set changed
+        """
+        return (self.search_index is not None
+                and catalog_cache.get_catalog() is self.catalog
+                and set(storage.get_all_packages()) == self.installed)
+
+
+class WarmupWorker(QThread):
+    """
+    Runs the warm-up steps on a worker thread.
+
+    ``progress`` is emitted before each step and once more at 100 when
+    everything is done, followed by ``warmed`` with the loaded
+    :class:`WarmData`. A failing step is logged and skipped; the pages
+    load whatever is missing themselves. After ``requestInterruption()``
+    the worker stops before its next step without emitting ``warmed``.
+    """
+
+    progress = pyqtSignal(int, str)  # percent done, current step
+    warmed = pyqtSignal(object)  # WarmData
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.data = WarmData()
+        self._steps = [
+            ("Loading fonts", self._load_fonts),
+            ("Syncing installed packages", self._sync_storage),
+            ("Loading package catalog", self._load_catalog),
+            ("Indexing packages", self._build_index),
+        ]
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        for number, (label, step) in enumerate(self._steps):
+            if self.isInterruptionRequested():
+                logger.info(f"Warm-up interrupted before: {label}")
+                return
+            self.progress.emit(number * 100 // len(self._steps), label)
+            step_started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                logger.error(f"Warm-up step failed ({label}): {e}")
+                continue
+            logger.info(f"{label} took {(time.perf_counter() - step_started) * 1000:.1f} ms")
+
+        self.data.elapsed = time.perf_counter() - started
+        logger.info(f"Warm-up finished in {self.data.elapsed * 1000:.0f} ms")
+        self.progress.emit(100, "Ready")
+        self.warmed.emit(self.data)
+
+    def _load_fonts(self) -> None:
+        """Register the bundled fonts; the font database is thread-safe."""
+        for font_file in FONT_FILES:
+            font_path = Config.FONTS_DIR / font_file
+            if not font_path.exists():
+                logger.warning(f"Font file not found: {font_file}")
+            elif QFontDatabase.addApplicationFont(str(font_path)) < 0:
+                logger.warning(f"Could not load font: {font_file}")
+
+    def _sync_storage(self) -> None:
+        """Create and sync the shared storage, then hand it to the GUI thread."""
+        storage = AurPackageStorage.instance()
+        app = QCoreApplication.instance()
+        if app is not None and storage.thread() is not app.thread():
+            storage.moveToThread(app.thread())
+        self.data.installed = set(storage.get_all_packages())
+
+    def _load_catalog(self) -> None:
+        """Map the repo catalog through the shared cache."""
+        self.data.catalog = CatalogCache.instance().get_catalog()
+        self.data.available = [
+            pkg for pkg in self.data.catalog if pkg.name not in self.data.installed
+        ]
+
+    def _build_index(self) -> None:
+        """Index the packages offered by the search page."""
+        self.data.search_index = SearchIndex(self.data.available)
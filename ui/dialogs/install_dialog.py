@@ -1,12 +1,29 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton
+from pathlib import Path
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton,
+                            QListWidget, QListWidgetItem, QListView)
 from PyQt6.QtCore import Qt, QPoint
-from utils.themes.colors import ThemeColors
-from utils.themes.fonts import Fonts
+from components.lists.log_model import LogModel
+from config.app_config import Config
+from services.log_archive import ArchivedLog
+
+# Lines shown before the first error when jumping to it
+ERROR_CONTEXT_LINES = 200
+
+# Row prefix per install queue state
+STATUS_ICONS = {
+    "queued": "⏳",
+    "installing": "📦",
+    "installed": "✅",
+    "failed": "❌",
+}
 
 class InstallDialog(QDialog):
-    def __init__(self, package_name, parent=None):
+    def __init__(self, package_names, parent=None):
         super().__init__(parent)
-        self.package_name = package_name
+        self.package_names = list(package_names)
+        self.status_items = {}
+        self.log_model = LogModel(Config.LOG_VIEW_MAX_LINES, self)
+        self.log_paths = []
         self.setModal(True)  # Make dialog modal
         self.setup_ui()
     
@@ -21,73 +38,70 @@ class InstallDialog(QDialog):
         
         # Main layout with better spacing
         layout = QVBoxLayout(self)
-        layout.setSpacing(25)
-        layout.setContentsMargins(40, 40, 40, 40)
+        layout.setSpacing(15)
+        layout.setContentsMargins(40, 30, 40, 30)
         
         # Bigger penguin logo
         arch_logo = QLabel("🐧")
-        arch_logo.setStyleSheet("""
-            font-size: 60px;
-            padding: 15px;
-            margin: 10px;
-        """)
+        arch_logo.setObjectName("install_logo")
         arch_logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Package name with better contrast
-        name_label = QLabel(f"Installing {self.package_name}")
-        name_label.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.LARGE}px;
-            color: {ThemeColors.HIGHLIGHT};
-            padding: 15px;
-            margin: 5px;
-            background: {ThemeColors.DARK};
-            border: 2px solid {ThemeColors.LIGHT};
-            border-radius: 10px;
-            qproperty-alignment: AlignCenter;
-        """)
+        if len(self.package_names) == 1:
+            title = f"Installing {self.package_names[0]}"
+        else:
+            title = f"Installing {len(self.package_names)} packages"
+        name_label = QLabel(title)
+        name_label.setObjectName("install_title")
+        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         name_label.setWordWrap(True)
         
         # Bigger progress bar
         self.progress = QProgressBar()
         self.progress.setMinimumHeight(35)
-        self.progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 3px solid {ThemeColors.LIGHT};
-                border-radius: 10px;
-                background: {ThemeColors.MEDIUM};
-                text-align: center;
-                font-size: {Fonts.MEDIUM}px;
-                font-family: {Fonts.DECORATIVE};
-                color: {ThemeColors.TEXT};
-                padding: 2px;
-            }}
-            QProgressBar::chunk {{
-                background: {ThemeColors.HIGHLIGHT};
-                border-radius: 7px;
-            }}
-        """)
+        self.progress.setObjectName("install_progress")
         self.progress.setRange(0, 0)
         
+        # Status of every package in the batch
+        self.status_list = QListWidget()
+        self.status_list.setObjectName("install_queue")
+        self.status_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.status_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        for name in self.package_names:
+            item = QListWidgetItem()
+            self.status_items[name] = item
+            self.status_list.addItem(item)
+            self.set_package_status(name, "queued")
+        self.status_list.setMaximumHeight(120)
+        
+        # Tail of the command output; only visible rows are laid out
+        self.log_view = QListView()
+        self.log_view.setObjectName("install_log")
+        self.log_view.setModel(self.log_model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.log_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.log_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.log_model.rowsAboutToBeInserted.connect(self._check_follow_log)
+        self.log_model.rowsInserted.connect(self._follow_log)
+        self._following_log = True
+        
+        self.log_path_label = QLabel()
+        self.log_path_label.setObjectName("install_log_path")
+        self.log_path_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.log_path_label.setWordWrap(True)
+        self.log_path_label.hide()
+        
+        # Shows the output around the first error of the archived logs
+        self.first_error_btn = QPushButton("⚠ Jump to first error")
+        self.first_error_btn.setObjectName("install_first_error")
+        self.first_error_btn.clicked.connect(self.show_first_error)
+        self.first_error_btn.hide()
+        
         # Done button with better visibility
         self.done_btn = QPushButton("✓ Done")
         self.done_btn.setMinimumHeight(50)
-        self.done_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.LARGE}px;
-                color: {ThemeColors.HIGHLIGHT};
-                background: {ThemeColors.DARK};
-                border: 3px solid {ThemeColors.HIGHLIGHT};
-                border-radius: 10px;
-                padding: 10px 30px;
-                min-width: 200px;
-            }}
-            QPushButton:hover {{
-                background: {ThemeColors.HIGHLIGHT};
-                color: {ThemeColors.DARK};
-            }}
-        """)
+        self.done_btn.setObjectName("install_done")
         self.done_btn.clicked.connect(self.close)
         self.done_btn.hide()
         
@@ -95,19 +109,17 @@ class InstallDialog(QDialog):
         layout.addWidget(arch_logo)
         layout.addWidget(name_label)
         layout.addWidget(self.progress)
+        layout.addWidget(self.status_list)
+        layout.addWidget(self.log_view, stretch=1)
+        layout.addWidget(self.log_path_label)
+        layout.addWidget(self.first_error_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.done_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
         # Set larger fixed size for dialog
-        self.setFixedSize(700, 500)
+        self.setFixedSize(760, 720)
         
         # Set dialog style
-        self.setStyleSheet(f"""
-            QDialog {{
-                background: {ThemeColors.DARK};
-                border: 4px solid {ThemeColors.HIGHLIGHT};
-                border-radius: 20px;
-            }}
-        """)
+        self.setObjectName("install_dialog")
         
         # Center in parent
         if self.parent():
@@ -117,9 +129,79 @@ class InstallDialog(QDialog):
                 parent_center.y() - self.height() // 2
             )
     
+    def set_package_status(self, name, status):
+        """Show the install queue state of one package"""
+        item = self.status_items.get(name)
+        if item is not None:
+            item.setText(f"{STATUS_ICONS.get(status, '')} {name} — {status}")
+    
+    def set_progress(self, percent, status):
+        """Show how far the installation is and what it is doing"""
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
+        self.progress.setValue(percent)
+        self.progress.setFormat(f"{status} — %p%")
+    
+    def append_output(self, line):
+        """Add a line of command output to the log pane"""
+        self.log_model.append_line(line)
+    
+    def add_log(self, path):
+        """Remember the archived log of a finished transaction"""
+        self.log_paths.append(path)
+    
+    def _check_follow_log(self):
+        """Keep following the output only if the log is scrolled to the end"""
+        scrollbar = self.log_view.verticalScrollBar()
+        self._following_log = scrollbar.value() >= scrollbar.maximum()
+    
+    def _follow_log(self):
+        if self._following_log:
+            self.log_view.scrollToBottom()
+    
+    def finish_log(self):
+        """Show the last lines and where the full output was archived"""
+        self.log_model.flush()
+        if self.log_paths:
+            self.log_path_label.setText("Full log: " + "\n".join(self.log_paths))
+            self.log_path_label.show()
+        if any(ArchivedLog(Path(path)).first_error() for path in self.log_paths):
+            self.first_error_btn.show()
+    
+    def show_first_error(self):
+        """Load the archived output around the first error into the log pane"""
+        for path in self.log_paths:
+            log = ArchivedLog(Path(path))
+            error = log.first_error()
+            if error is None:
+                continue
+            line_number, message = error
+            start = max(line_number - ERROR_CONTEXT_LINES, 0)
+            lines = log.read_lines(start, ERROR_CONTEXT_LINES * 2)
+            self.log_model.clear()
+            for line in lines:
+                self.log_model.append_line(line)
+            self.log_model.flush()
+            self.log_view.scrollTo(self.log_model.index(line_number - start),
+                                   QListView.ScrollHint.PositionAtCenter)
+            self.log_path_label.setText(
+                f"{log.title}, line {line_number + 1} of {log.line_count}: {message}"
+            )
+            return
+    
     def show_success(self):
         self.progress.setRange(0, 100)
         self.progress.setValue(100)
+        self.progress.setFormat("Done — %p%")
+        self.finish_log()
+        self.done_btn.show()
+    
+    def show_failure(self, failed_names):
+        """Stop the progress bar and point out the packages that failed"""
+        self.progress.setRange(0, 100)
+        self.progress.setValue(0)
+        self.progress.setFormat(f"{len(failed_names)} of {len(self.package_names)} failed")
+        self.finish_log()
         self.done_btn.show()
     
     def mousePressEvent(self, event):
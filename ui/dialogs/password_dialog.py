@@ -1,8 +1,6 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QLineEdit, 
                            QPushButton, QHBoxLayout)
 from PyQt6.QtCore import Qt, pyqtSignal
-from utils.themes.colors import ThemeColors
-from utils.themes.fonts import Fonts
 
 class PasswordDialog(QDialog):
     passwordEntered = pyqtSignal(str)
@@ -10,6 +8,7 @@ class PasswordDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Authentication Required")
+        self.setObjectName("password_dialog")
         self.setup_ui()
         
     def setup_ui(self):
@@ -19,25 +18,10 @@ class PasswordDialog(QDialog):
         
         # Icon and message
         msg = QLabel("🔒 Enter your password to perform administrative tasks")
-        msg.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.MEDIUM}px;
-            color: {ThemeColors.HIGHLIGHT};
-        """)
         
         # Password input
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setStyleSheet(f"""
-            QLineEdit {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                padding: 8px;
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 6px;
-                background: {ThemeColors.MEDIUM};
-            }}
-        """)
         
         # Buttons
         btn_layout = QHBoxLayout()
@@ -45,20 +29,6 @@ class PasswordDialog(QDialog):
         cancel_btn = QPushButton("Cancel")
         
         for btn in [self.ok_btn, cancel_btn]:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    font-family: {Fonts.DECORATIVE};
-                    font-size: {Fonts.MEDIUM}px;
-                    padding: 8px 20px;
-                    border: 2px solid {ThemeColors.LIGHT};
-                    border-radius: 6px;
-                    background: {ThemeColors.MEDIUM};
-                }}
-                QPushButton:hover {{
-                    background: {ThemeColors.HIGHLIGHT};
-                    color: {ThemeColors.DARK};
-                }}
-            """)
             btn_layout.addWidget(btn)
             
         self.password_input.returnPressed.connect(self.validate_and_accept)
@@ -5,24 +5,26 @@ The primary window of the application that manages the overall layout and naviga
 This module handles:
 - Window initialization and setup
 - Theme switching
-- Page navigation
-- Font loading
+- Page navigation, building each page on first use
+- Background warm-up while the splash screen shows
 - Layout management
 """
 
 from PyQt6.QtWidgets import (QMainWindow, QHBoxLayout, QVBoxLayout, QWidget, 
                            QStackedWidget, QPushButton)
-from PyQt6.QtGui import QFontDatabase, QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import Qt, QTimer
 
 from ui.sidebar import Sidebar
 from ui.pages import *
 from ui.pages.splash_page import SplashPage
-from utils.themes.colors import ThemeColors
-from utils.themes.fonts import Fonts
+from services.db_watcher import PackageDbWatcher
+from services.warmup import WarmupWorker
+from utils.themes.theme_engine import ThemeEngine
 from config.app_config import Config
 from utils.logger import Logger
 import os
+import time
 
 logger = Logger.get_logger(__name__)
 
@@ -36,10 +38,19 @@ class MainWindow(QMainWindow):
     Attributes:
         dark_mode (bool): Current theme state
         sidebar (Sidebar): Navigation sidebar
-        pages (dict): Dictionary of available pages
+        pages (dict): Pages built so far, by name
+        page_options (dict): Keyword arguments for building pages, by name
         stacked_pages (QStackedWidget): Widget stack for page switching
+        PAGE_FACTORIES (dict): Page classes by name, in sidebar order
     """
     
+    PAGE_FACTORIES = {
+        "aur": AurPage,
+        "delete": DeletePage,
+        "search": SearchPage,
+        "about": DevInfoPage
+    }
+    
     def __init__(self):
         """Initialize the main window and setup UI components"""
         super().__init__()
@@ -49,29 +60,25 @@ class MainWindow(QMainWindow):
         self.theme_btn = None
         self.sidebar = None
         self.pages = {}
+        self.page_options = {}
         self.stacked_pages = None
+        self.db_watcher = None
         
         # Ensure dark theme is set immediately
-        ThemeColors.set_theme(True)
+        self.theme_engine = ThemeEngine.instance()
+        if self.theme_engine.current is None:
+            self.theme_engine.apply("dark")
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {ThemeColors.BACKGROUND};
-                color: {ThemeColors.TEXT};
-            }}
-            QMainWindow {{
-                background-color: {ThemeColors.BACKGROUND};
-            }}
-            * {{
-                background-color: {ThemeColors.BACKGROUND};
-            }}
-        """)
         
         # Initialize UI
         self.init_window()
-        self.load_fonts()
         self.init_ui()
-        self.update_theme()  # Apply theme to all components
+
+        # Load fonts, storage and catalog while the splash screen shows
+        self.warmup = WarmupWorker(parent=self)
+        self.warmup.progress.connect(self.splash_page.set_progress)
+        self.warmup.warmed.connect(self.on_warmed)
+        self.warmup.start()
         logger.info("Main window initialized")
     
     def init_window(self):
@@ -114,21 +121,9 @@ class MainWindow(QMainWindow):
         self.layout.addWidget(self.sidebar)
     
     def setup_pages(self):
-        """Initialize and configure all application pages"""
+        """Initialize the page stack; pages are built when first shown"""
         self.stacked_pages = QStackedWidget()
         
-        # Create pages dictionary
-        self.pages = {
-            "aur": AurPage(),
-            "delete": DeletePage(),
-            "search": SearchPage(),
-            "about": DevInfoPage()
-        }
-        
-        # Add pages to stack
-        for page in self.pages.values():
-            self.stacked_pages.addWidget(page)
-        
         # Create content container
         content_container = QWidget()
         content_layout = QVBoxLayout(content_container)
@@ -144,6 +139,7 @@ class MainWindow(QMainWindow):
     def setup_theme_button(self):
         """Create and configure the theme toggle button"""
         self.theme_btn = QPushButton()
+        self.theme_btn.setObjectName("theme_button")
         self.theme_btn.setFixedSize(40, 40)
         self.theme_btn.clicked.connect(self.toggle_theme)
         self.update_theme_button()
@@ -154,89 +150,92 @@ class MainWindow(QMainWindow):
         self.connect_signals()
         self.change_page(0)  # Show AUR page by default
         logger.info("Showing main interface")
+        
+        # Build the remaining pages once the first one is up
+        if Config.PREBUILD_PAGES:
+            QTimer.singleShot(Config.PREBUILD_DELAY_MS, self.prebuild_next_page)
     
     def connect_signals(self):
         """Connect sidebar button signals to page changes"""
-        self.sidebar.buttons["aur"].clicked.connect(lambda: self.change_page(0))
-        self.sidebar.buttons["delete"].clicked.connect(lambda: self.change_page(1))
-        self.sidebar.buttons["search"].clicked.connect(lambda: self.change_page(2))
-        self.sidebar.buttons["about"].clicked.connect(lambda: self.change_page(3))
+        for index, name in enumerate(self.PAGE_FACTORIES):
+            self.sidebar.buttons[name].clicked.connect(
+                lambda _=False, i=index: self.change_page(i))
     
     def toggle_theme(self):
         """Toggle between light and dark themes"""
         self.dark_mode = not self.dark_mode
-        ThemeColors.set_theme(self.dark_mode)
-        self.update_theme()
+        # One application-wide stylesheet swap restyles every widget
+        self.theme_engine.apply("dark" if self.dark_mode else "light")
         self.update_theme_button()
-        logger.debug(f"Theme changed to {'dark' if self.dark_mode else 'light'}")
+        logger.debug(f"Theme changed to {'dark' if self.dark_mode else 'light'} "
+                     f"in {self.theme_engine.last_apply_ms:.1f} ms")
     
     def update_theme_button(self):
         """Update theme button appearance based on current theme"""
         self.theme_btn.setText("🌙" if self.dark_mode else "☀️")
-        self.theme_btn.setStyleSheet(f"""
-            QPushButton {{
-                {Fonts.get_style(size=Fonts.XLARGE)}
-                background: {ThemeColors.MEDIUM};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 20px;
-                padding: 8px;
-                min-width: 40px;
-                max-width: 40px;
-            }}
-            QPushButton:hover {{
-                background: {ThemeColors.LIGHT};
-                border-color: {ThemeColors.HIGHLIGHT};
-            }}
-        """)
-    
-    def update_theme(self):
-        """Update theme for all components"""
-        # Update window background
-        self.setStyleSheet(f"background-color: {ThemeColors.BACKGROUND};")
-        
-        # Update all pages
-        for page in self.pages.values():
-            page.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {ThemeColors.BACKGROUND};
-                    color: {ThemeColors.TEXT};
-                }}
-            """)
-        
-        # Update splash page if visible
-        if self.centralWidget() == self.splash_page:
-            self.splash_page.setStyleSheet(f"background-color: {ThemeColors.BACKGROUND};")
-    
-    def load_fonts(self):
-        """Load custom fonts from resources directory"""
-        try:
-            fonts_dir = Config.FONTS_DIR
-            font_files = {
-                'PixelifySans.ttf': 'Pixelify Sans',
-                'DotGothic16.ttf': 'DotGothic16',
-                'PressStart2P.ttf': 'Press Start 2P'
-            }
-            
-            for font_file, _ in font_files.items():
-                font_path = fonts_dir / font_file
-                if font_path.exists():
-                    QFontDatabase.addApplicationFont(str(font_path))
-                else:
-                    logger.warning(f"Font file not found: {font_file}")
+    
+    def on_warmed(self, warm_data):
+        """
+        Take over the data loaded during warm-up.
+        
+        Args:
+            warm_data (WarmData): Catalog, index and installed packages
+        """
+        # Widgets polished before the fonts were registered pick them up now
+        self.theme_engine.apply(self.theme_engine.current)
+        self.page_options["search"] = {"warm_data": warm_data}
+        
+        # Pick up packages installed or removed outside the app
+        self.db_watcher = PackageDbWatcher(parent=self)
+        self.db_watcher.start()
+        self.splash_page.set_ready()
+    
+    def closeEvent(self, event):
+        """Stop background services before the window closes"""
+        # Only the step in progress is finished; its results are unused
+        self.warmup.requestInterruption()
+        self.warmup.wait()
+        if self.db_watcher is not None:
+            self.db_watcher.stop()
+        super().closeEvent(event)
+
+    def get_page(self, name):
+        """
+        Get a page, building it on first use.
+        
+        Args:
+            name (str): Page name, a key of PAGE_FACTORIES
             
-            logger.info("Fonts loaded successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Error loading fonts: {e}")
-            return False
+        Returns:
+            QWidget: The page
+        """
+        page = self.pages.get(name)
+        if page is None:
+            started = time.perf_counter()
+            options = self.page_options.pop(name, {})
+            page = self.pages[name] = self.PAGE_FACTORIES[name](**options)
+            self.stacked_pages.addWidget(page)
+            logger.info(f"Built {name} page in "
+                        f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return page
+    
+    def prebuild_next_page(self):
+        """Build one pending prebuild page, then yield to the event loop"""
+        pending = [name for name in Config.PREBUILD_PAGES if name not in self.pages]
+        if not pending:
+            return
+        self.get_page(pending[0])
+        if len(pending) > 1:
+            QTimer.singleShot(0, self.prebuild_next_page)
     
     def change_page(self, index):
         """
         Switch to a different page in the application.
         
         Args:
-            index (int): Index of the page to display
+            index (int): Index of the page to display, in PAGE_FACTORIES order
         """
-        self.stacked_pages.setCurrentIndex(index)
+        name = list(self.PAGE_FACTORIES)[index]
+        self.stacked_pages.setCurrentWidget(self.get_page(name))
         logger.debug(f"Changed to page index: {index}")
         logger.debug(f"Changed to page index: {index}") 
\ No newline at end of file
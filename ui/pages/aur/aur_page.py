@@ -18,7 +18,7 @@ class AurPage(QWidget):
     
     def __init__(self) -> None:
         super().__init__()
-        self.aur_storage = AurPackageStorage()
+        self.aur_storage = AurPackageStorage.instance()
         self.package_provider = PackageProvider()
         self.communicator = PageCommunicator.instance()
         
@@ -26,6 +26,7 @@ class AurPage(QWidget):
         self.communicator.packageInstalled.connect(self.refresh_packages)
         self.communicator.packageDeleted.connect(self.refresh_packages)
         self.communicator.refreshNeeded.connect(self.refresh_packages)
+        self.aur_storage.packagesChanged.connect(self._on_packages_changed)
         
         self.initUI()
         self.refresh_packages()  # Load initial packages
@@ -48,10 +49,8 @@ class AurPage(QWidget):
     
     def manual_refresh(self) -> None:
         """Handle manual refresh request"""
-        # First sync with system to get latest changes
-        self.aur_storage.sync_with_system()
-        # Then refresh the display
-        self.refresh_packages()
+        # Sync with system in the background, then refresh the display
+        self.aur_storage.sync_async(lambda report: self.refresh_packages())
 
     def refresh_packages(self) -> None:
         """Refresh package list from storage"""
@@ -67,6 +66,10 @@ class AurPage(QWidget):
         ])
         self.results_grid.update_display(self.package_provider.get_all_packages())
 
+    def _on_packages_changed(self, names: List[str]) -> None:
+        """Refresh after storage picked up changes made outside the app"""
+        self.refresh_packages()
+
     def _on_search(self, search_text: str) -> None:
         """Handle search requests"""
         packages = self.package_provider.filter_packages(search_text)
@@ -5,6 +5,7 @@ Package provider for AUR packages.
 from typing import List
 from models.package import Package
 from services.aur_service import AurService
+from services.search_index import SearchIndex
 
 class PackageProvider:
     """Provides and manages AUR packages."""
@@ -12,11 +13,13 @@ class PackageProvider:
     def __init__(self) -> None:
         """Initialize an empty package list."""
         self.packages: List[Package] = []
+        self.search_index = SearchIndex(self.packages)
         self.aur_service = AurService()
     
     def update_packages(self, packages: List[Package]) -> None:
         """Update the list of packages."""
         self.packages = packages
+        self.search_index = SearchIndex(packages)
     
     def get_all_packages(self) -> List[Package]:
         """Get all packages."""
@@ -30,10 +33,4 @@ class PackageProvider:
         """Filter packages based on search text."""
         if not search_text:
             return self.packages
-        
-        search_text = search_text.lower()
-        return [
-            pkg for pkg in self.packages
-            if search_text in pkg.name.lower() or
-               search_text in pkg.description.lower()
-        ]
+        return self.search_index.filter(search_text)
@@ -5,18 +5,25 @@ Provides package removal functionality with search capabilities.
 Features:
 - Package search
 - List of installed packages
-- Safe package removal
+- Safe package removal, one transaction for all checked packages
+- Removal preview of what depends on the checked packages
 """
 
 from typing import List, Dict, Any
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QScrollArea, 
-                            QPushButton, QHBoxLayout, QLineEdit, QMessageBox, QLayoutItem)
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QListView,
+                            QPushButton, QHBoxLayout, QLineEdit, QMessageBox)
 from PyQt6.QtCore import Qt, QProcess
 from models.package import Package
-from utils.themes.colors import ThemeColors
-from utils.themes.fonts import Fonts
+from components.lists.package_list_model import PackageListModel
+from components.lists.package_filter_proxy import PackageFilterProxyModel
+from components.lists.package_delegate import PackageItemDelegate
 from services.aur_storage import AurPackageStorage
 from services.page_communicator import PageCommunicator
+from services.search_index import SearchIndex
+from services.log_archive import LogArchive, LogWriter
+from services.dependency_graph import DependencyGraph, DependencyGraphCache, RemovalPreview
+from services.job_runner import JobPriority, JobResult, JobRunner
+from utils.progress_parser import ErrorEvent, OutputLine, ProgressParser
 
 class DeletePage(QWidget):
     """Package deletion page with search functionality"""
@@ -25,8 +32,21 @@ class DeletePage(QWidget):
         super().__init__()
         self.communicator = PageCommunicator.instance()
         self.communicator.refreshNeeded.connect(self.refresh_packages)
-        self.aur_storage = AurPackageStorage()
+        self.aur_storage = AurPackageStorage.instance()
+        self.aur_storage.packagesChanged.connect(self._on_packages_changed)
         self.process: QProcess | None = None
+        self.removal_parser: ProgressParser | None = None
+        self.removal_log: LogWriter | None = None
+        self.removal_errors: List[str] = []
+        self.removal_tail: List[str] = []  # last lines, shown if no error was recognized
+        self.dependency_graph: DependencyGraph | None = None
+        self._graph_job: int | None = None
+        
+        # Installed packages, filtered by the search input through a proxy
+        self.package_model = PackageListModel(self)
+        self.package_model.set_checkable(True)
+        self.filter_model = PackageFilterProxyModel(self)
+        self.filter_model.setSourceModel(self.package_model)
         
         # Load initial packages from storage
         self.refresh_packages()
@@ -55,14 +75,9 @@ class DeletePage(QWidget):
     def create_header(self) -> QWidget:
         """Create warning header section"""
         container = QWidget()
-        container.setStyleSheet(f"""
-            QWidget {{
-                background: {ThemeColors.DARK};
-                border: 4px solid {ThemeColors.WARNING};
-                border-radius: 12px;
-                padding: 15px;
-            }}
-        """)
+        container.setProperty("role", "panel")
+        container.setProperty("variant", "warning")
+        container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
         layout = QVBoxLayout(container)
         layout.setContentsMargins(15, 10, 15, 10)
@@ -70,20 +85,13 @@ class DeletePage(QWidget):
         
         # Warning title
         title = QLabel("⚠️ Package Removal")
-        title.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.XLARGE}px;
-            color: {ThemeColors.WARNING};
-        """)
+        title.setProperty("role", "title")
+        title.setProperty("variant", "warning")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Warning message
         warning = QLabel("Select packages to remove. This action cannot be undone!")
-        warning.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.MEDIUM}px;
-            color: {ThemeColors.TEXT};
-        """)
+        warning.setProperty("role", "subtitle")
         warning.setAlignment(Qt.AlignmentFlag.AlignCenter)
         warning.setWordWrap(True)
 
@@ -95,14 +103,9 @@ class DeletePage(QWidget):
     def create_search_section(self) -> QWidget:
         """Create search and refresh section"""
         container = QWidget()
-        container.setStyleSheet(f"""
-            QWidget {{
-                background: {ThemeColors.DARK};
-                border: 3px solid {ThemeColors.LIGHT};
-                border-radius: 10px;
-                padding: 15px;
-            }}
-        """)
+        container.setProperty("role", "panel")
+        container.setProperty("variant", "quiet")
+        container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
         layout = QHBoxLayout(container)
         layout.setContentsMargins(10, 5, 10, 5)
@@ -112,180 +115,154 @@ class DeletePage(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search installed packages...")
         self.search_input.textChanged.connect(self.filter_packages)
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                color: {ThemeColors.TEXT};
-                background: {ThemeColors.MEDIUM};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-                padding: 8px 15px;
-                min-height: 40px;
-            }}
-        """)
+        self.search_input.setProperty("role", "search")
         
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         refresh_btn.clicked.connect(self.manual_refresh)
-        refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                color: {ThemeColors.TEXT};
-                background: {ThemeColors.MEDIUM};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-                padding: 8px 25px;
-                min-width: 120px;
-                min-height: 40px;
-            }}
-            QPushButton:hover {{
-                background: {ThemeColors.LIGHT};
-                border-color: {ThemeColors.HIGHLIGHT};
-                color: {ThemeColors.HIGHLIGHT};
-            }}
-        """)
+        refresh_btn.setProperty("role", "action")
+        
+        # Remove every checked package in one go
+        self.remove_selected_btn = QPushButton()
+        self.remove_selected_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.remove_selected_btn.clicked.connect(self.delete_selected)
+        self.remove_selected_btn.setProperty("role", "action")
+        self.package_model.checkedChanged.connect(self.update_remove_selected)
+        self.update_remove_selected(0)
         
         layout.addWidget(self.search_input, stretch=1)
         layout.addWidget(refresh_btn)
+        layout.addWidget(self.remove_selected_btn)
         
         return container
 
-    def create_packages_section(self) -> QScrollArea:
-        """Create scrollable packages list section"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea { 
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                width: 12px;
-                background: transparent;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 107, 107, 0.3);
-                border-radius: 6px;
-                min-height: 30px;
-            }
-        """)
+    def create_packages_section(self) -> QWidget:
+        """Create the virtualized packages list section"""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
 
-        content = QWidget()
-        self.packages_layout = QVBoxLayout(content)
-        self.packages_layout.setSpacing(10)
-        
-        # Initial display of packages
-        self.display_packages()
-        
-        scroll.setWidget(content)
-        return scroll
+        # No results message, shown instead of the list
+        self.no_results = QLabel("No packages found 🔍")
+        self.no_results.setProperty("role", "empty")
+        self.no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.no_results)
+
+        # What removing the checked packages would break or leave behind
+        self.removal_preview = QLabel()
+        self.removal_preview.setProperty("role", "subtitle")
+        self.removal_preview.setWordWrap(True)
+        self.removal_preview.hide()
+        layout.addWidget(self.removal_preview)
+
+        self.package_view = QListView()
+        self.package_view.setModel(self.filter_model)
+        self.package_delegate = PackageItemDelegate("🗑️ Remove", accent="WARNING",
+                                                    parent=self.package_view)
+        self.package_delegate.actionClicked.connect(self.delete_package)
+        self.package_view.setItemDelegate(self.package_delegate)
+        self.package_view.setUniformItemSizes(True)
+        self.package_view.setMouseTracking(True)
+        self.package_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.package_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.package_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.package_view.setProperty("role", "packages")
+        self.package_view.setProperty("variant", "warning")
+        layout.addWidget(self.package_view)
+
+        # Keep the empty state in step with filtering and removals
+        for signal in (self.filter_model.rowsInserted, self.filter_model.rowsRemoved,
+                       self.filter_model.modelReset, self.filter_model.layoutChanged):
+            signal.connect(self.update_empty_state)
+        self.update_empty_state()
+
+        return container
     
     def filter_packages(self) -> None:
         """Filter packages based on search text"""
-        search_text = self.search_input.text().lower()
-        self.displayed_packages = [
-            pkg for pkg in self.all_packages
-            if search_text in pkg.name.lower()
-        ]
-        self.display_packages()
-    
-    def display_packages(self) -> None:
-        """Display filtered packages in the list"""
-        # Clear current list
-        while self.packages_layout.count():
-            item: QLayoutItem = self.packages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        if not self.displayed_packages:
-            # Show no results message
-            no_results = QLabel("No packages found 🔍")
-            no_results.setStyleSheet(f"""
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.LARGE}px;
-                color: {ThemeColors.ACCENT};
-                padding: 20px;
-                background: {ThemeColors.DARK};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-            """)
-            no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.packages_layout.addWidget(no_results)
-            return
-        
-        # Add package items
-        for pkg in self.displayed_packages:
-            self.add_package_item(pkg)
-    
-    def add_package_item(self, pkg: Package) -> None:
-        """Create and add a package item to the list"""
-        item = QWidget()
-        item.setMaximumHeight(80)  # Limit height
-        item.setStyleSheet(f"""
-            QWidget {{
-                background: {ThemeColors.MEDIUM};
-                border: 3px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-                padding: 12px;
-            }}
-            QWidget:hover {{
-                border-color: {ThemeColors.WARNING};
-                background: {ThemeColors.DARK};
-            }}
-        """)
+        self.filter_model.set_query(self.search_input.text())
 
-        layout = QHBoxLayout(item)
-        layout.setContentsMargins(15, 8, 15, 8)
+    def update_empty_state(self) -> None:
+        """Show the no results message when nothing matches"""
+        has_rows = self.filter_model.rowCount() > 0
+        self.no_results.setVisible(not has_rows)
+        self.package_view.setVisible(has_rows)
 
-        # Package info with pixel border
-        info = QLabel(f"📦 {pkg.name} (v{pkg.version})")
-        info.setMaximumWidth(250)  # Limit width
-        info.setWordWrap(True)
-        info.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.MEDIUM}px;
-            color: {ThemeColors.TEXT};
-            background: {ThemeColors.DARK};
-            border: 2px solid {ThemeColors.LIGHT};
-            border-radius: 4px;
-            padding: 8px 15px;
-        """)
+    def update_remove_selected(self, count: int) -> None:
+        """Show how many packages are checked"""
+        self.remove_selected_btn.setText(f"🗑️ Remove selected ({count})")
+        self.remove_selected_btn.setEnabled(count > 0)
+        self.update_removal_preview()
+
+    def update_removal_preview(self) -> None:
+        """Show what removing the checked packages would do"""
+        if not hasattr(self, 'removal_preview'):
+            return
+        names = [pkg.name for pkg in self.package_model.checked_packages()]
+        if not names or self.dependency_graph is None:
+            self.removal_preview.hide()
+            return
+        preview = self.dependency_graph.removal_preview(names)
+        self.removal_preview.setText(self.describe_removal(preview))
+        self.removal_preview.show()
+
+    def describe_removal(self, preview: RemovalPreview) -> str:
+        """Summarize a removal preview for the user"""
+        if preview.safe:
+            lines = ["✔️ Nothing else depends on the selected packages."]
+        else:
+            required_by = [f"{name} (needs {', '.join(needed)})"
+                           for name, needed in sorted(preview.broken.items())]
+            lines = ["⚠️ Required by: " + ", ".join(required_by)]
+        if preview.unneeded:
+            lines.append("No longer needed afterwards: " + ", ".join(preview.unneeded))
+        return "\n".join(lines)
 
-        # Delete button with warning colors
-        delete_btn = QPushButton("🗑️ Remove")
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                color: {ThemeColors.WARNING};
-                background: transparent;
-                border: 2px solid {ThemeColors.WARNING};
-                border-radius: 4px;
-                padding: 4px 12px;
-                min-width: 90px;
-            }}
-            QPushButton:hover {{
-                background: {ThemeColors.WARNING};
-                color: {ThemeColors.DARK};
-            }}
-        """)
-        delete_btn.clicked.connect(lambda: self.delete_package(item, pkg.name))
+    def delete_selected(self) -> None:
+        """Remove every checked package"""
+        self.delete_packages(self.package_model.checked_packages())
 
-        layout.addWidget(info, stretch=1)
-        layout.addWidget(delete_btn)
-        self.packages_layout.addWidget(item)
+    def delete_package(self, pkg: Package) -> None:
+        """Remove a single package"""
+        self.delete_packages([pkg])
 
-    def delete_package(self, item: QWidget, package_name: str) -> None:
-        """Handle package deletion"""
+    def delete_packages(self, packages: List[Package]) -> None:
+        """Handle package deletion, removing all packages in one transaction"""
+        package_names = [pkg.name for pkg in packages]
+        if not package_names or self.process is not None:
+            return
+        if len(package_names) == 1:
+            question = f"Are you sure you want to remove {package_names[0]}?"
+            progress = f"Removing {package_names[0]}..."
+        else:
+            question = (f"Are you sure you want to remove these {len(package_names)} packages?\n\n"
+                        + ", ".join(package_names))
+            progress = f"Removing {len(package_names)} packages..."
+        # pacman's dependency checks always stay on; dependents are either
+        # removed along with the targets or the removal is refused
+        arguments = ['-R', '--noconfirm']
+        removed_names = package_names
+        preview = self.dependency_graph.removal_preview(package_names) if self.dependency_graph is not None else None
+        if preview is None:
+            question += "\n\nDependencies are still being checked; the removal is refused if anything needs these packages."
+        elif preview.safe:
+            question += "\n\n" + self.describe_removal(preview)
+        else:
+            cascade = self.dependency_graph.cascade_removal(package_names)
+            dependents = [name for name in cascade.targets if name not in package_names]
+            question += ("\n\n⚠️ Other packages need these. Removing them also removes: "
+                         + ", ".join(dependents))
+            if cascade.unneeded:
+                question += "\nand their no longer needed dependencies: " + ", ".join(cascade.unneeded)
+            arguments = ['-Rcs', '--noconfirm']
+            removed_names = cascade.targets + cascade.unneeded
         # Confirm deletion
         confirm = QMessageBox.question(
             self,
             "Confirm Deletion",
-            f"Are you sure you want to remove {package_name}?",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
@@ -293,24 +270,11 @@ class DeletePage(QWidget):
             # Show deletion dialog
             self.delete_dialog = QWidget()
             self.delete_dialog.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-            self.delete_dialog.setStyleSheet(f"""
-                background: {ThemeColors.DARK};
-                border: 4px solid {ThemeColors.WARNING};
-                border-radius: 15px;
-            """)
+            self.delete_dialog.setObjectName("delete_dialog")
+            self.delete_dialog.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
             
             dialog_layout = QVBoxLayout(self.delete_dialog)
-            msg = QLabel(f"Removing {package_name}...")
-            msg.setStyleSheet(f"""
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                color: {ThemeColors.WARNING};
-                padding: 5px;
-                margin: 5px;
-                background: {ThemeColors.DARK};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 5px;
-            """)
+            msg = QLabel(progress)
             msg.setWordWrap(True)
             msg.setMaximumWidth(300)
             msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -319,19 +283,25 @@ class DeletePage(QWidget):
             self.delete_dialog.setFixedSize(350, 150)
             self.delete_dialog.show()
             
-            # Start deletion process
+            # Start deletion process, archiving its output as it streams in
+            self.removal_parser = ProgressParser(len(package_names))
+            self.removal_log = LogArchive.instance().create(
+                " ".join(["yay"] + arguments + package_names)
+            )
+            self.removal_errors = []
+            self.removal_tail = []
             self.process = QProcess()
+            self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+            self.process.readyReadStandardOutput.connect(self.read_removal_output)
             self.process.finished.connect(
-                lambda: self.handle_deletion_complete(item, package_name)
+                lambda: self.handle_deletion_complete(package_names, removed_names)
             )
-            self.process.start('yay', ['-Rdd', '--noconfirm', package_name])
+            self.process.start('yay', arguments + package_names)
 
     def manual_refresh(self) -> None:
         """Handle manual refresh request"""
-        # First sync with system to get latest changes
-        self.aur_storage.sync_with_system()
-        # Then refresh the display
-        self.refresh_packages()
+        # Sync with system in the background, then refresh the display
+        self.aur_storage.sync_async(lambda report: self.refresh_packages())
 
     def refresh_packages(self) -> None:
         """Refresh package list from storage"""
@@ -340,33 +310,99 @@ class DeletePage(QWidget):
             Package(name, data["version"], data.get("description", ""))
             for name, data in stored_packages.items()
         ]
-        self.displayed_packages = self.all_packages.copy()
-        if hasattr(self, 'packages_layout'):
-            self.display_packages()
+        self.search_index = SearchIndex(self.all_packages, include_description=False)
+        # Rows are reconciled, so unchanged packages keep their rows
+        self.package_model.set_source(self.all_packages)
+        self.filter_model.set_search_index(self.search_index)
+        self.load_dependency_graph()
 
-    def handle_deletion_complete(self, item: QWidget, package_name: str) -> None:
-        """Handle package deletion completion"""
-        if self.process and self.process.exitCode() == 0:
+    def load_dependency_graph(self) -> None:
+        """Build or refresh the dependency graph in the background"""
+        runner = JobRunner.instance()
+        if self._graph_job is not None:
+            runner.cancel(self._graph_job)
+        self._graph_job = runner.run_call(
+            DependencyGraphCache.instance().get_graph, name="dependency graph",
+            priority=JobPriority.LOW, on_finished=self.apply_dependency_graph
+        )
+
+    def apply_dependency_graph(self, result: JobResult) -> None:
+        """Use a freshly loaded dependency graph"""
+        if result.job_id != self._graph_job or result.cancelled:
+            return
+        self._graph_job = None
+        if not result.ok:
+            print(f"Error loading dependency graph: {result.error}")
+            return
+        graph = self.dependency_graph = result.value
+        for pkg in self.all_packages:
+            node = graph.node(pkg.name)
+            if node is not None:
+                pkg.dependencies = [graph.names[dep] for dep in graph.dependencies(node)]
+        self.update_removal_preview()
+
+    def _on_packages_changed(self, names: List[str]) -> None:
+        """Refresh after storage picked up changes made outside the app"""
+        stored_packages = self.aur_storage.get_all_packages()
+        if all(name not in stored_packages and self.package_model.find_row(name) < 0
+               for name in names):
+            # Removals this page already applied row by row
+            return
+        self.refresh_packages()
+
+    def read_removal_output(self) -> None:
+        """Archive the removal output read so far"""
+        if self.process is not None:
+            self.handle_removal_events(
+                self.removal_parser.feed(self.process.readAllStandardOutput().data())
+            )
+
+    def handle_removal_events(self, events: List) -> None:
+        """Store parsed removal output and remember what went wrong"""
+        self.removal_log.add_events(events)
+        for event in events:
+            if isinstance(event, ErrorEvent):
+                self.removal_errors.append(event.message)
+            elif isinstance(event, OutputLine) and event.text:
+                self.removal_tail = (self.removal_tail + [event.text])[-5:]
+
+    def handle_deletion_complete(self, package_names: List[str], removed_names: List[str]) -> None:
+        """
+        Handle completion of a removal transaction.
+
+        Args:
+            package_names (List[str]): Packages the user chose to remove
+            removed_names (List[str]): Every package the transaction removes,
+                including dependents and dependencies of a cascading removal
+        """
+        self.read_removal_output()
+        process, self.process = self.process, None
+        if self.removal_log is not None:
+            self.handle_removal_events(self.removal_parser.finish())
+            self.removal_log.close(process.exitCode() if process else None)
+            self.removal_log = None
+        if process and process.exitCode() == 0:
             try:
-                # Remove from storage
-                self.aur_storage.remove_package(package_name)
-                
-                # Notify other pages to refresh
-                self.communicator.packageDeleted.emit(package_name)
-                self.communicator.request_refresh()
-                
-                # Update UI
-                self.refresh_packages()
+                # Drop just these rows, then update storage once for the
+                # whole batch; its packagesChanged notifies the other pages
+                self.package_model.remove_packages(removed_names)
+                self.package_model.clear_checked()
+                self.aur_storage.remove_packages(removed_names)
                 
                 # Close dialog
                 if hasattr(self, 'delete_dialog'):
                     self.delete_dialog.close()
-                    
-                QMessageBox.information(self, "Success", f"{package_name} was successfully removed!")
+                
+                if len(package_names) == 1:
+                    message = f"{package_names[0]} was successfully removed!"
+                else:
+                    message = f"{len(package_names)} packages were successfully removed!"
+                QMessageBox.information(self, "Success", message)
             except Exception as e:
                 print(f"Error completing deletion: {e}")
         else:
-            error = self.process.readAllStandardError().data().decode()
-            QMessageBox.critical(self, "Error", f"Failed to remove {package_name}\n{error}")
+            error = "\n".join(self.removal_errors or self.removal_tail)
+            QMessageBox.critical(self, "Error",
+                                 f"Failed to remove {', '.join(package_names)}\n{error}")
             if hasattr(self, 'delete_dialog'):
-                self.delete_dialog.close()
\ No newline at end of file
+                self.delete_dialog.close()
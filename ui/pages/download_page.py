@@ -3,19 +3,31 @@ from PyQt6.QtCore import Qt
 from models.package import Package
 from utils.styles import *
 from utils.system_checks import check_yay_installation
+from services.job_runner import JobRunner
 from typing import List
 
 class DownloadPage(QWidget):
     def __init__(self):
         super().__init__()
         self.packages: List[Package] = [Package(f"Downloadable {i}", "1.0.0", "main") for i in range(8)]
-        self.check_dependencies()
+        self.aur_buttons: List[QPushButton] = []
         self.initUI()
+        self.check_dependencies()
         
     def check_dependencies(self):
-        """Check if required dependencies (yay) are installed"""
-        is_yay_installed, install_message = check_yay_installation()
+        """Check in the background if required dependencies (yay) are installed"""
+        JobRunner.instance().run_call(check_yay_installation, on_finished=self.on_dependencies_checked)
+    
+    def on_dependencies_checked(self, result):
+        """Disable AUR installs and explain why if yay is missing"""
+        if not result.ok:
+            return
+        is_yay_installed, install_message = result.value
         if not is_yay_installed:
+            for install_btn in self.aur_buttons:
+                install_btn.setEnabled(False)
+                install_btn.setToolTip("yay is required to install AUR packages")
+            
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Icon.Warning)
             msg.setWindowTitle("Missing Dependencies")
@@ -73,11 +85,9 @@ class DownloadPage(QWidget):
         install_btn = QPushButton("⬇️ Install")
         install_btn.setFixedSize(100, 28)  # Comfortable height with smaller width
         
-        # Check if yay is available
-        is_yay_installed, _ = check_yay_installation()
-        if not is_yay_installed and pkg.repo.lower() == "aur":
-            install_btn.setEnabled(False)
-            install_btn.setToolTip("yay is required to install AUR packages")
+        # Disabled later if yay turns out to be missing
+        if pkg.repo.lower() == "aur":
+            self.aur_buttons.append(install_btn)
         
         install_btn.setStyleSheet(f"""
             QPushButton {{
@@ -4,36 +4,32 @@ Provides real-time package search functionality.
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-                            QPushButton, QScrollArea, QLabel, QMessageBox)
-from PyQt6.QtCore import Qt, QProcess, pyqtSignal, QTimer
+                            QPushButton, QListView, QLabel, QMessageBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 import pexpect
 import sys
-import subprocess
+from typing import Optional
 from models.package import Package
-from utils.themes.colors import ThemeColors
-from utils.themes.fonts import Fonts
+from components.lists.package_list_model import PackageListModel
+from components.lists.package_delegate import PackageItemDelegate
 from ui.dialogs.install_dialog import InstallDialog
 from ui.dialogs.password_dialog import PasswordDialog
 from services.aur_storage import AurPackageStorage
+from services.catalog_cache import CatalogCache
+from services.search_index import SearchIndex
+from services.search_controller import SearchController
 from services.auth_manager import AuthManager
 from services.sudo_auth import SudoAuth
 from services.page_communicator import PageCommunicator
-
-class PackageProcess(QProcess):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
-        self.dialog = None
-        
-    def start_installation(self, pkg_name, is_official):
-        """Start the installation process"""
-        if is_official:
-            self.start('sudo', ['pacman', '-S', '--noconfirm', pkg_name])
-        else:
-            self.start('yay', ['-S', '--noconfirm', pkg_name])
+from services.warmup import WarmData
+from services.job_runner import JobRunner
+from services.install_queue import InstallQueue
 
 class SearchPage(QWidget):
-    def __init__(self):
+    # Seconds allowed for a package database update
+    DB_UPDATE_TIMEOUT = 300
+    
+    def __init__(self, warm_data: Optional[WarmData] = None):
         super().__init__()
         self.sudo_auth = SudoAuth()
         self.communicator = PageCommunicator.instance()  # Use instance method
@@ -41,81 +37,87 @@ class SearchPage(QWidget):
         if not self.sudo_auth.authenticate(self):
             sys.exit(1)
         
-        self.page_size = 200
-        self.current_page = 0
-        self.aur_storage = AurPackageStorage()  # Move this up
+        self.aur_storage = AurPackageStorage.instance()  # Move this up
+        self.catalog_cache = CatalogCache.instance()
         self.auth_manager = AuthManager()
+
+        # Searches run debounced on a worker thread
+        self.search_controller = SearchController(parent=self)
+        self.search_controller.resultsReady.connect(self.show_search_results)
         
-        # Update and fetch packages
-        self.update_package_database()
-        self.all_packages = self.fetch_packages()
-        self.displayed_packages = self.all_packages[:self.page_size]
+        # Installs are batched into as few transactions as possible
+        self.install_queue = InstallQueue(self)
+        self.install_queue.batchStarted.connect(self.show_install_dialog)
+        self.install_queue.batchFinished.connect(self.handle_installation_complete)
+        self.install_dialog = None
+        
+        # Start from the warm-up data when it is still current, otherwise
+        # load the catalog in the background
+        self._refresh_job = None
+        self.package_model = PackageListModel(self)
+        self.package_model.set_checkable(True)
+        if warm_data is not None and warm_data.is_current(self.catalog_cache, self.aur_storage):
+            self.all_packages = warm_data.available
+            self.search_index = warm_data.search_index
+        else:
+            self.all_packages = []
+            self.search_index = SearchIndex(self.all_packages)
+            self.refresh_packages()
+        self.search_controller.set_index(self.search_index)
+        self.package_model.set_source(self.all_packages)
         self.initUI()
         
+        # Pull the latest databases, then reload
+        self.update_package_database()
+        
         # Connect to signals
         self.communicator.packageDeleted.connect(self.handle_package_deleted)
         self.communicator.packageUpdated.connect(self.refresh_package_list)
         self.communicator.refreshNeeded.connect(self.refresh_packages)
+        self.aur_storage.packagesChanged.connect(self._on_packages_changed)
 
     def update_package_database(self):
-        """Update package database before fetching"""
-        try:
-            # Update official repos
-            subprocess.run(['sudo', 'pacman', '-Sy'], check=True)
+        """Update package databases in the background, then reload the catalog"""
+        runner = JobRunner.instance()
+        
+        def repos_updated(result):
+            if not result.ok:
+                print(f"Error updating package database: {result.error or result.stderr}")
+                return
             # Update AUR
-            subprocess.run(['yay', '-Sy'], check=True)
-        except Exception as e:
-            print(f"Error updating package database: {e}")
+            runner.run_command(['yay', '-Sy'], timeout=self.DB_UPDATE_TIMEOUT,
+                               on_finished=aur_updated)
+        
+        def aur_updated(result):
+            if not result.ok:
+                print(f"Error updating package database: {result.error or result.stderr}")
+            self.refresh_packages()
+        
+        # Update official repos
+        runner.run_command(['sudo', 'pacman', '-Sy'], timeout=self.DB_UPDATE_TIMEOUT,
+                           on_finished=repos_updated)
+    
+    def load_packages(self):
+        """
+        Fetch the package catalog and build its search index.
+        
+        Runs on a job runner thread.
+        
+        Returns:
+            tuple: Available packages and their SearchIndex
+        """
+        packages = self.fetch_packages()
+        return packages, SearchIndex(packages)
     
     def fetch_packages(self):
-        """Fetch packages using yay command"""
+        """Load available packages from the pacman sync databases"""
         try:
-            # Get installed packages first
+            # Installed AUR packages are not offered again
             installed_packages = set(self.aur_storage.get_all_packages().keys())
-            
-            # Fetch all available packages
-            result = subprocess.run(['yay', '-Ss'], 
-                                 capture_output=True, 
-                                 text=True,
-                                 check=True)
-            
-            packages = []
-            current_pkg = None
-            
-            for line in result.stdout.split('\n'):
-                if not line:  # Skip empty lines
-                    continue
-                    
-                if line.startswith('    '):  # Description line
-                    if current_pkg and current_pkg.name not in installed_packages:
-                        current_pkg.description = line.strip()
-                else:
-                    try:
-                        parts = line.split('/')
-                        if len(parts) >= 2:
-                            repo_pkg = parts[1].split()
-                            if len(repo_pkg) >= 2:
-                                name = repo_pkg[0]
-                                
-                                # Skip if already installed
-                                if name in installed_packages:
-                                    current_pkg = None
-                                    continue
-                                    
-                                version = repo_pkg[1]
-                                repo = parts[0]
-                                current_pkg = Package(name, version, repo)
-                                packages.append(current_pkg)
-                    except Exception as e:
-                        print(f"Error parsing line '{line}': {e}")
-                        current_pkg = None
-                        continue
-            
-            return packages
-            
-        except subprocess.CalledProcessError as e:
-            print(f"Error running yay: {e}")
-            return []
+            return [
+                pkg for pkg in self.catalog_cache.get_catalog()
+                if pkg.name not in installed_packages
+            ]
         except Exception as e:
             print(f"Error fetching packages: {e}")
             return []
@@ -137,54 +139,37 @@ class SearchPage(QWidget):
         
         # Results counter
         self.results_counter = QLabel()
-        self.results_counter.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.MEDIUM}px;
-            color: {ThemeColors.TEXT};
-            padding: 10px;
-        """)
+        self.results_counter.setProperty("role", "counter")
         results_layout.addWidget(self.results_counter)
         
-        # Scrollable results list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea { 
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                width: 12px;
-                background: transparent;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(124, 255, 186, 0.3);
-                border-radius: 6px;
-                min-height: 30px;
-            }
-        """)
-        
-        self.content = QWidget()
-        self.packages_layout = QVBoxLayout(self.content)
-        self.packages_layout.setSpacing(10)
-        self.packages_layout.setContentsMargins(5, 5, 5, 5)
+        # No results message, shown instead of the list
+        self.no_results = QLabel("No packages found 😔")
+        self.no_results.setProperty("role", "empty")
+        self.no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        results_layout.addWidget(self.no_results)
         
-        scroll.setWidget(self.content)
-        results_layout.addWidget(scroll)
+        # Virtualized results list; only visible rows are painted
+        self.package_view = QListView()
+        self.package_view.setModel(self.package_model)
+        self.package_delegate = PackageItemDelegate(parent=self.package_view)
+        self.package_delegate.actionClicked.connect(self.install_package)
+        self.package_view.setItemDelegate(self.package_delegate)
+        self.package_view.setUniformItemSizes(True)
+        self.package_view.setMouseTracking(True)
+        self.package_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.package_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.package_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.package_view.setProperty("role", "packages")
+        results_layout.addWidget(self.package_view)
         
         main_layout.addWidget(self.results_container)
-        self.display_packages()
+        self.update_results_counter()
     
     def create_search_section(self):
         """Create enhanced search controls"""
         container = QWidget()
-        container.setStyleSheet(f"""
-            QWidget {{
-                background: {ThemeColors.DARK};
-                border: 4px solid {ThemeColors.HIGHLIGHT};
-                border-radius: 12px;
-            }}
-        """)
+        container.setProperty("role", "panel")
+        container.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         
         layout = QVBoxLayout(container)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -192,11 +177,7 @@ class SearchPage(QWidget):
         
         # Title
         title = QLabel("🔍 Package Search")
-        title.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.XLARGE}px;
-            color: {ThemeColors.HIGHLIGHT};
-        """)
+        title.setProperty("role", "title")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Search controls
@@ -209,48 +190,28 @@ class SearchPage(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Enter package name to search...")
         self.search_input.setMinimumHeight(45)
-        self.search_input.setStyleSheet(f"""
-            QLineEdit {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                color: {ThemeColors.TEXT};
-                background: {ThemeColors.MEDIUM};
-                border: 3px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-                padding: 8px 15px;
-            }}
-            QLineEdit:focus {{
-                border-color: {ThemeColors.HIGHLIGHT};
-                background: {ThemeColors.DARK};
-            }}
-        """)
+        self.search_input.setProperty("role", "search")
         self.search_input.textChanged.connect(self.on_search_text_changed)
         
         # Search button
         search_btn = QPushButton("🔎 Search")
         search_btn.setMinimumHeight(45)
         search_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        search_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.MEDIUM}px;
-                color: {ThemeColors.TEXT};
-                background: {ThemeColors.MEDIUM};
-                border: 3px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-                padding: 8px 25px;
-                min-width: 140px;
-            }}
-            QPushButton:hover {{
-                background: {ThemeColors.LIGHT};
-                border-color: {ThemeColors.HIGHLIGHT};
-                color: {ThemeColors.HIGHLIGHT};
-            }}
-        """)
+        search_btn.setProperty("role", "action")
         search_btn.clicked.connect(self.perform_search)
         
+        # Install every checked package in one go
+        self.install_selected_btn = QPushButton()
+        self.install_selected_btn.setMinimumHeight(45)
+        self.install_selected_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.install_selected_btn.setProperty("role", "action")
+        self.install_selected_btn.clicked.connect(self.install_selected)
+        self.package_model.checkedChanged.connect(self.update_install_selected)
+        self.update_install_selected(0)
+        
         controls_layout.addWidget(self.search_input, stretch=1)
         controls_layout.addWidget(search_btn)
+        controls_layout.addWidget(self.install_selected_btn)
         
         layout.addWidget(title)
         layout.addWidget(controls)
@@ -259,242 +220,110 @@ class SearchPage(QWidget):
     
     def on_search_text_changed(self, text):
         """Handle real-time search as user types"""
-        self.perform_search()
+        self.search_controller.set_query(text)
     
     def perform_search(self):
-        """Perform the actual search operation"""
-        search_text = self.search_input.text().lower().strip()
-        
-        if not search_text:
-            self.displayed_packages = self.all_packages[:self.page_size]
-        else:
-            self.displayed_packages = [
-                pkg for pkg in self.all_packages
-                if search_text in pkg.name.lower() or
-                   search_text in pkg.description.lower()
-            ][:self.page_size]
-        
-        self.display_packages()
+        """Search immediately for the current input"""
+        self.search_controller.search_now(self.search_input.text())
+
+    def show_search_results(self, query, matches):
+        """Display the results of the latest search"""
+        self.package_model.set_rows(matches)
+        self.package_view.scrollToTop()
+        self.update_results_counter()
     
-    def display_packages(self):
-        """Display current filtered packages"""
-        # Update results counter
-        result_count = len(self.displayed_packages)
+    def update_results_counter(self):
+        """Update the results counter and empty state"""
+        result_count = self.package_model.rowCount()
         self.results_counter.setText(
             f"Found {result_count} package{'s' if result_count != 1 else ''}"
         )
-        
-        # Clear current list
-        while self.packages_layout.count():
-            item = self.packages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        if not self.displayed_packages:
-            # Show no results message
-            no_results = QLabel("No packages found 😔")
-            no_results.setStyleSheet(f"""
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.LARGE}px;
-                color: {ThemeColors.ACCENT};
-                padding: 20px;
-                background: {ThemeColors.DARK};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-            """)
-            no_results.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.packages_layout.addWidget(no_results)
-            return
-        
-        # Add package items
-        for pkg in self.displayed_packages:
-            self.add_package_item(pkg)
-            
-        # Add "Show More" button if needed
-        total_packages = len(self.all_packages)
-        displayed_count = len(self.displayed_packages)
-        
-        if displayed_count < total_packages and displayed_count < 1000:
-            show_more = QPushButton("Show More")
-            show_more.setStyleSheet(f"""
-                QPushButton {{
-                    font-family: {Fonts.DECORATIVE};
-                    font-size: {Fonts.MEDIUM}px;
-                    color: {ThemeColors.TEXT};
-                    background: {ThemeColors.MEDIUM};
-                    border: 3px solid {ThemeColors.LIGHT};
-                    border-radius: 8px;
-                    padding: 8px 25px;
-                }}
-                QPushButton:hover {{
-                    background: {ThemeColors.LIGHT};
-                    border-color: {ThemeColors.HIGHLIGHT};
-                    color: {ThemeColors.HIGHLIGHT};
-                }}
-            """)
-            show_more.clicked.connect(self.load_more_packages)
-            self.packages_layout.addWidget(show_more)
-
-    def add_package_item(self, pkg):
-        item = QWidget()
-        item.setFixedHeight(80)  # ارتفاع ثابت أصغر
-        
-        layout = QHBoxLayout(item)
-        layout.setContentsMargins(10, 5, 10, 5)
-        layout.setSpacing(10)
-
-        # Package info container
-        info_container = QWidget()
-        info_layout = QVBoxLayout(info_container)
-        info_layout.setContentsMargins(5, 2, 5, 2)
-        info_layout.setSpacing(2)
-
-        # Package name
-        name_label = QLabel(pkg.name)
-        name_label.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.SMALL}px;
-            color: {ThemeColors.HIGHLIGHT};
-            background: {ThemeColors.DARK};
-            padding: 4px 8px;
-            border-radius: 4px;
-        """)
-        name_label.setWordWrap(True)
-
-        # Version info
-        version_label = QLabel(f"Version: {pkg.version}")
-        version_label.setStyleSheet(f"""
-            font-family: {Fonts.DECORATIVE};
-            font-size: {Fonts.SMALL}px;
-            color: {ThemeColors.TEXT};
-        """)
-
-        info_layout.addWidget(name_label)
-        info_layout.addWidget(version_label)
-
-        # Install button
-        install_btn = QPushButton("⬇️ Install")
-        install_btn.setFixedSize(140, 50)  # حجم ثابت أصغر
-        install_btn.setStyleSheet(f"""
-            QPushButton {{
-                font-family: {Fonts.DECORATIVE};
-                font-size: {Fonts.SMALL}px;
-                color: {ThemeColors.HIGHLIGHT};
-                background: {ThemeColors.DARK};
-                border: 2px solid {ThemeColors.HIGHLIGHT};
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background: {ThemeColors.HIGHLIGHT};
-                color: {ThemeColors.DARK};
-            }}
-        """)
-        install_btn.clicked.connect(lambda: self.install_package(pkg))
-
-        layout.addWidget(info_container, stretch=1)
-        layout.addWidget(install_btn)
-        
-        # Container style
-        item.setStyleSheet(f"""
-            QWidget {{
-                background: {ThemeColors.MEDIUM};
-                border: 2px solid {ThemeColors.LIGHT};
-                border-radius: 8px;
-            }}
-            QWidget:hover {{
-                border-color: {ThemeColors.HIGHLIGHT};
-                background: {ThemeColors.DARK};
-            }}
-        """)
-        
-        self.packages_layout.addWidget(item)
+        self.no_results.setVisible(result_count == 0)
+        self.package_view.setVisible(result_count > 0)
 
+    def update_install_selected(self, count):
+        """Show how many packages are checked"""
+        self.install_selected_btn.setText(f"📥 Install selected ({count})")
+        self.install_selected_btn.setEnabled(count > 0)
+    
+    def install_selected(self):
+        """Queue every checked package"""
+        packages = self.package_model.checked_packages()
+        self.package_model.clear_checked()
+        self.install_queue.enqueue(packages)
+    
     def install_package(self, pkg):
-        """Install the selected package"""
+        """Queue a single package"""
+        self.install_queue.enqueue([pkg])
+    
+    def show_install_dialog(self, package_names):
+        """Follow a batch of installs in the installation dialog"""
         try:
-            # Check if package is from official repos
-            is_official = pkg.repo in ['core', 'extra']
-            
-            # Create and configure process
-            self.install_process = PackageProcess(self)
-            self.install_process.readyReadStandardOutput.connect(self.handle_process_output)
-            self.install_process.finished.connect(
-                lambda code, _: self.handle_installation_complete(code == 0, pkg)
-            )
-            
-            # Show installation dialog
-            self.install_dialog = InstallDialog(pkg.name, self)
+            self.install_dialog = InstallDialog(package_names, self)
+            self.install_queue.statusChanged.connect(self.install_dialog.set_package_status)
+            self.install_queue.progressChanged.connect(self.install_dialog.set_progress)
+            self.install_queue.outputReceived.connect(self.install_dialog.append_output)
+            self.install_queue.logArchived.connect(self.install_dialog.add_log)
             self.install_dialog.show()
-            
-            # Start installation with delay
-            QTimer.singleShot(100, lambda: self.install_process.start_installation(pkg.name, is_official))
-            
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
-
-    def handle_process_output(self):
-        """Handle process output in real-time"""
-        if hasattr(self, 'install_process'):
-            try:
-                output = self.install_process.readAllStandardOutput().data().decode()
-                print(output)  # For debugging
-                
-                if "error" in output.lower():
-                    self.install_dialog.close()
-                    QMessageBox.critical(self, "Installation Error", output)
-                elif "successfully installed" in output.lower():
-                    self.install_dialog.show_success()
-            except Exception as e:
-                print(f"Error handling output: {e}")
     
-    def handle_installation_complete(self, success, pkg):
-        """Handle installation completion"""
-        if success:
-            # Update AUR storage
-            if pkg.repo not in ['core', 'extra']:
-                self.aur_storage.update_package(
-                    pkg.name,
-                    pkg.version,
-                    pkg.description
-                )
+    def handle_installation_complete(self, installed, failed):
+        """Record a finished batch and refresh every page once"""
+        if installed:
+            # Update AUR storage with a single write
+            aur_packages = [pkg for pkg in installed if not self.install_queue.is_official(pkg)]
+            if aur_packages:
+                self.aur_storage.update_packages(aur_packages)
             
             # Notify other pages to refresh
-            self.communicator.packageInstalled.emit(pkg.name)
             self.communicator.request_refresh()
-            
-            # Update own display
-            self.refresh_packages()
-            
-            self.install_dialog.show_success()
-        else:
-            QMessageBox.critical(self, "Installation Error", 
-                               "Failed to install package")
-            self.install_dialog.close()
-                
-        try:
-            # Cleanup
-            if hasattr(self, 'install_process'):
-                self.install_process.deleteLater()
-            if hasattr(self, 'install_dialog'):
-                QTimer.singleShot(2000, self.install_dialog.close)
-        except Exception as e:
-            print(f"Error in installation completion: {e}")
-            QMessageBox.critical(self, "Error", str(e))
+        
+        dialog = self.install_dialog
+        if dialog is not None:
+            self.install_queue.statusChanged.disconnect(dialog.set_package_status)
+            self.install_queue.progressChanged.disconnect(dialog.set_progress)
+            self.install_queue.outputReceived.disconnect(dialog.append_output)
+            self.install_queue.logArchived.disconnect(dialog.add_log)
+            if failed:
+                dialog.show_failure(failed)
+            else:
+                dialog.show_success()
+                QTimer.singleShot(2000, dialog.close)
+        if failed:
+            QMessageBox.critical(self, "Installation Error",
+                                 "Failed to install: " + ", ".join(failed))
 
     def refresh_packages(self):
-        """Refresh package list"""
-        self.all_packages = self.fetch_packages()
-        self.displayed_packages = self.all_packages[:self.page_size]
-        self.display_packages()
-
-    def load_more_packages(self):
-        """Load next page of packages"""
-        self.current_page += 1
-        start_idx = self.current_page * self.page_size
-        end_idx = min(start_idx + self.page_size, len(self.all_packages), 1000)
-        self.displayed_packages = self.all_packages[:end_idx]
-        self.display_packages()
+        """Reload the package list in the background"""
+        runner = JobRunner.instance()
+        if self._refresh_job is not None:
+            # Only the newest reload is applied
+            runner.cancel(self._refresh_job)
+        self._refresh_job = runner.run_call(
+            self.load_packages, name="search catalog", on_finished=self.apply_packages
+        )
     
+    def _on_packages_changed(self, names):
+        """Reload when installed AUR packages change, e.g. after a removal"""
+        self.refresh_packages()
+
+    def apply_packages(self, result):
+        """Show the packages of a finished reload"""
+        if result.job_id != self._refresh_job:
+            return
+        self._refresh_job = None
+        if not result.ok:
+            print(f"Error fetching packages: {result.error}")
+            return
+        self.all_packages, self.search_index = result.value
+        self.search_controller.set_index(self.search_index)
+        # Rows are reconciled, so an install only touches the rows it changed
+        self.package_model.set_source(
+            self.all_packages, self.search_index.search(self.search_input.text())
+        )
+        self.update_results_counter()
+
     def handle_package_deleted(self, package_name):
         """Handle when a package is deleted"""
         try:
@@ -504,6 +333,4 @@ class SearchPage(QWidget):
     
     def refresh_package_list(self):
         """Refresh the package list"""
-        self.all_packages = self.fetch_packages()
-        self.displayed_packages = self.all_packages[:self.page_size]
-        self.display_packages()
\ No newline at end of file
+        self.refresh_packages()
\ No newline at end of file
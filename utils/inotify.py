@@ -0,0 +1,129 @@
+"""
+Inotify Module
+Pure-Python ctypes binding for the Linux inotify API.
+
+Only the small subset needed to watch a few directories is exposed:
+creating an instance, adding watches and reading decoded events.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+# inotify_init1 flags
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+@dataclass
+class InotifyEvent:
+    """
+    A decoded inotify event.
+
+    Attributes:
+        path (str): Watched directory the event happened in
+        name (str): Name of the affected entry inside it (may be empty)
+        mask (int): Event mask bits
+    """
+
+    path: str
+    name: str
+    mask: int
+
+
+class Inotify:
+    """
+    Thin wrapper around an inotify file descriptor.
+
+    Raises:
+        OSError: If inotify is not available on this system
+    """
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found, inotify unavailable")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not supported on this platform")
+
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_add_watch.restype = ctypes.c_int
+
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watches: Dict[int, str] = {}
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """
+        Watch a directory for the given events.
+
+        Args:
+            path (str): Directory to watch
+            mask (int): Combination of ``IN_*`` flags
+
+        Returns:
+            int: Watch descriptor
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self._watches[wd] = path
+        return wd
+
+    def read_events(self, timeout: Optional[float] = None) -> List[InotifyEvent]:
+        """
+        Wait for and decode pending events.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, None to block
+
+        Returns:
+            List[InotifyEvent]: Events read, empty if the timeout expired
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        events: List[InotifyEvent] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append(InotifyEvent(self._watches.get(wd, ""), os.fsdecode(name), mask))
+        return events
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
@@ -0,0 +1,131 @@
+"""
+List Diff Module
+Keyed reconciliation of an old and a new list.
+
+Items are matched by key. Items whose key disappeared are removed, new
+keys are inserted where they appear in the new list, and matched items
+whose value changed are reported as updated. Matched items that moved
+are kept along the longest run that is already in order, and only the
+rest are removed and reinserted.
+
+Changes are reported as contiguous runs, so a view model can emit one
+signal per run instead of one per item.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+Run = Tuple[int, int]  # first and last position, inclusive
+
+
+@dataclass
+class ListDiff:
+    """
+    Changes turning an old list into a new one.
+
+    Apply ``removed`` first, in the given (descending) order, then
+    ``inserted`` in the given (ascending) order; the list then has the
+    new list's keys in the new order and ``updated`` marks positions
+    whose items must be replaced.
+
+    Attributes:
+        removed (List[Run]): Runs of old positions to delete, last run first
+        inserted (List[Run]): Runs of new positions to insert
+        updated (List[Run]): Runs of new positions whose value changed
+    """
+    removed: List[Run] = field(default_factory=list)
+    inserted: List[Run] = field(default_factory=list)
+    updated: List[Run] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        """Number of change runs, i.e. signals needed to apply the diff."""
+        return len(self.removed) + len(self.inserted) + len(self.updated)
+
+    def __bool__(self) -> bool:
+        return self.runs > 0
+
+
+def _runs(positions: List[int]) -> List[Run]:
+    """Group ascending positions into contiguous runs."""
+    runs: List[Run] = []
+    for position in positions:
+        if runs and runs[-1][1] == position - 1:
+            runs[-1] = (runs[-1][0], position)
+        else:
+            runs.append((position, position))
+    return runs
+
+
+def _longest_increasing(values: List[int]) -> List[int]:
+    """Get the indices of a longest strictly increasing subsequence."""
+    tails: List[int] = []       # smallest tail value per subsequence length
+    tail_at: List[int] = []     # index of that tail
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_at.append(i)
+        else:
+            tails[length] = value
+            tail_at[length] = i
+        previous[i] = tail_at[length - 1] if length else -1
+
+    result = []
+    i = tail_at[-1] if tail_at else -1
+    while i >= 0:
+        result.append(i)
+        i = previous[i]
+    result.reverse()
+    return result
+
+
+def diff_keyed(old: Sequence, new: Sequence,
+               key: Callable[[object], Hashable],
+               value: Optional[Callable[[object], object]] = None) -> ListDiff:
+    """
+    Compute the changes turning ``old`` into ``new``.
+
+    Args:
+        old (Sequence): Current items
+        new (Sequence): Wanted items
+        key (Callable): Identity of an item, e.g. the package name
+        value (Optional[Callable]): Content compared between matched items,
+            e.g. the package version; matched items are never updated if
+            omitted
+
+    Returns:
+        ListDiff: Removal, insertion and update runs
+    """
+    new_keys = [key(item) for item in new]
+    new_positions = {k: position for position, k in enumerate(new_keys)}
+
+    # Old items that survive, with where they end up
+    matched_old: List[int] = []
+    matched_new: List[int] = []
+    seen = set()
+    for position, item in enumerate(old):
+        k = key(item)
+        target = new_positions.get(k)
+        if target is not None and k not in seen:
+            seen.add(k)
+            matched_old.append(position)
+            matched_new.append(target)
+
+    kept = _longest_increasing(matched_new)
+    kept_old = {matched_old[i] for i in kept}
+    kept_new = [matched_new[i] for i in kept]
+
+    diff = ListDiff()
+    diff.removed = _runs([p for p in range(len(old)) if p not in kept_old])[::-1]
+
+    kept_new_set = set(kept_new)
+    diff.inserted = _runs([p for p in range(len(new)) if p not in kept_new_set])
+
+    if value is not None:
+        changed = [target for source, target in zip((matched_old[i] for i in kept), kept_new)
+                   if value(old[source]) != value(new[target])]
+        diff.updated = _runs(changed)
+    return diff
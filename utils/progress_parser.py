@@ -0,0 +1,391 @@
+"""
+Progress Parser Module
+Incremental parser for pacman, yay and makepkg output.
+
+Output is fed in chunks as it arrives. Complete lines are parsed right
+away and a trailing partial line is kept for the next chunk, so a line
+split across reads is never misread. Progress bar redraws separated by
+carriage returns are parsed as they come but only the last one of a line
+is reported as output.
+
+Each line is turned into typed events: the transaction phase changing
+(resolving, downloading, building, checking, installing or removing,
+hooks), numbered ``(n/m)`` steps, download sizes, makepkg build stages
+and errors. The parser also keeps a running estimate of how far along
+the whole command is, which never goes backwards.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Transaction phases in the order they normally run
+RESOLVING = "resolving"
+DOWNLOADING = "downloading"
+BUILDING = "building"
+CHECKING = "checking"
+INSTALLING = "installing"
+REMOVING = "removing"
+HOOKS = "hooks"
+
+# Share of the overall progress covered by each phase
+PHASE_RANGES: Dict[str, Tuple[float, float]] = {
+    RESOLVING: (0.0, 0.05),
+    DOWNLOADING: (0.05, 0.35),
+    BUILDING: (0.35, 0.6),
+    CHECKING: (0.6, 0.7),
+    INSTALLING: (0.7, 0.95),
+    REMOVING: (0.7, 0.95),
+    HOOKS: (0.95, 1.0),
+}
+
+PHASE_LABELS = {
+    RESOLVING: "Resolving dependencies",
+    DOWNLOADING: "Downloading",
+    BUILDING: "Building",
+    CHECKING: "Checking packages",
+    INSTALLING: "Installing",
+    REMOVING: "Removing",
+    HOOKS: "Running hooks",
+}
+
+# Lines announcing a phase
+_PHASE_LINES = [
+    (re.compile(r"^(?:resolving dependencies|looking for conflicting packages|:: Checking for conflicts)"), RESOLVING),
+    (re.compile(r"^:: Retrieving packages"), DOWNLOADING),
+    (re.compile(r"^:: Processing package changes"), INSTALLING),
+    (re.compile(r"^:: Running (?:pre|post)-transaction hooks"), HOOKS),
+]
+
+# "(2/5) installing foo", "(1/3) checking keys in keyring", "(4/7) Arming ConditionNeedsUpdate..."
+_STEP_LINE = re.compile(r"^\(\s*(\d+)/(\d+)\)\s+(.*?)\s*$")
+_COMMIT_ACTIONS = {
+    "installing": INSTALLING, "upgrading": INSTALLING, "reinstalling": INSTALLING,
+    "downgrading": INSTALLING, "removing": REMOVING,
+}
+
+# "Packages (3) foo-1.0-1  bar-2.1-1  baz-0.3-2"
+_PACKAGES_LINE = re.compile(r"^Packages \((\d+)\)")
+# "Total Download Size:   12.34 MiB"
+_DOWNLOAD_SIZE_LINE = re.compile(r"^Total Download Size:\s+([\d.]+)\s+(\S+)")
+# " foo-1.0-1-x86_64 downloading..." when output isn't a terminal
+_DOWNLOAD_START_LINE = re.compile(r"^\s*(\S+) downloading\.\.\.$")
+# " foo-1.0-1-x86_64   1234.5 KiB  1201 KiB/s 00:01 [#####-----]  45%"
+_DOWNLOAD_BAR_LINE = re.compile(
+    r"^\s*(.+?)\s+([\d.]+)\s+(B|KiB|MiB|GiB|TiB)\s+\S+\s+\S+/s\s+[\d:-]+\s+\[[^\]]*\]\s+(\d+)%\s*$"
+)
+# makepkg: "==> Making package: foo 1.0-1 (Sat Oct 18 12:00:00 2026)"
+_MAKEPKG_LINE = re.compile(r"^==> (.*)$")
+_MAKING_PACKAGE = re.compile(r"^Making package: (\S+)")
+_FINISHED_MAKING = re.compile(r"^Finished making: (\S+)")
+
+# "error: target not found: foo", "==> ERROR: A failure occurred in build()."
+_ERROR_LINE = re.compile(r"^(?:error:|==> ERROR:)\s*(.*)$")
+_MISSING_TARGET = re.compile(r"^target not found: (\S+)")
+
+# makepkg stages in order, used to estimate progress within one build
+_BUILD_STAGES = [
+    "Retrieving sources", "Validating source", "Extracting sources", "Starting prepare()",
+    "Starting build()", "Starting check()", "Entering fakeroot environment",
+    "Starting package()", "Tidying install", "Creating package",
+]
+
+_UNITS = {"B": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3, "TiB": 1024 ** 4}
+
+
+def parse_size(value: str, unit: str) -> int:
+    """
+    Convert a size as printed by pacman to bytes.
+
+    Args:
+        value (str): Number, e.g. "12.34"
+        unit (str): Binary unit, e.g. "MiB"
+
+    Returns:
+        int: Size in bytes, 0 for an unknown unit
+    """
+    return int(float(value) * _UNITS.get(unit, 0))
+
+
+def format_size(size: int) -> str:
+    """Format a byte count the way pacman does."""
+    amount = float(size)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if amount < 1024:
+            return f"{amount:.1f} {unit}" if unit != "B" else f"{size} B"
+        amount /= 1024
+    return f"{amount:.1f} TiB"
+
+
+@dataclass(frozen=True)
+class OutputLine:
+    """A complete line of output."""
+    text: str
+
+
+@dataclass(frozen=True)
+class PhaseEvent:
+    """The transaction entered a new phase."""
+    phase: str
+
+
+@dataclass(frozen=True)
+class StepEvent:
+    """
+    A numbered ``(n/m)`` step.
+
+    Attributes:
+        phase (str): Phase the step belongs to
+        action (str): What the step does, e.g. "installing"
+        index (int): Step number, starting at 1
+        total (int): Number of steps in the phase
+        target (Optional[str]): Package the step works on, if any
+    """
+    phase: str
+    action: str
+    index: int
+    total: int
+    target: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DownloadEvent:
+    """
+    Download progress of one file.
+
+    Attributes:
+        target (str): File or package being downloaded
+        done (int): Bytes downloaded so far, 0 if unknown
+        percent (Optional[int]): Percentage of the file, if shown
+    """
+    target: str
+    done: int = 0
+    percent: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class BuildEvent:
+    """
+    A makepkg stage.
+
+    Attributes:
+        package (Optional[str]): Package being built
+        stage (str): makepkg message, e.g. "Starting build()..."
+        finished (bool): Whether the package is done building
+    """
+    package: Optional[str]
+    stage: str
+    finished: bool = False
+
+
+@dataclass(frozen=True)
+class ErrorEvent:
+    """
+    An error reported by pacman, yay or makepkg.
+
+    Attributes:
+        message (str): Error message without its prefix
+        target (Optional[str]): Package that wasn't found, for missing targets
+    """
+    message: str
+    target: Optional[str] = None
+
+
+class ProgressParser:
+    """
+    Turns command output into progress events.
+
+    Feed raw output with :meth:`feed` and call :meth:`finish` once the
+    command exits. Both return the events for the lines completed by
+    that call; :attr:`progress` and :meth:`describe` give the state of
+    the command so far.
+
+    Attributes:
+        targets (int): Number of packages the command was asked for
+        phase (Optional[str]): Current phase
+        progress (float): Estimated fraction done, between 0 and 1
+    """
+
+    def __init__(self, targets: int = 1) -> None:
+        self.targets = max(targets, 1)
+        self.phase: Optional[str] = None
+        self.progress = 0.0
+        self._partial = b""
+        self._step: Tuple[int, int] = (0, 0)
+        self._step_target: Optional[str] = None
+        self._packages = 0  # from "Packages (n)"
+        self._download_total = 0  # from "Total Download Size"
+        self._downloaded: Dict[str, int] = {}  # bytes per file
+        self._download_started = 0  # files, when there are no progress bars
+        self._build_package: Optional[str] = None
+        self._build_stage = 0
+        self._builds_finished = 0
+
+    def feed(self, data: bytes) -> List:
+        """
+        Parse a chunk of output.
+
+        Args:
+            data (bytes): Output as read from the process
+
+        Returns:
+            List: Events for the lines completed by this chunk
+        """
+        events: List = []
+        *lines, partial = (self._partial + data).split(b"\n")
+        for line in lines:
+            self._parse_redraws(line, events, complete=True)
+        # Redraws before the last carriage return are complete already
+        head, cr, partial = partial.rpartition(b"\r")
+        if cr:
+            self._parse_redraws(head, events, complete=False)
+        self._partial = partial
+        return events
+
+    def finish(self) -> List:
+        """
+        Parse what is left of the output once the command has exited.
+
+        Returns:
+            List: Events for the last, unterminated line
+        """
+        events: List = []
+        if self._partial:
+            self._parse_redraws(self._partial, events, complete=True)
+            self._partial = b""
+        return events
+
+    def describe(self) -> str:
+        """Short description of the current phase for a progress bar."""
+        if self.phase is None:
+            return "Starting"
+        label = PHASE_LABELS[self.phase]
+        if self.phase == DOWNLOADING and self._download_total:
+            done = min(sum(self._downloaded.values()), self._download_total)
+            return f"{label} {format_size(done)} of {format_size(self._download_total)}"
+        if self.phase == BUILDING and self._build_package:
+            return f"{label} {self._build_package}"
+        index, total = self._step
+        if total:
+            target = f" {self._step_target}" if self._step_target else ""
+            return f"{label}{target} ({index}/{total})"
+        return label
+
+    def _parse_redraws(self, data: bytes, events: List, complete: bool) -> None:
+        """Parse every redraw of one line; report the last one as output if it is complete."""
+        segments = [segment for segment in data.decode(errors="replace").split("\r") if segment]
+        for segment in segments:
+            self._parse_line(segment, events)
+        if complete:
+            events.append(OutputLine(segments[-1] if segments else ""))
+
+    def _parse_line(self, line: str, events: List) -> None:
+        """Append the events found in one line and update the progress estimate."""
+        for pattern, phase in _PHASE_LINES:
+            if pattern.match(line):
+                self._enter(phase, events)
+                self._update_progress()
+                return
+
+        match = _STEP_LINE.match(line)
+        if match:
+            self._parse_step(int(match.group(1)), int(match.group(2)), match.group(3), events)
+        elif _DOWNLOAD_BAR_LINE.match(line):
+            self._parse_download_bar(_DOWNLOAD_BAR_LINE.match(line), events)
+        elif _DOWNLOAD_START_LINE.match(line):
+            target = _DOWNLOAD_START_LINE.match(line).group(1)
+            self._enter(DOWNLOADING, events)
+            self._download_started += 1
+            events.append(DownloadEvent(target))
+        elif _MAKEPKG_LINE.match(line) and not line.startswith("==> ERROR:"):
+            self._parse_makepkg(_MAKEPKG_LINE.match(line).group(1), events)
+        elif _ERROR_LINE.match(line):
+            message = _ERROR_LINE.match(line).group(1)
+            missing = _MISSING_TARGET.match(message)
+            events.append(ErrorEvent(message, missing.group(1) if missing else None))
+        elif _PACKAGES_LINE.match(line):
+            self._packages = int(_PACKAGES_LINE.match(line).group(1))
+        elif _DOWNLOAD_SIZE_LINE.match(line):
+            self._download_total = parse_size(*_DOWNLOAD_SIZE_LINE.match(line).groups())
+        else:
+            return
+        self._update_progress()
+
+    def _parse_step(self, index: int, total: int, text: str, events: List) -> None:
+        """Handle a ``(n/m)`` line."""
+        action, _, rest = text.partition(" ")
+        target = None
+        if action in _COMMIT_ACTIONS:
+            phase = _COMMIT_ACTIONS[action]
+            target = rest.split()[0] if rest else None
+        elif action == "checking" or action == "loading":
+            phase = CHECKING
+        elif self.phase == HOOKS:
+            phase = HOOKS
+        else:
+            # yay's "(1/2) Downloaded PKGBUILD: foo" and similar
+            phase = self.phase or RESOLVING
+        self._enter(phase, events)
+        self._step = (index, total)
+        self._step_target = target
+        events.append(StepEvent(phase, action, index, total, target))
+
+    def _parse_download_bar(self, match, events: List) -> None:
+        """Handle a pacman download progress bar."""
+        target, value, unit, percent = match.groups()
+        if target.startswith("Total ("):
+            return
+        self._enter(DOWNLOADING, events)
+        done = parse_size(value, unit)
+        self._downloaded[target] = done
+        events.append(DownloadEvent(target, done, int(percent)))
+
+    def _parse_makepkg(self, message: str, events: List) -> None:
+        """Handle a makepkg ``==>`` line."""
+        making = _MAKING_PACKAGE.match(message)
+        finished = _FINISHED_MAKING.match(message)
+        if making:
+            self._enter(BUILDING, events)
+            self._build_package = making.group(1)
+            self._build_stage = 0
+        elif finished:
+            self._builds_finished += 1
+            self._build_stage = 0
+        elif self.phase == BUILDING:
+            for number, stage in enumerate(_BUILD_STAGES, 1):
+                if message.startswith(stage):
+                    self._build_stage = max(self._build_stage, number)
+                    break
+        else:
+            return
+        events.append(BuildEvent(self._build_package, message, finished is not None))
+
+    def _enter(self, phase: str, events: List) -> None:
+        """Switch to a phase, resetting its step counter."""
+        if phase != self.phase:
+            self.phase = phase
+            self._step = (0, 0)
+            self._step_target = None
+            events.append(PhaseEvent(phase))
+
+    def _update_progress(self) -> None:
+        """Move the estimate forward to the current position within the phase."""
+        if self.phase is None:
+            return
+        start, end = PHASE_RANGES[self.phase]
+        fraction = min(max(self._phase_fraction(), 0.0), 1.0)
+        self.progress = max(self.progress, start + (end - start) * fraction)
+
+    def _phase_fraction(self) -> float:
+        """Fraction of the current phase that is done."""
+        if self.phase == DOWNLOADING:
+            if self._download_total:
+                return sum(self._downloaded.values()) / self._download_total
+            if self._packages:
+                return max(len(self._downloaded), self._download_started) / self._packages
+            return 0.0
+        if self.phase == BUILDING:
+            current = self._build_stage / (len(_BUILD_STAGES) + 1)
+            return (self._builds_finished + current) / self.targets
+        index, total = self._step
+        return index / total if total else 0.0
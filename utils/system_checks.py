@@ -5,6 +5,8 @@ def check_yay_installation() -> Tuple[bool, str]:
     """
     Check if yay (AUR helper) is installed on the system.
     
+    This runs yay and blocks, so GUI code runs it on the JobRunner.
+    
     Returns:
         Tuple[bool, str]: A tuple containing:
             - bool: True if yay is installed, False otherwise
@@ -0,0 +1,351 @@
+"""
+Application Stylesheet Module
+QSS template for the whole application.
+
+Widgets don't carry their own stylesheets. They are matched here by
+object name (``#name``) for one-off widgets, or by the dynamic ``role``
+property (and an optional ``variant``) for widgets that share a look:
+
+- ``panel``: framed header holding a title and controls
+- ``title`` / ``subtitle``: panel headings
+- ``counter``: results counter above a list
+- ``empty``: message shown when a list has no rows
+- ``search``: search input
+- ``action``: regular push button
+- ``packages``: virtualized package list or grid
+
+``variant="warning"`` switches a panel, title or list to the warning colour.
+
+The template is filled in by :class:`utils.themes.theme_engine.ThemeEngine`
+with a theme's colours (``$background``, ``$dark``, ...) and the font
+settings from :class:`utils.themes.fonts.Fonts` (``$decorative``,
+``$size_small``, ``$size_medium``, ``$size_large``, ``$size_xlarge``).
+"""
+
+from string import Template
+
+APP_STYLESHEET = Template("""
+/* Base */
+QWidget {
+    color: $text;
+}
+QMainWindow, QDialog, QMessageBox {
+    background-color: $background;
+}
+QMessageBox QLabel {
+    color: $text;
+}
+
+/* Framed header panels */
+QWidget[role="panel"] {
+    background: $dark;
+    border: 4px solid $highlight;
+    border-radius: 12px;
+}
+QWidget[role="panel"][variant="warning"] {
+    border-color: $warning;
+    padding: 15px;
+}
+QWidget[role="panel"][variant="quiet"] {
+    border: 3px solid $light;
+    border-radius: 10px;
+    padding: 15px;
+}
+
+QLabel[role="title"] {
+    font-family: "$decorative";
+    font-size: ${size_xlarge}px;
+    color: $highlight;
+    background: transparent;
+    border: none;
+}
+QLabel[role="title"][variant="warning"] {
+    color: $warning;
+}
+QLabel[role="subtitle"] {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $text;
+    background: transparent;
+    border: none;
+}
+
+/* Lists */
+QLabel[role="counter"] {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $text;
+    padding: 10px;
+}
+QLabel[role="empty"] {
+    font-family: "$decorative";
+    font-size: ${size_large}px;
+    color: $accent;
+    padding: 20px;
+    background: $dark;
+    border: 2px solid $light;
+    border-radius: 8px;
+}
+QListView[role="packages"] {
+    border: none;
+    background: transparent;
+}
+QListView[role="packages"] QScrollBar:vertical {
+    width: 12px;
+    background: transparent;
+}
+QListView[role="packages"] QScrollBar::handle:vertical {
+    background: rgba(124, 255, 186, 0.3);
+    border-radius: 6px;
+    min-height: 30px;
+}
+QListView[role="packages"][variant="warning"] QScrollBar::handle:vertical {
+    background: rgba(255, 107, 107, 0.3);
+}
+
+/* Controls */
+QLineEdit[role="search"] {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $text;
+    background: $medium;
+    border: 3px solid $light;
+    border-radius: 8px;
+    padding: 8px 15px;
+    min-height: 25px;
+}
+QLineEdit[role="search"]:focus {
+    border-color: $highlight;
+    background: $dark;
+}
+QPushButton[role="action"] {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $text;
+    background: $medium;
+    border: 3px solid $light;
+    border-radius: 8px;
+    padding: 8px 25px;
+    min-width: 120px;
+    min-height: 25px;
+}
+QPushButton[role="action"]:hover {
+    background: $light;
+    border-color: $highlight;
+    color: $highlight;
+}
+
+QPushButton#theme_button {
+    font-size: ${size_xlarge}px;
+    background: $medium;
+    border: 2px solid $light;
+    border-radius: 20px;
+    padding: 8px;
+    min-width: 40px;
+    max-width: 40px;
+}
+QPushButton#theme_button:hover {
+    background: $light;
+    border-color: $highlight;
+}
+
+/* Splash page */
+QWidget#splash_page {
+    background-color: $background;
+}
+QWidget#splash_art {
+    background: $dark;
+    border: 4px solid $highlight;
+    border-radius: 8px;
+}
+QWidget#splash_art QLabel {
+    font-family: monospace;
+    font-size: 20px;
+    padding: 0;
+    margin: 0;
+    background: transparent;
+    border: none;
+}
+QLabel#splash_title {
+    font-family: "$decorative";
+    font-size: 32px;
+    color: $highlight;
+    padding: 15px 25px;
+    background-color: $dark;
+    border: 4px solid $highlight;
+    border-radius: 8px;
+}
+QLabel#splash_frame {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $accent;
+    margin: 5px;
+}
+QPushButton#start_button {
+    font-family: "$decorative";
+    font-size: ${size_large}px;
+    color: $text;
+    background: $medium;
+    border: 4px solid $highlight;
+    border-radius: 6px;
+    padding: 8px 16px;
+}
+QPushButton#start_button:hover {
+    background: $light;
+    border-color: $accent;
+    color: $highlight;
+}
+QPushButton#start_button:disabled {
+    color: $accent;
+    border-color: $light;
+}
+QProgressBar#splash_progress {
+    background: $dark;
+    border: 2px solid $light;
+    border-radius: 4px;
+}
+QProgressBar#splash_progress::chunk {
+    background: $highlight;
+}
+QLabel#splash_status {
+    font-family: "$decorative";
+    font-size: ${size_small}px;
+    color: $text;
+}
+QPushButton#start_button:pressed {
+    background: $highlight;
+    color: $dark;
+    border-color: $accent;
+}
+
+/* Removal progress popup */
+QWidget#delete_dialog {
+    background: $dark;
+    border: 4px solid $warning;
+    border-radius: 15px;
+}
+QWidget#delete_dialog QLabel {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $warning;
+    padding: 5px;
+    margin: 5px;
+    background: $dark;
+    border: 2px solid $light;
+    border-radius: 5px;
+}
+
+/* Install dialog */
+QDialog#install_dialog {
+    background: $dark;
+    border: 4px solid $highlight;
+    border-radius: 20px;
+}
+QLabel#install_logo {
+    font-size: 60px;
+    padding: 15px;
+    margin: 10px;
+    background: transparent;
+}
+QLabel#install_title {
+    font-family: "$decorative";
+    font-size: ${size_large}px;
+    color: $highlight;
+    padding: 15px;
+    margin: 5px;
+    background: $dark;
+    border: 2px solid $light;
+    border-radius: 10px;
+}
+QProgressBar#install_progress {
+    border: 3px solid $light;
+    border-radius: 10px;
+    background: $medium;
+    text-align: center;
+    font-size: ${size_medium}px;
+    font-family: "$decorative";
+    color: $text;
+    padding: 2px;
+}
+QProgressBar#install_progress::chunk {
+    background: $highlight;
+    border-radius: 7px;
+}
+QListWidget#install_queue {
+    font-family: "$decorative";
+    font-size: ${size_small}px;
+    color: $text;
+    background: $medium;
+    border: 2px solid $light;
+    border-radius: 10px;
+    padding: 5px;
+}
+QListView#install_log {
+    font-family: monospace;
+    font-size: ${size_small}px;
+    color: $text;
+    background: $dark;
+    border: 2px solid $light;
+    border-radius: 10px;
+    padding: 5px;
+}
+QLabel#install_log_path {
+    font-size: ${size_small}px;
+    color: $text;
+    background: transparent;
+}
+QPushButton#install_first_error {
+    font-family: "$decorative";
+    font-size: ${size_small}px;
+    color: $warning;
+    background: $dark;
+    border: 2px solid $warning;
+    border-radius: 8px;
+    padding: 6px 20px;
+}
+QPushButton#install_first_error:hover {
+    background: $warning;
+    color: $dark;
+}
+QPushButton#install_done {
+    font-family: "$decorative";
+    font-size: ${size_large}px;
+    color: $highlight;
+    background: $dark;
+    border: 3px solid $highlight;
+    border-radius: 10px;
+    padding: 10px 30px;
+    min-width: 200px;
+}
+QPushButton#install_done:hover {
+    background: $highlight;
+    color: $dark;
+}
+
+/* Password dialog */
+QDialog#password_dialog QLabel {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    color: $highlight;
+}
+QDialog#password_dialog QLineEdit {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    padding: 8px;
+    border: 2px solid $light;
+    border-radius: 6px;
+    background: $medium;
+}
+QDialog#password_dialog QPushButton {
+    font-family: "$decorative";
+    font-size: ${size_medium}px;
+    padding: 8px 20px;
+    border: 2px solid $light;
+    border-radius: 6px;
+    background: $medium;
+}
+QDialog#password_dialog QPushButton:hover {
+    background: $highlight;
+    color: $dark;
+}
+""")
@@ -0,0 +1,98 @@
+"""
+Theme Engine Module
+Compiles and applies the application stylesheet per theme.
+
+Each theme's stylesheet is compiled once from
+:data:`utils.themes.stylesheet.APP_STYLESHEET` and cached, so switching
+themes is a single ``setStyleSheet`` call on the application that Qt
+resolves in one polish pass, instead of every widget re-parsing its own
+stylesheet.
+"""
+
+import time
+from typing import Dict, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+
+from utils.logger import Logger
+from utils.themes.colors import ThemeColors
+from utils.themes.fonts import Fonts
+from utils.themes.stylesheet import APP_STYLESHEET
+
+logger = Logger.get_logger(__name__)
+
+
+class ThemeEngine(QObject):
+    """
+    Applies themes to the whole application.
+
+    Use :meth:`instance` to get the shared engine.
+
+    Attributes:
+        THEMES (Dict[str, Dict[str, str]]): Colour tables by theme name
+        current (Optional[str]): Name of the applied theme
+        last_apply_ms (float): Duration of the last theme switch
+    """
+
+    themeChanged = pyqtSignal(str)  # theme name
+
+    THEMES = {
+        "dark": ThemeColors.DARK_THEME,
+        "light": ThemeColors.LIGHT_THEME,
+    }
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "ThemeEngine":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.current: Optional[str] = None
+        self.last_apply_ms = 0.0
+        self._compiled: Dict[str, str] = {}
+
+    def compile(self, name: str) -> str:
+        """
+        Get the stylesheet for a theme, compiling it on first use.
+
+        Args:
+            name (str): Theme name, a key of ``THEMES``
+
+        Returns:
+            str: Application stylesheet for the theme
+        """
+        stylesheet = self._compiled.get(name)
+        if stylesheet is None:
+            values = dict(self.THEMES[name])
+            values.update(
+                decorative=Fonts.DECORATIVE,
+                size_small=Fonts.SMALL,
+                size_medium=Fonts.MEDIUM,
+                size_large=Fonts.LARGE,
+                size_xlarge=Fonts.XLARGE,
+            )
+            stylesheet = self._compiled[name] = APP_STYLESHEET.substitute(values)
+        return stylesheet
+
+    def apply(self, name: str) -> None:
+        """
+        Switch the application to a theme.
+
+        Args:
+            name (str): Theme name, a key of ``THEMES``
+        """
+        started = time.perf_counter()
+        ThemeColors.set_theme(is_dark=name == "dark")
+        stylesheet = self.compile(name)
+        app = QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(stylesheet)
+        self.current = name
+        self.last_apply_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Applied {name} theme in {self.last_apply_ms:.1f} ms")
+        self.themeChanged.emit(name)